@@ -0,0 +1,154 @@
+"""
+Бенчмарк построения последовательности 122333... из solution.py.
+
+Каждое измерение выполняется в отдельном процессе, чтобы пиковый объём
+резидентной памяти (RSS) относился только к нему. Последовательность
+пишется в os.devnull, а в режиме parallel — во временный файл, так как
+os.pwrite требует файл с произвольным доступом. Для режима parallel
+RSS указывается для самого большого из процессов. Результат выводится
+в JSON.
+
+Пример:
+    python benchmark.py --modes string stream --sizes 1000 10000
+    python benchmark.py --modes parallel --sizes 30000 --workers 1 2 4 8
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import solution
+
+STREAM = "stream"
+STRING = "string"
+PARALLEL = "parallel"
+MODES = (STREAM, STRING, PARALLEL)
+SIZES = (1000, 10000, 30000)
+WORKERS = (1, 2, 4, 8)
+CHILD = "--child"
+
+
+def run_parallel(n: int, chunk_size: int, workers: int) -> int:
+    """
+    Записывает последовательность во временный файл параллельно.
+
+    Параметры:
+        n (int): Последнее число последовательности.
+        chunk_size (int): Размер частей записи в байтах.
+        workers (int): Количество процессов.
+
+    Возвращает:
+        int: Количество записанных байт.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        return solution.write_n_first_elements_parallel(
+            n, os.path.join(directory, "output"), workers, chunk_size
+        )
+
+
+def run_child(mode: str, n: int, chunk_size: int, workers: int) -> dict:
+    """
+    Строит последовательность в текущем процессе и измеряет время.
+
+    Параметры:
+        mode (str): stream для потоковой записи, string для строки целиком,
+            parallel для параллельной записи в файл.
+        n (int): Последнее число последовательности.
+        chunk_size (int): Размер частей потоковой записи в байтах.
+        workers (int): Количество процессов для режима parallel.
+
+    Возвращает:
+        dict: Количество байт, время в секундах и пиковый RSS в КиБ.
+    """
+    started = time.perf_counter()
+    if mode == PARALLEL:
+        size = run_parallel(n, chunk_size, workers)
+    else:
+        with open(os.devnull, "wb") as file:
+            if mode == STREAM:
+                size = solution.write_n_first_elements(n, file, chunk_size)
+            else:
+                data = solution.get_n_first_elements(n).encode()
+                file.write(data)
+                size = len(data)
+    elapsed = time.perf_counter() - started
+    return {
+        "bytes": size,
+        "seconds": elapsed,
+        "max_rss_kib": max(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+        ),
+    }
+
+
+def measure(mode: str, n: int, chunk_size: int, workers: int) -> dict:
+    """
+    Измеряет построение последовательности в отдельном процессе.
+
+    Параметры:
+        mode (str): Режим построения.
+        n (int): Последнее число последовательности.
+        chunk_size (int): Размер частей потоковой записи в байтах.
+        workers (int): Количество процессов для режима parallel.
+
+    Возвращает:
+        dict: Пропускная способность в МБ/с и пиковый RSS в МиБ.
+    """
+    output = subprocess.run(
+        (
+            sys.executable,
+            __file__,
+            CHILD,
+            mode,
+            str(n),
+            str(chunk_size),
+            str(workers),
+        ),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    result = json.loads(output)
+    return {
+        "mode": mode,
+        "n": n,
+        "workers": workers,
+        "bytes": result["bytes"],
+        "seconds": round(result["seconds"], 3),
+        "throughput_mb_s": round(
+            result["bytes"] / result["seconds"] / 10**6, 1
+        ),
+        "peak_rss_mib": round(result["max_rss_kib"] / 1024, 1),
+    }
+
+
+def main() -> None:
+    """Разбирает аргументы и выводит результаты измерений."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=(STREAM,))
+    parser.add_argument("--sizes", nargs="+", type=int, default=SIZES)
+    parser.add_argument("--chunk-size", type=int, default=solution.CHUNK_SIZE)
+    parser.add_argument("--workers", nargs="+", type=int, default=WORKERS)
+    args = parser.parse_args()
+    results = [
+        measure(mode, n, args.chunk_size, workers)
+        for mode in args.modes
+        for n in args.sizes
+        for workers in (args.workers if mode == PARALLEL else (1,))
+    ]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == [CHILD]:
+        mode = sys.argv[2]
+        n, chunk_size, workers = map(int, sys.argv[3:6])
+        print(json.dumps(run_child(mode, n, chunk_size, workers)))
+    else:
+        main()
@@ -1,6 +1,371 @@
+import os
+import sys
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Iterator, Tuple, Union
+
+CHUNK_SIZE = 1 << 20
+TASKS_PER_WORKER = 4
+LOOKUP_STEP = 1 << 13
+
+
+def iter_chunks(
+    n: int, chunk_size: int = CHUNK_SIZE, first: int = 1
+) -> Iterator[bytes]:
+    """
+    Возвращает последовательность 122333... для чисел от first до n частями.
+
+    Короткие блоки склеиваются, длинные блоки (число i, повторённое i раз)
+    режутся, поэтому каждая часть не длиннее chunk_size байт, и расход
+    памяти не зависит от n.
+
+    Параметры:
+        n (int): Последнее число последовательности.
+        chunk_size (int): Максимальный размер части в байтах.
+        first (int): Первое число последовательности.
+
+    Возвращает:
+        Iterator[bytes]: Части последовательности в кодировке ASCII.
+    """
+    parts = []
+    size = 0
+    for number in range(first, n + 1):
+        digits = str(number).encode()
+        block_size = len(digits) * number
+        if size + block_size > chunk_size and parts:
+            yield b"".join(parts)
+            parts = []
+            size = 0
+        if block_size <= chunk_size:
+            parts.append(digits * number)
+            size += block_size
+            continue
+        repeats = max(chunk_size // len(digits), 1)
+        piece = digits * repeats
+        full_pieces, rest = divmod(number, repeats)
+        for _ in range(full_pieces):
+            yield piece
+        if rest:
+            parts.append(digits * rest)
+            size = len(digits) * rest
+    if parts:
+        yield b"".join(parts)
+
+
+def get_offset(number: int) -> int:
+    """
+    Возвращает позицию, с которой в последовательности начинается число.
+
+    Длины блоков суммируются по группам чисел с одинаковым количеством
+    цифр по формуле арифметической прогрессии, поэтому время не зависит
+    от величины числа.
+
+    Параметры:
+        number (int): Число, блок которого ищется.
+
+    Возвращает:
+        int: Количество символов в блоках чисел от 1 до number - 1.
+    """
+    offset = 0
+    digits = 1
+    low = 1
+    while low < number:
+        high = min(low * 10, number) - 1
+        offset += digits * (low + high) * (high - low + 1) // 2
+        digits += 1
+        low *= 10
+    return offset
+
+
+def get_block_part(number: int, start: int, size: int) -> str:
+    """
+    Возвращает часть блока числа, не строя блок целиком.
+
+    Параметры:
+        number (int): Число, повторённое в блоке number раз.
+        start (int): Позиция начала части внутри блока.
+        size (int): Длина части.
+
+    Возвращает:
+        str: Часть блока.
+    """
+    digits = str(number)
+    shift = start % len(digits)
+    repeats = (shift + size) // len(digits) + 1
+    end = shift + size
+    return (digits * repeats)[shift:end]
+
+
+class NFirstElements:
+    """
+    Последовательность 122333... для чисел от 1 до n с произвольным доступом.
+
+    Поддерживает len(), получение символа по индексу и срезы. Строка
+    целиком не строится: блок, содержащий позицию, находится двоичным
+    поиском по позициям начала блоков, которые вычисляются по формуле.
+    len() ограничена sys.maxsize, длину больших последовательностей
+    следует брать из атрибута length.
+
+    Атрибуты:
+        n (int): Последнее число последовательности.
+        length (int): Длина последовательности.
+        group_offsets (list): Позиции начала групп чисел с одинаковым
+            количеством цифр.
+    """
+
+    def __init__(self, n: int):
+        """
+        Создает последовательность.
+
+        Параметры:
+            n (int): Последнее число последовательности.
+        """
+        self.n = n
+        self.length = get_offset(n + 1)
+        self.group_offsets = [
+            get_offset(10**group) for group in range(len(str(max(n, 1))))
+        ]
+
+    def __len__(self) -> int:
+        """Возвращает длину последовательности."""
+        return self.length
+
+    def __iter__(self) -> Iterator[str]:
+        """Перебирает символы последовательности потоково."""
+        for chunk in iter_chunks(self.n):
+            yield from chunk.decode()
+
+    def __getitem__(self, index: Union[int, slice]) -> str:
+        """
+        Возвращает символ по индексу или часть последовательности по срезу.
+
+        Параметры:
+            index (Union[int, slice]): Индекс или срез, как у строки.
+
+        Возвращает:
+            str: Символ или часть последовательности.
+
+        Вызывает ошибку:
+            IndexError: Если индекс вне последовательности.
+            TypeError: Если индекс не целое число и не срез.
+        """
+        if isinstance(index, slice):
+            return self.get_slice(index)
+        if not isinstance(index, int):
+            raise TypeError(
+                f"Индекс должен быть int или slice, а не "
+                f"{type(index).__name__}."
+            )
+        position = index + self.length if index < 0 else index
+        if not 0 <= position < self.length:
+            raise IndexError("Индекс вне последовательности.")
+        number, start = self.locate(position)
+        digits = str(number)
+        return digits[start % len(digits)]
+
+    def locate(self, position: int) -> Tuple[int, int]:
+        """
+        Находит число, в блок которого входит позиция.
+
+        Группа чисел с одинаковым количеством цифр выбирается двоичным
+        поиском по позициям начала групп, число внутри группы — двоичным
+        поиском по позициям начала блоков.
+
+        Параметры:
+            position (int): Позиция в последовательности.
+
+        Возвращает:
+            Tuple[int, int]: Число и позиция внутри его блока.
+        """
+        group = bisect_right(self.group_offsets, position) - 1
+        group_offset = self.group_offsets[group]
+        digits = group + 1
+        first = 10**group
+        low, high = first, min(first * 10 - 1, self.n)
+        while low < high:
+            middle = (low + high + 1) // 2
+            offset = digits * (first + middle - 1) * (middle - first) // 2
+            if group_offset + offset <= position:
+                low = middle
+            else:
+                high = middle - 1
+        offset = digits * (first + low - 1) * (low - first) // 2
+        return low, position - group_offset - offset
+
+    def get_window(self, start: int, stop: int) -> str:
+        """
+        Возвращает непрерывную часть последовательности.
+
+        Параметры:
+            start (int): Позиция начала части.
+            stop (int): Позиция после конца части.
+
+        Возвращает:
+            str: Символы с позиций от start до stop - 1.
+        """
+        if start >= stop:
+            return ""
+        number, block_start = self.locate(start)
+        remaining = stop - start
+        parts = []
+        while remaining > 0:
+            size = min(remaining, len(str(number)) * number - block_start)
+            parts.append(get_block_part(number, block_start, size))
+            remaining -= size
+            number += 1
+            block_start = 0
+        return "".join(parts)
+
+    def get_slice(self, index: slice) -> str:
+        """
+        Возвращает часть последовательности по срезу.
+
+        Для шага не больше LOOKUP_STEP строится только непрерывный участок
+        между крайними позициями среза, из которого затем берётся каждый
+        step-й символ. При большем шаге участок занимал бы step байт на
+        каждый символ результата, поэтому символы находятся по отдельности
+        двоичным поиском, за O(log n) каждый.
+
+        Параметры:
+            index (slice): Срез, как у строки.
+
+        Возвращает:
+            str: Часть последовательности.
+        """
+        start, stop, step = index.indices(self.length)
+        positions = range(start, stop, step)
+        if not positions:
+            return ""
+        if abs(step) > LOOKUP_STEP:
+            return "".join(self[position] for position in positions)
+        low = min(positions[0], positions[-1])
+        high = max(positions[0], positions[-1])
+        window = self.get_window(low, high + 1)
+        first = start - low
+        return window if step == 1 else window[first::step]
+
+
+def write_n_first_elements(
+    n: int, file: BinaryIO = None, chunk_size: int = CHUNK_SIZE
+) -> int:
+    """
+    Записывает последовательность для чисел от 1 до n в двоичный файл.
+
+    Параметры:
+        n (int): Последнее число последовательности.
+        file (BinaryIO): Двоичный файл, по умолчанию стандартный вывод.
+        chunk_size (int): Размер записываемых частей в байтах.
+
+    Возвращает:
+        int: Количество записанных байт.
+    """
+    if file is None:
+        file = sys.stdout.buffer
+    written = 0
+    for chunk in iter_chunks(n, chunk_size):
+        file.write(chunk)
+        written += len(chunk)
+    return written
+
+
+def write_range(path: str, first: int, last: int, chunk_size: int) -> int:
+    """
+    Записывает блоки чисел от first до last на их места в файле.
+
+    Выполняется в процессах пула write_n_first_elements_parallel.
+
+    Параметры:
+        path (str): Путь к файлу нужного размера.
+        first (int): Первое число диапазона.
+        last (int): Последнее число диапазона.
+        chunk_size (int): Размер записываемых частей в байтах.
+
+    Возвращает:
+        int: Количество записанных байт.
+    """
+    start = offset = get_offset(first)
+    descriptor = os.open(path, os.O_WRONLY)
+    try:
+        for chunk in iter_chunks(last, chunk_size, first):
+            os.pwrite(descriptor, chunk, offset)
+            offset += len(chunk)
+    finally:
+        os.close(descriptor)
+    return offset - start
+
+
+def get_ranges(sequence: NFirstElements, count: int) -> list:
+    """
+    Делит числа последовательности на диапазоны примерно равной длины.
+
+    Границы диапазонов проходят по границам блоков, поэтому блок одного
+    числа целиком попадает в один диапазон.
+
+    Параметры:
+        sequence (NFirstElements): Последовательность.
+        count (int): Желаемое количество диапазонов.
+
+    Возвращает:
+        list: Пары из первого и последнего числа диапазона.
+    """
+    firsts = sorted(
+        {1}
+        | {
+            sequence.locate(sequence.length * index // count)[0] + 1
+            for index in range(1, count)
+        }
+    )
+    lasts = [first - 1 for first in firsts[1:]] + [sequence.n]
+    return [
+        (first, last) for first, last in zip(firsts, lasts) if first <= last
+    ]
+
+
+def write_n_first_elements_parallel(
+    n: int, path: str, workers: int = None, chunk_size: int = CHUNK_SIZE
+) -> int:
+    """
+    Записывает последовательность для чисел от 1 до n в файл параллельно.
+
+    Числа делятся на диапазоны, позиция каждого диапазона в файле
+    вычисляется заранее, и процессы пула записывают свои диапазоны через
+    os.pwrite, поэтому файл совпадает с результатом
+    write_n_first_elements побайтно. Диапазонов больше, чем процессов,
+    чтобы процессы загружались равномерно.
+
+    Параметры:
+        n (int): Последнее число последовательности.
+        path (str): Путь к файлу, файл перезаписывается.
+        workers (int): Количество процессов, по умолчанию по числу ядер.
+        chunk_size (int): Размер записываемых частей в байтах.
+
+    Возвращает:
+        int: Количество записанных байт.
+    """
+    workers = workers or os.cpu_count()
+    sequence = NFirstElements(n)
+    with open(path, "wb") as file:
+        file.truncate(sequence.length)
+    if sequence.length == 0:
+        return 0
+    ranges = get_ranges(sequence, workers * TASKS_PER_WORKER)
+    if workers == 1:
+        return sum(
+            write_range(path, first, last, chunk_size)
+            for first, last in ranges
+        )
+    with ProcessPoolExecutor(workers) as executor:
+        futures = [
+            executor.submit(write_range, path, first, last, chunk_size)
+            for first, last in ranges
+        ]
+        return sum(future.result() for future in futures)
+
+
 def get_n_first_elements(n: int) -> str:
-    return "".join([str(_) * _ for _ in range(1, n + 1)])
+    return b"".join(iter_chunks(n)).decode()
 
 
 if __name__ == "__main__":
-    print(get_n_first_elements(int(input())))
+    write_n_first_elements(int(input()))
+    sys.stdout.buffer.write(b"\n")
@@ -8,3 +8,11 @@ class ApiConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "api"
+
+    def ready(self):
+        """
+        Импортирует сигналы при готовности приложения.
+
+        Этот метод вызывается, когда приложение Django готово к использованию.
+        """
+        import api.signals
@@ -0,0 +1,331 @@
+"""
+Модуль с асинхронными представлениями приложения api.
+
+Представления повторяют API синхронных представлений из api.views и
+подключаются вместо них при ASYNC_API_VIEWS=True (по умолчанию при запуске
+через config.asgi).
+"""
+
+from api.mixins import AsyncCatalogCacheMixin, AsyncViewSetMixin
+from api.pagination import ProductSearchPagination
+from api.serializers import (
+    CartBatchOperationSerializer,
+    CartItemSerializer,
+    CartSerializer,
+    ShortCartItemSerializer,
+)
+from api.snapshots import aget_category_tree
+from api.views import CartViewSet, ProductCategoryViewSet, ProductViewSet
+from asgiref.sync import sync_to_async
+from core.constants import ViewsCfg
+from django.db import transaction
+from django.http import HttpResponseBase
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework.decorators import action
+from rest_framework.request import Request
+from rest_framework.response import Response
+from store.models import Cart, CartItem, Product
+
+
+class AsyncProductCategoryViewSet(
+    AsyncCatalogCacheMixin, ProductCategoryViewSet
+):
+    """
+    Асинхронный вариант ProductCategoryViewSet.
+
+    Ответ из кэша и ответ из снимка дерева категорий формируются без
+    выделения потока.
+    """
+
+    async def aget_catalog_response(
+        self, request: Request, digest: str, *args, **kwargs
+    ) -> HttpResponseBase:
+        """
+        Асинхронно возвращает ответ со списком или деревом категорий.
+
+        Параметры:
+            request (Request): Входящий запрос.
+            digest (str): Хэш, идентифицирующий представление ответа.
+            *args: Список аргументов переменной длины.
+            **kwargs: Произвольные именованные аргументы.
+
+        Возвращает:
+            HttpResponseBase: Ответ со списком или деревом категорий.
+        """
+        if self.is_snapshot_request(request):
+            return self.get_snapshot_response(
+                request, await aget_category_tree()
+            )
+        return await super().aget_catalog_response(
+            request, digest, *args, **kwargs
+        )
+
+    @action(
+        detail=False,
+        methods=ViewsCfg.TREE_HTTP_METHODS,
+        pagination_class=None,
+    )
+    async def tree(self, request: Request) -> HttpResponseBase:
+        """
+        Возвращает всё дерево категорий с подкатегориями без пагинации.
+
+        Возвращает:
+            HttpResponseBase: Готовое JSON-представление дерева категорий.
+        """
+        return await self.list(request)
+
+
+class AsyncProductViewSet(AsyncCatalogCacheMixin, ProductViewSet):
+    """
+    Асинхронный вариант ProductViewSet.
+
+    Ответ из кэша формируется без выделения потока, при промахе кэша
+    страница продуктов строится в потоке.
+    """
+
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter(
+                ViewsCfg.SEARCH_QUERY_PARAM,
+                openapi.IN_QUERY,
+                description=ViewsCfg.SEARCH_QUERY_DESCRIPTION,
+                type=openapi.TYPE_STRING,
+                required=True,
+            )
+        ]
+    )
+    @action(
+        detail=False,
+        methods=ViewsCfg.SEARCH_HTTP_METHODS,
+        pagination_class=ProductSearchPagination,
+        filter_backends=(),
+    )
+    async def search(self, request: Request) -> Response:
+        """
+        Возвращает продукты, найденные по словам из параметра q.
+
+        Возвращает:
+            Response: Страница найденных продуктов.
+        """
+        self.get_search_query()
+        return await self.list(request)
+
+
+class AsyncCartViewSet(AsyncViewSetMixin, CartViewSet):
+    """
+    Асинхронный вариант CartViewSet.
+
+    Корзина и продукты читаются асинхронным ORM. Операции, которым нужны
+    транзакции и блокировки строк (добавление, удаление, обновление товара
+    и пакетное изменение), выполняются синхронным кодом в потоке.
+    """
+
+    async def aget_queryset(self) -> Cart:
+        """
+        Асинхронно возвращает корзину текущего пользователя.
+
+        Если корзина не существует, создает новую.
+
+        Возвращает:
+            Cart: Корзина текущего пользователя.
+        """
+        return (await Cart.objects.aget_or_create(user=self.request.user))[0]
+
+    async def aget_cart_contents(self) -> Cart:
+        """
+        Асинхронно возвращает корзину с содержимым и итогами.
+
+        Содержимое загружается вместе с корзиной, поэтому сериализация
+        корзины не выполняет запросов к базе данных. Если корзина не
+        существует, она создается и загружается повторно.
+
+        Возвращает:
+            Cart: Корзина текущего пользователя.
+        """
+        carts = Cart.objects.with_contents()
+        try:
+            return await carts.aget(user=self.request.user)
+        except Cart.DoesNotExist:
+            await self.aget_queryset()
+            return await carts.aget(user=self.request.user)
+
+    async def aget_cart_response(self) -> Response:
+        """
+        Возвращает ответ с содержимым корзины текущего пользователя.
+
+        Возвращает:
+            Response: Сериализованное содержимое корзины.
+        """
+        return Response(CartSerializer(await self.aget_cart_contents()).data)
+
+    @staticmethod
+    async def aget_product(product_title: str) -> Product:
+        """
+        Асинхронно возвращает продукт по его наименованию.
+
+        Параметры:
+            product_title (str): Наименование продукта.
+
+        Возвращает:
+            Product: Объект продукта.
+
+        Вызывает ошибку:
+            ValidationError: Если продукт с указанным наименованием не
+        существует.
+        """
+        try:
+            return await Product.objects.aget(title=product_title)
+        except Product.DoesNotExist:
+            raise CartViewSet.get_product_error(product_title)
+
+    def remove_cart_item(self, product_title: str) -> Cart:
+        """
+        Удаляет товар из корзины и загружает корзину в одной транзакции.
+
+        Параметры:
+            product_title (str): Наименование продукта.
+
+        Возвращает:
+            Cart: Корзина текущего пользователя с содержимым и итогами.
+
+        Вызывает ошибку:
+            ValidationError: Если продукта или элемента корзины не
+        существует.
+        """
+        cart = self.get_queryset()
+        product = self.get_product(product_title)
+        with transaction.atomic():
+            deleted, _ = CartItem.objects.filter(
+                cart=cart, product=product
+            ).delete()
+            if not deleted:
+                raise self.get_cart_item_error(product)
+            return self.get_cart_contents()
+
+    def update_cart_item(self, product_title: str, quantity) -> Cart:
+        """
+        Обновляет количество товара и загружает корзину в одной транзакции.
+
+        Параметры:
+            product_title (str): Наименование продукта.
+            quantity: Новое количество продукта.
+
+        Возвращает:
+            Cart: Корзина текущего пользователя с содержимым и итогами.
+
+        Вызывает ошибку:
+            ValidationError: Если продукта или элемента корзины не
+        существует.
+        """
+        cart = self.get_queryset()
+        product = self.get_product(product_title)
+        with transaction.atomic():
+            updated = CartItem.objects.filter(
+                cart=cart, product=product
+            ).update(quantity=quantity)
+            if not updated:
+                raise self.get_cart_item_error(product)
+            return self.get_cart_contents()
+
+    async def list(self, request: Request) -> Response:
+        """
+        Возвращает содержимое корзины текущего пользователя.
+
+        Возвращает:
+            Response: Сериализованное содержимое корзины.
+        """
+        return await self.aget_cart_response()
+
+    @swagger_auto_schema(
+        request_body=CartItemSerializer,
+    )
+    @action(detail=False, methods=ViewsCfg.ADD_ITEM_HTTP_METHODS)
+    async def add_item(self, request: Request) -> Response:
+        """
+        Добавляет товар в корзину текущего пользователя.
+
+        Возвращает:
+            Response: Сериализованное содержимое корзины после добавления
+        товара.
+        """
+        product = await self.aget_product(request.data.get(ViewsCfg.PRODUCT))
+        cart = await self.aget_queryset()
+        await sync_to_async(CartItem.objects.add_quantity)(
+            cart=cart,
+            product=product,
+            quantity=int(
+                request.data.get(
+                    ViewsCfg.QUANTITY, ViewsCfg.QUANTITY_DEFAULT_VALUE
+                )
+            ),
+        )
+        return await self.aget_cart_response()
+
+    @swagger_auto_schema(
+        request_body=ShortCartItemSerializer,
+    )
+    @action(detail=False, methods=ViewsCfg.REMOVE_ITEM_HTTP_METHODS)
+    async def remove_item(self, request: Request) -> Response:
+        """
+        Удаляет товар из корзины текущего пользователя.
+
+        Возвращает:
+            Response: Сериализованное содержимое корзины после удаления товара.
+        """
+        cart = await sync_to_async(self.remove_cart_item)(
+            request.data.get(ViewsCfg.PRODUCT)
+        )
+        return Response(CartSerializer(cart).data)
+
+    @swagger_auto_schema(
+        request_body=CartItemSerializer,
+    )
+    @action(detail=False, methods=ViewsCfg.UPDATE_ITEM_HTTP_METHODS)
+    async def update_item(self, request: Request) -> Response:
+        """
+        Обновляет количество товара в корзине текущего пользователя.
+
+        Возвращает:
+            Response: Сериализованное содержимое корзины после обновления
+        количества товара.
+        """
+        cart = await sync_to_async(self.update_cart_item)(
+            request.data.get(ViewsCfg.PRODUCT),
+            request.data.get(ViewsCfg.QUANTITY),
+        )
+        return Response(CartSerializer(cart).data)
+
+    @swagger_auto_schema(
+        request_body=CartBatchOperationSerializer(many=True),
+    )
+    @action(detail=False, methods=ViewsCfg.BATCH_HTTP_METHODS)
+    async def batch(self, request: Request) -> Response:
+        """
+        Применяет список операций к корзине текущего пользователя.
+
+        Возвращает:
+            Response: Сериализованное содержимое корзины после применения
+        всех операций.
+        """
+        serializer = CartBatchOperationSerializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=ViewsCfg.BATCH_MAX_OPERATIONS,
+        )
+        serializer.is_valid(raise_exception=True)
+        await sync_to_async(self.apply_batch)(serializer.validated_data)
+        return await self.aget_cart_response()
+
+    @action(detail=False, methods=ViewsCfg.CLEAR_CART_HTTP_METHODS)
+    async def clear_cart(self, request: Request) -> Response:
+        """
+        Полностью очищает корзину текущего пользователя.
+
+        Возвращает:
+            Response: Сериализованное содержимое пустой корзины.
+        """
+        cart = await self.aget_queryset()
+        await cart.items.all().adelete()
+        return await self.aget_cart_response()
@@ -0,0 +1,94 @@
+"""Модуль с классами аутентификации приложения api."""
+
+from hashlib import sha256
+
+from core.constants import AuthenticationCfg
+from core.metrics import record_cache
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.authentication import TokenAuthentication
+
+
+def get_token_cache():
+    """
+    Возвращает бэкенд кэша, используемый для токенов.
+
+    Возвращает:
+        BaseCache: Бэкенд кэша из настройки AUTH_TOKEN_CACHE_ALIAS.
+    """
+    return caches[settings.AUTH_TOKEN_CACHE_ALIAS]
+
+
+def get_token_cache_key(key: str) -> str:
+    """
+    Возвращает ключ кэша для токена.
+
+    В ключе используется хэш токена, чтобы сам токен не хранился в
+    открытом виде в ключах общего кэша.
+
+    Параметры:
+        key (str): Токен.
+
+    Возвращает:
+        str: Ключ кэша.
+    """
+    return AuthenticationCfg.TOKEN_CACHE_KEY.format(
+        digest=sha256(key.encode()).hexdigest()
+    )
+
+
+def revoke_cached_token(key: str) -> None:
+    """
+    Удаляет токен из кэша аутентификации.
+
+    Вместо удаления в кэш на короткое время записывается отметка об отзыве.
+    Она не даёт запросу, который прочитал токен из базы данных до его
+    удаления, снова положить токен в кэш, поэтому после выхода пользователя
+    токен сразу перестаёт действовать.
+
+    Параметры:
+        key (str): Токен.
+    """
+    get_token_cache().set(
+        get_token_cache_key(key),
+        AuthenticationCfg.REVOKED,
+        AuthenticationCfg.REVOKED_TIMEOUT,
+    )
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Аутентификация по токену с кэшированием пользователя.
+
+    Заменяет TokenAuthentication: пара (пользователь, токен) хранится в
+    кэше AUTH_TOKEN_CACHE_ALIAS (локальная память с вытеснением LRU по
+    умолчанию или общий кэш в production) не дольше
+    AUTH_TOKEN_CACHE_TIMEOUT секунд. Запись отзывается сигналами при
+    изменении или удалении токена или пользователя.
+    """
+
+    def authenticate_credentials(self, key: str) -> tuple:
+        """
+        Возвращает пользователя и токен из кэша или из базы данных.
+
+        Параметры:
+            key (str): Токен из заголовка Authorization.
+
+        Возвращает:
+            tuple: Пользователь и токен.
+
+        Вызывает ошибку:
+            AuthenticationFailed: Если токен недействителен или пользователь
+        неактивен.
+        """
+        cache = get_token_cache()
+        cache_key = get_token_cache_key(key)
+        cached = cache.get(cache_key)
+        record_cache(cached not in (None, AuthenticationCfg.REVOKED))
+        if cached == AuthenticationCfg.REVOKED:
+            return super().authenticate_credentials(key)
+        if cached is not None:
+            return cached
+        credentials = super().authenticate_credentials(key)
+        cache.add(cache_key, credentials, settings.AUTH_TOKEN_CACHE_TIMEOUT)
+        return credentials
@@ -0,0 +1,160 @@
+"""Фильтры для представлений приложения api."""
+
+from decimal import Decimal, InvalidOperation
+
+from core.constants import FiltersCfg
+from django.db.models import QuerySet
+from rest_framework import filters
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+
+
+class ProductFilterBackend(filters.BaseFilterBackend):
+    """
+    Фильтр продуктов по категории, подкатегории и диапазону стоимости.
+
+    Параметры запроса:
+    - category: slug категории продуктов;
+    - subcategory: slug подкатегории продуктов;
+    - price_min: минимальная стоимость продукта;
+    - price_max: максимальная стоимость продукта.
+
+    Каждому сочетанию фильтра и сортировки соответствует составной индекс
+    модели Product.
+    """
+
+    lookups = (
+        (FiltersCfg.CATEGORY, FiltersCfg.CATEGORY_LOOKUP),
+        (FiltersCfg.SUBCATEGORY, FiltersCfg.SUBCATEGORY_LOOKUP),
+    )
+    price_lookups = (
+        (FiltersCfg.PRICE_MIN, FiltersCfg.PRICE_MIN_LOOKUP),
+        (FiltersCfg.PRICE_MAX, FiltersCfg.PRICE_MAX_LOOKUP),
+    )
+
+    def filter_queryset(
+        self, request: Request, queryset: QuerySet, view
+    ) -> QuerySet:
+        """
+        Фильтрует продукты по параметрам запроса.
+
+        Параметры:
+            request (Request): Входящий запрос.
+            queryset (QuerySet): Продукты для фильтрации.
+            view (APIView): Представление, выполняющее запрос.
+
+        Возвращает:
+            QuerySet: Отфильтрованные продукты.
+
+        Вызывает ошибку:
+            ValidationError: Если стоимость указана некорректно.
+        """
+        conditions = {}
+        for param, lookup in self.lookups:
+            value = request.query_params.get(param)
+            if value:
+                conditions[lookup] = value
+        for param, lookup in self.price_lookups:
+            value = request.query_params.get(param)
+            if value:
+                conditions[lookup] = self.parse_price(param, value)
+        return queryset.filter(**conditions)
+
+    @staticmethod
+    def parse_price(param: str, value: str) -> Decimal:
+        """
+        Преобразует стоимость из параметра запроса в Decimal.
+
+        Параметры:
+            param (str): Название параметра запроса.
+            value (str): Значение параметра запроса.
+
+        Возвращает:
+            Decimal: Стоимость.
+
+        Вызывает ошибку:
+            ValidationError: Если стоимость указана некорректно.
+        """
+        try:
+            price = Decimal(value)
+        except InvalidOperation:
+            price = None
+        if price is None or not price.is_finite():
+            raise ValidationError(
+                {param: FiltersCfg.INVALID_PRICE_ERROR.format(price=value)}
+            )
+        return price
+
+    def get_schema_operation_parameters(self, view) -> list:
+        """
+        Возвращает параметры запроса для документации API.
+
+        Параметры:
+            view (APIView): Представление с фильтром.
+
+        Возвращает:
+            list: Параметры фильтра.
+        """
+        return [
+            {
+                "name": name,
+                "required": False,
+                "in": "query",
+                "description": description,
+                "schema": {"type": schema_type},
+            }
+            for name, description, schema_type in (
+                (
+                    FiltersCfg.CATEGORY,
+                    FiltersCfg.CATEGORY_DESCRIPTION,
+                    "string",
+                ),
+                (
+                    FiltersCfg.SUBCATEGORY,
+                    FiltersCfg.SUBCATEGORY_DESCRIPTION,
+                    "string",
+                ),
+                (
+                    FiltersCfg.PRICE_MIN,
+                    FiltersCfg.PRICE_MIN_DESCRIPTION,
+                    "number",
+                ),
+                (
+                    FiltersCfg.PRICE_MAX,
+                    FiltersCfg.PRICE_MAX_DESCRIPTION,
+                    "number",
+                ),
+            )
+        ]
+
+
+class StableOrderingFilter(filters.OrderingFilter):
+    """
+    Сортировка по параметру запроса ordering со стабильным порядком.
+
+    К выбранной сортировке добавляется первичный ключ в том же направлении,
+    поэтому порядок продуктов с одинаковым значением поля не меняется между
+    страницами и полностью обеспечивается составным индексом.
+    """
+
+    ordering_description = FiltersCfg.ORDERING_DESCRIPTION
+
+    def get_ordering(self, request: Request, queryset: QuerySet, view):
+        """
+        Возвращает сортировку из параметра запроса с первичным ключом.
+
+        Параметры:
+            request (Request): Входящий запрос.
+            queryset (QuerySet): Сортируемые объекты.
+            view (APIView): Представление, выполняющее запрос.
+
+        Возвращает:
+            list | None: Поля сортировки или None, если сортировка не задана.
+        """
+        ordering = super().get_ordering(request, queryset, view)
+        if not ordering:
+            return ordering
+        tiebreaker = FiltersCfg.ORDERING_TIEBREAKER
+        if ordering[0].startswith(FiltersCfg.DESCENDING):
+            tiebreaker = FiltersCfg.DESCENDING + tiebreaker
+        return [*ordering, tiebreaker]
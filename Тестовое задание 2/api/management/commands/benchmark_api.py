@@ -0,0 +1,621 @@
+"""Команда для нагрузочного тестирования API."""
+
+import json
+import math
+import platform
+import re
+import subprocess
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPConnection, HTTPException
+from threading import Barrier, Thread
+from urllib.parse import urlsplit
+
+import django
+from api.pagination import ProductCategoryPagination, ProductPagination
+from core.constants import (
+    BenchmarkApiCfg,
+    MetricsCfg,
+    SeedBenchmarkDataCfg,
+    SerializersCfg,
+    ViewsCfg,
+)
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.core.servers.basehttp import ThreadedWSGIServer, WSGIRequestHandler
+from django.core.wsgi import get_wsgi_application
+from django.db import connections
+from django.test import Client
+from rest_framework.authtoken.models import Token
+from store.models import Cart, Product, ProductCategory, ProductSubCategory
+
+
+class QuietWSGIRequestHandler(WSGIRequestHandler):
+    """
+    Обработчик запросов WSGI-сервера без журнала запросов.
+
+    Алгоритм Нейгла отключён: сервер пишет заголовки и тело ответа
+    отдельными вызовами, и без этого каждый ответ на постоянном
+    подключении задерживается на время отложенного подтверждения TCP.
+    """
+
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        """Не записывает запросы в журнал."""
+
+
+class ClientTransport:
+    """Отправка запросов через тестовый клиент Django без сети."""
+
+    def __init__(self, host: str):
+        """
+        Создает тестовый клиент.
+
+        Параметры:
+            host (str): Значение заголовка Host.
+        """
+        self.client = Client(HTTP_HOST=host, raise_request_exception=False)
+
+    def request(
+        self, method: str, path: str, body, token: str | None
+    ) -> tuple:
+        """
+        Выполняет запрос.
+
+        Параметры:
+            method (str): HTTP-метод.
+            path (str): Путь запроса.
+            body: Тело запроса для сериализации в JSON или None.
+            token (str | None): Токен пользователя.
+
+        Возвращает:
+            tuple: Код ответа и значение заголовка Server-Timing.
+        """
+        headers = {}
+        if token is not None:
+            headers[BenchmarkApiCfg.AUTHORIZATION_HEADER] = (
+                BenchmarkApiCfg.AUTHORIZATION.format(key=token)
+            )
+        response = getattr(self.client, method)(
+            path,
+            data=body,
+            content_type=BenchmarkApiCfg.JSON_CONTENT_TYPE,
+            headers=headers,
+        )
+        return response.status_code, response.get(
+            MetricsCfg.SERVER_TIMING_HEADER
+        )
+
+    def close(self) -> None:
+        """Закрывает подключения к базе данных потока."""
+        connections.close_all()
+
+
+class HttpTransport:
+    """Отправка запросов на HTTP-сервер через постоянное подключение."""
+
+    def __init__(self, url: str, host: str):
+        """
+        Создает подключение к серверу.
+
+        Параметры:
+            url (str): Адрес сервера.
+            host (str): Значение заголовка Host.
+        """
+        parts = urlsplit(url)
+        self.prefix = parts.path.rstrip("/")
+        self.host = host
+        self.connection = HTTPConnection(
+            parts.netloc, timeout=BenchmarkApiCfg.TIMEOUT
+        )
+
+    def request(
+        self, method: str, path: str, body, token: str | None
+    ) -> tuple:
+        """
+        Выполняет запрос.
+
+        Если сервер закрыл подключение между запросами, запрос повторяется
+        один раз через новое подключение.
+
+        Параметры:
+            method (str): HTTP-метод.
+            path (str): Путь запроса.
+            body: Тело запроса для сериализации в JSON или None.
+            token (str | None): Токен пользователя.
+
+        Возвращает:
+            tuple: Код ответа и значение заголовка Server-Timing.
+        """
+        headers = {BenchmarkApiCfg.HOST_HEADER: self.host}
+        if token is not None:
+            headers[BenchmarkApiCfg.AUTHORIZATION_HEADER] = (
+                BenchmarkApiCfg.AUTHORIZATION.format(key=token)
+            )
+        if body is not None:
+            body = json.dumps(body).encode()
+            headers[BenchmarkApiCfg.CONTENT_TYPE_HEADER] = (
+                BenchmarkApiCfg.JSON_CONTENT_TYPE
+            )
+        for attempt in range(2):
+            try:
+                self.connection.request(
+                    method.upper(), self.prefix + path, body, headers
+                )
+                response = self.connection.getresponse()
+                response.read()
+                break
+            except (ConnectionError, HTTPException):
+                self.connection.close()
+                if attempt:
+                    raise
+        return response.status, response.getheader(
+            MetricsCfg.SERVER_TIMING_HEADER
+        )
+
+    def close(self) -> None:
+        """Закрывает подключение к серверу."""
+        self.connection.close()
+
+
+class Command(BaseCommand):
+    """
+    Нагрузочное тестирование API.
+
+    Для каждого уровня параллельности и каждого сценария (список
+    продуктов, список категорий и все действия корзины) выполняет заданное
+    число запросов через тестовый клиент Django или через настоящий
+    HTTP-сервер и выводит в JSON пропускную способность, перцентили
+    задержки и количество запросов к базе данных. Количество запросов к
+    базе данных берётся из заголовка Server-Timing.
+
+    Без --url для транспорта http запускается многопоточный WSGI-сервер
+    Django в том же процессе. С --url запросы отправляются на уже
+    запущенный сервер, например ASGI-сервер с config.asgi:application,
+    что позволяет сравнить WSGI и ASGI.
+
+    Данные создаются командой seed_benchmark_data. Каждый поток работает
+    со своим пользователем. Для сценариев изменения и удаления товара и
+    очистки корзины перед каждым измеряемым запросом товар добавляется в
+    корзину; эти запросы не входят в задержку, но входят во время
+    сценария и уменьшают пропускную способность.
+    """
+
+    help = "Нагрузочное тестирование API."
+
+    def add_arguments(self, parser):
+        """Добавляет аргументы командной строки."""
+        parser.add_argument(
+            "--transport",
+            choices=BenchmarkApiCfg.TRANSPORTS,
+            default=BenchmarkApiCfg.TRANSPORT_CLIENT,
+            help="Тестовый клиент Django или HTTP-сервер.",
+        )
+        parser.add_argument(
+            "--url",
+            help="Адрес запущенного сервера для транспорта http.",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=BenchmarkApiCfg.REQUESTS,
+            help="Количество измеряемых запросов в каждом сценарии.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            nargs="+",
+            default=BenchmarkApiCfg.CONCURRENCY,
+            help="Уровни параллельности.",
+        )
+        parser.add_argument(
+            "--scenarios",
+            nargs="+",
+            choices=BenchmarkApiCfg.SCENARIOS,
+            default=BenchmarkApiCfg.SCENARIOS,
+            help="Сценарии.",
+        )
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            default=BenchmarkApiCfg.WARMUP,
+            help="Количество неизмеряемых запросов перед сценарием.",
+        )
+        parser.add_argument(
+            "--output",
+            help="Файл для результата, по умолчанию стандартный вывод.",
+        )
+
+    def handle(self, *args, **options):
+        """Выполняет сценарии и выводит результат."""
+        self.host = next(
+            (h.lstrip(".") for h in settings.ALLOWED_HOSTS if h != "*"),
+            BenchmarkApiCfg.DEFAULT_HOST,
+        )
+        self.tokens = list(
+            Token.objects.filter(
+                user__username__startswith=SeedBenchmarkDataCfg.PREFIX
+            )
+            .order_by(BenchmarkApiCfg.TOKEN_ORDERING)
+            .values_list(BenchmarkApiCfg.TOKEN_KEY, flat=True)
+        )
+        if not self.tokens:
+            raise CommandError(BenchmarkApiCfg.NO_USERS_ERROR)
+        self.products = list(
+            Product.objects.filter(
+                slug__startswith=SeedBenchmarkDataCfg.PREFIX
+            )
+            .order_by(BenchmarkApiCfg.PRODUCT_ORDERING)
+            .values_list(ViewsCfg.PRODUCT_TITLE, flat=True)[
+                : BenchmarkApiCfg.CART_PRODUCTS
+            ]
+        )
+        if not self.products:
+            raise CommandError(BenchmarkApiCfg.NO_PRODUCTS_ERROR)
+        self.pages = {
+            BenchmarkApiCfg.PRODUCTS_LIST: self.get_pages(
+                Product.objects.count(), ProductPagination.page_size
+            ),
+            BenchmarkApiCfg.CATEGORIES_LIST: self.get_pages(
+                ProductCategory.objects.count(),
+                ProductCategoryPagination.page_size,
+            ),
+        }
+        server = None
+        self.url = options["url"]
+        if options["transport"] == BenchmarkApiCfg.TRANSPORT_HTTP:
+            if self.url is None:
+                server = self.start_server()
+                self.url = BenchmarkApiCfg.SERVER_URL.format(
+                    host=BenchmarkApiCfg.HOST, port=server.server_port
+                )
+        try:
+            results = [
+                self.run_scenario(
+                    options["transport"],
+                    scenario,
+                    concurrency,
+                    options["requests"],
+                    options["warmup"],
+                )
+                for concurrency in options["concurrency"]
+                for scenario in options["scenarios"]
+            ]
+        finally:
+            if server is not None:
+                server.shutdown()
+                server.server_close()
+        report = {
+            "commit": self.get_commit(),
+            "transport": options["transport"],
+            "url": self.url,
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "dataset": {
+                "categories": ProductCategory.objects.count(),
+                "subcategories": ProductSubCategory.objects.count(),
+                "products": Product.objects.count(),
+                "carts": Cart.objects.count(),
+            },
+            "results": results,
+        }
+        output = json.dumps(report, ensure_ascii=False, indent=2)
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as file:
+                file.write(output)
+        else:
+            self.stdout.write(output)
+
+    @staticmethod
+    def get_pages(count: int, page_size: int) -> int:
+        """
+        Возвращает количество запрашиваемых страниц списка.
+
+        Параметры:
+            count (int): Количество объектов.
+            page_size (int): Размер страницы.
+
+        Возвращает:
+            int: Количество страниц, но не больше MAX_PAGES.
+        """
+        return min(
+            max(math.ceil(count / page_size), 1), BenchmarkApiCfg.MAX_PAGES
+        )
+
+    @staticmethod
+    def start_server() -> ThreadedWSGIServer:
+        """
+        Запускает многопоточный WSGI-сервер в фоновом потоке.
+
+        Возвращает:
+            ThreadedWSGIServer: Запущенный сервер на свободном порту.
+        """
+        server = ThreadedWSGIServer(
+            (BenchmarkApiCfg.HOST, 0),
+            QuietWSGIRequestHandler,
+            allow_reuse_address=False,
+        )
+        server.set_app(get_wsgi_application())
+        Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+    @staticmethod
+    def get_commit() -> str | None:
+        """
+        Возвращает текущий коммит репозитория.
+
+        Возвращает:
+            str | None: Хэш коммита или None вне репозитория git.
+        """
+        try:
+            result = subprocess.run(
+                BenchmarkApiCfg.GIT_COMMIT_COMMAND,
+                cwd=settings.BASE_DIR,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        return result.stdout.strip()
+
+    def get_transport(self, transport: str):
+        """
+        Создает транспорт для потока.
+
+        Параметры:
+            transport (str): Название транспорта.
+
+        Возвращает:
+            ClientTransport | HttpTransport: Транспорт.
+        """
+        if transport == BenchmarkApiCfg.TRANSPORT_CLIENT:
+            return ClientTransport(self.host)
+        return HttpTransport(self.url, self.host)
+
+    def get_steps(self, scenario: str, index: int) -> list:
+        """
+        Возвращает запросы одного шага сценария.
+
+        Параметры:
+            scenario (str): Название сценария.
+            index (int): Номер шага.
+
+        Возвращает:
+            list: Кортежи (метод, путь, тело, измеряется ли запрос).
+        """
+        cfg = BenchmarkApiCfg
+        product = self.products[index % len(self.products)]
+        add = (
+            ViewsCfg.ADD_ITEM_HTTP_METHODS[0],
+            cfg.CART_ACTION_URL.format(action=cfg.ADD_ITEM),
+            {ViewsCfg.PRODUCT: product},
+            False,
+        )
+        if scenario == cfg.PRODUCTS_LIST:
+            page = index % self.pages[scenario] + 1
+            return [(cfg.GET, cfg.PRODUCTS_URL.format(page=page), None, True)]
+        if scenario == cfg.CATEGORIES_LIST:
+            page = index % self.pages[scenario] + 1
+            return [
+                (cfg.GET, cfg.CATEGORIES_URL.format(page=page), None, True)
+            ]
+        if scenario == cfg.CART_LIST:
+            return [(cfg.GET, cfg.CART_URL, None, True)]
+        if scenario == cfg.CART_ADD_ITEM:
+            return [add[:3] + (True,)]
+        if scenario == cfg.CART_UPDATE_ITEM:
+            return [
+                add,
+                (
+                    ViewsCfg.UPDATE_ITEM_HTTP_METHODS[0],
+                    cfg.CART_ACTION_URL.format(action=cfg.UPDATE_ITEM),
+                    {
+                        ViewsCfg.PRODUCT: product,
+                        ViewsCfg.QUANTITY: cfg.QUANTITY,
+                    },
+                    True,
+                ),
+            ]
+        if scenario == cfg.CART_REMOVE_ITEM:
+            return [
+                add,
+                (
+                    ViewsCfg.REMOVE_ITEM_HTTP_METHODS[0],
+                    cfg.CART_ACTION_URL.format(action=cfg.REMOVE_ITEM),
+                    {ViewsCfg.PRODUCT: product},
+                    True,
+                ),
+            ]
+        if scenario == cfg.CART_BATCH:
+            return [
+                (
+                    ViewsCfg.BATCH_HTTP_METHODS[0],
+                    cfg.CART_ACTION_URL.format(action=cfg.BATCH),
+                    [
+                        {
+                            ViewsCfg.PRODUCT: product,
+                            ViewsCfg.OP: SerializersCfg.CART_BATCH_OP_ADD,
+                        },
+                        {
+                            ViewsCfg.PRODUCT: product,
+                            ViewsCfg.OP: SerializersCfg.CART_BATCH_OP_UPDATE,
+                            ViewsCfg.QUANTITY: cfg.QUANTITY,
+                        },
+                    ],
+                    True,
+                )
+            ]
+        if scenario == cfg.CART_CLEAR_CART:
+            return [
+                add,
+                (
+                    ViewsCfg.CLEAR_CART_HTTP_METHODS[0],
+                    cfg.CART_ACTION_URL.format(action=cfg.CLEAR_CART),
+                    None,
+                    True,
+                ),
+            ]
+        raise CommandError(
+            cfg.UNKNOWN_SCENARIO_ERROR.format(scenario=scenario)
+        )
+
+    def run_worker(
+        self,
+        transport: str,
+        scenario: str,
+        worker: int,
+        concurrency: int,
+        requests: int,
+        barrier: Barrier,
+    ) -> list:
+        """
+        Выполняет шаги сценария, приходящиеся на один поток.
+
+        Параметры:
+            transport (str): Название транспорта.
+            scenario (str): Название сценария.
+            worker (int): Номер потока.
+            concurrency (int): Количество потоков.
+            requests (int): Общее количество шагов сценария.
+            barrier (Barrier): Барьер одновременного старта потоков.
+
+        Возвращает:
+            list: Кортежи (задержка в секундах, код ответа, Server-Timing)
+        измеряемых запросов.
+        """
+        client = self.get_transport(transport)
+        token = self.tokens[worker % len(self.tokens)]
+        samples = []
+        try:
+            barrier.wait()
+            for index in range(worker, requests, concurrency):
+                for method, path, body, timed in self.get_steps(
+                    scenario, index
+                ):
+                    started = time.perf_counter()
+                    status, server_timing = client.request(
+                        method, path, body, token
+                    )
+                    if timed:
+                        samples.append(
+                            (
+                                time.perf_counter() - started,
+                                status,
+                                server_timing,
+                            )
+                        )
+        finally:
+            client.close()
+        return samples
+
+    def run_scenario(
+        self,
+        transport: str,
+        scenario: str,
+        concurrency: int,
+        requests: int,
+        warmup: int,
+    ) -> dict:
+        """
+        Выполняет сценарий с заданной параллельностью.
+
+        Параметры:
+            transport (str): Название транспорта.
+            scenario (str): Название сценария.
+            concurrency (int): Количество потоков.
+            requests (int): Количество измеряемых запросов.
+            warmup (int): Количество неизмеряемых шагов перед сценарием.
+
+        Возвращает:
+            dict: Результат сценария.
+        """
+        self.run_worker(transport, scenario, 0, 1, warmup, Barrier(1))
+        barrier = Barrier(concurrency + 1)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [
+                executor.submit(
+                    self.run_worker,
+                    transport,
+                    scenario,
+                    worker,
+                    concurrency,
+                    requests,
+                    barrier,
+                )
+                for worker in range(concurrency)
+            ]
+            barrier.wait()
+            started = time.perf_counter()
+            samples = [
+                sample for future in futures for sample in future.result()
+            ]
+            elapsed = time.perf_counter() - started
+        return self.summarize(scenario, concurrency, samples, elapsed)
+
+    @staticmethod
+    def summarize(
+        scenario: str, concurrency: int, samples: list, elapsed: float
+    ) -> dict:
+        """
+        Подсчитывает показатели сценария.
+
+        Перцентили вычисляются методом ближайшего ранга.
+
+        Параметры:
+            scenario (str): Название сценария.
+            concurrency (int): Количество потоков.
+            samples (list): Измерения запросов.
+            elapsed (float): Время выполнения сценария в секундах.
+
+        Возвращает:
+            dict: Пропускная способность, задержки в миллисекундах, коды
+        ответов и количество запросов к базе данных.
+        """
+        latencies = sorted(latency * 1000 for latency, _, _ in samples)
+        statuses = Counter(status for _, status, _ in samples)
+        queries = [
+            int(match.group(1))
+            for _, _, server_timing in samples
+            if server_timing
+            and (
+                match := re.search(
+                    BenchmarkApiCfg.QUERIES_PATTERN, server_timing
+                )
+            )
+        ]
+        count = len(latencies)
+        latency = {
+            "mean": round(sum(latencies) / count, 3),
+            **{
+                f"p{percentile}": round(
+                    latencies[max(math.ceil(percentile / 100 * count) - 1, 0)],
+                    3,
+                )
+                for percentile in BenchmarkApiCfg.PERCENTILES
+            },
+            "max": round(latencies[-1], 3),
+        }
+        return {
+            "scenario": scenario,
+            "concurrency": concurrency,
+            "requests": count,
+            "errors": sum(
+                number for status, number in statuses.items() if status >= 400
+            ),
+            "statuses": {
+                str(status): number
+                for status, number in sorted(statuses.items())
+            },
+            "elapsed_s": round(elapsed, 3),
+            "throughput_rps": round(count / elapsed, 1),
+            "latency_ms": latency,
+            "db_queries": {
+                "mean": (
+                    round(sum(queries) / len(queries), 2) if queries else None
+                ),
+                "max": max(queries, default=None),
+            },
+        }
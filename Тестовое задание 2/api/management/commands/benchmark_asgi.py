@@ -0,0 +1,226 @@
+"""Команда для сравнения развёртываний WSGI и ASGI под нагрузкой."""
+
+import importlib.util
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+from core.constants import BenchmarkApiCfg, BenchmarkAsgiCfg
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    """
+    Сравнивает пропускную способность и задержку WSGI и ASGI.
+
+    Для каждого развёртывания запускает сервер uvicorn в отдельном
+    процессе: с config.wsgi:application через интерфейс WSGI (синхронные
+    представления в пуле потоков сервера) и с config.asgi:application
+    (асинхронные представления, ASYNC_API_VIEWS=True). Один и тот же
+    HTTP-сервер для обоих развёртываний оставляет в сравнении только
+    разницу между WSGI и ASGI. На каждый сервер командой benchmark_api
+    отправляются запросы с одинаковой параллельностью.
+
+    Выводит в JSON полный результат каждого развёртывания и сводку:
+    пропускную способность, p99 задержки и отношение показателей ASGI к
+    WSGI для каждого сценария и уровня параллельности. Данные создаются
+    командой seed_benchmark_data.
+    """
+
+    help = "Сравнивает развёртывания WSGI и ASGI под нагрузкой."
+
+    def add_arguments(self, parser):
+        """Добавляет аргументы командной строки."""
+        cfg = BenchmarkAsgiCfg
+        parser.add_argument(
+            "--scenarios",
+            nargs="+",
+            choices=BenchmarkApiCfg.SCENARIOS,
+            default=cfg.SCENARIOS,
+            help="Сценарии команды benchmark_api.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            nargs="+",
+            default=cfg.CONCURRENCY,
+            help="Уровни параллельности.",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=cfg.REQUESTS,
+            help="Количество измеряемых запросов в каждом сценарии.",
+        )
+        parser.add_argument(
+            "--output",
+            help="Файл для результата, по умолчанию стандартный вывод.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Выполняет нагрузочный тест каждого развёртывания и выводит результат.
+
+        Вызывает ошибку:
+            CommandError: Если uvicorn не установлен или сервер не
+        запустился.
+        """
+        if importlib.util.find_spec("uvicorn") is None:
+            raise CommandError(BenchmarkAsgiCfg.NO_UVICORN_ERROR)
+        reports = {
+            deployment: self.run_deployment(deployment, options)
+            for deployment in BenchmarkAsgiCfg.DEPLOYMENTS
+        }
+        wsgi = {
+            self.get_key(result): result
+            for result in reports[BenchmarkAsgiCfg.WSGI]["results"]
+        }
+        summary = []
+        for result in reports[BenchmarkAsgiCfg.ASGI]["results"]:
+            baseline = wsgi[self.get_key(result)]
+            summary.append(
+                {
+                    "scenario": result["scenario"],
+                    "concurrency": result["concurrency"],
+                    "wsgi_rps": baseline["throughput_rps"],
+                    "asgi_rps": result["throughput_rps"],
+                    "wsgi_p99_ms": baseline["latency_ms"]["p99"],
+                    "asgi_p99_ms": result["latency_ms"]["p99"],
+                    "wsgi_errors": baseline["errors"],
+                    "asgi_errors": result["errors"],
+                    "rps_ratio": round(
+                        result["throughput_rps"] / baseline["throughput_rps"],
+                        2,
+                    ),
+                }
+            )
+        output = json.dumps(
+            {"summary": summary, "reports": reports},
+            ensure_ascii=False,
+            indent=2,
+        )
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as file:
+                file.write(output)
+        else:
+            self.stdout.write(output)
+
+    @staticmethod
+    def get_key(result: dict) -> tuple:
+        """
+        Возвращает ключ результата сценария.
+
+        Параметры:
+            result (dict): Результат сценария команды benchmark_api.
+
+        Возвращает:
+            tuple: Сценарий и уровень параллельности.
+        """
+        return tuple(result[key] for key in BenchmarkAsgiCfg.RESULT_KEY)
+
+    @staticmethod
+    def get_free_port() -> int:
+        """
+        Возвращает свободный порт.
+
+        Возвращает:
+            int: Номер порта.
+        """
+        with socket.socket() as sock:
+            sock.bind((BenchmarkApiCfg.HOST, 0))
+            return sock.getsockname()[1]
+
+    @staticmethod
+    def start_server(deployment: str, port: int, log) -> subprocess.Popen:
+        """
+        Запускает uvicorn и ждёт, пока он начнёт принимать подключения.
+
+        Параметры:
+            deployment (str): Название развёртывания.
+            port (int): Порт сервера.
+            log: Файл для стандартного потока ошибок сервера.
+
+        Возвращает:
+            subprocess.Popen: Процесс сервера.
+
+        Вызывает ошибку:
+            CommandError: Если сервер не запустился.
+        """
+        cfg = BenchmarkAsgiCfg
+        interface, application = cfg.DEPLOYMENTS[deployment]
+        process = subprocess.Popen(
+            [
+                sys.executable,
+                *(
+                    part.format(
+                        host=BenchmarkApiCfg.HOST,
+                        port=port,
+                        interface=interface,
+                        application=application,
+                    )
+                    for part in cfg.SERVER_COMMAND
+                ),
+            ],
+            cwd=settings.BASE_DIR,
+            env=os.environ.copy(),
+            stderr=log,
+        )
+        deadline = time.monotonic() + cfg.STARTUP_TIMEOUT
+        while time.monotonic() < deadline and process.poll() is None:
+            try:
+                socket.create_connection(
+                    (BenchmarkApiCfg.HOST, port), timeout=1
+                ).close()
+                return process
+            except OSError:
+                time.sleep(cfg.STARTUP_POLL_INTERVAL)
+        process.kill()
+        process.wait()
+        log.seek(0)
+        raise CommandError(
+            cfg.STARTUP_ERROR.format(deployment=deployment, stderr=log.read())
+        )
+
+    def run_deployment(self, deployment: str, options: dict) -> dict:
+        """
+        Запускает сервер развёртывания и выполняет на нём сценарии.
+
+        Параметры:
+            deployment (str): Название развёртывания.
+            options (dict): Аргументы командной строки.
+
+        Возвращает:
+            dict: Результат команды benchmark_api.
+        """
+        port = self.get_free_port()
+        with tempfile.TemporaryDirectory() as directory, open(
+            os.path.join(directory, f"{deployment}.log"), "w+"
+        ) as log:
+            process = self.start_server(deployment, port, log)
+            try:
+                path = os.path.join(directory, f"{deployment}.json")
+                call_command(
+                    BenchmarkAsgiCfg.BENCHMARK_COMMAND,
+                    transport=BenchmarkApiCfg.TRANSPORT_HTTP,
+                    url=BenchmarkApiCfg.SERVER_URL.format(
+                        host=BenchmarkApiCfg.HOST, port=port
+                    ),
+                    requests=options["requests"],
+                    concurrency=options["concurrency"],
+                    scenarios=options["scenarios"],
+                    output=path,
+                )
+                with open(path, encoding="utf-8") as file:
+                    return json.load(file)
+            finally:
+                process.terminate()
+                try:
+                    process.wait(BenchmarkAsgiCfg.STOP_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    process.kill()
@@ -0,0 +1,136 @@
+"""Команда для измерения эффекта сжатия ответов и условных запросов."""
+
+import json
+import statistics
+import time
+
+from core.compression import get_encodings
+from core.constants import BenchmarkCompressionCfg
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from store.models import Product
+
+
+class Command(BaseCommand):
+    """
+    Измеряет размер и время ответов каталога со сжатием и без него.
+
+    Каждый адрес запрашивается без сжатия, с каждой доступной кодировкой и
+    повторно с If-None-Match. Для каждого варианта выводятся размер тела,
+    медианное время обработки запроса, расчётное время передачи тела при
+    заданной пропускной способности канала и экономия относительно ответа
+    без сжатия. Запросы выполняются тестовым клиентом Django на данных
+    команды seed_benchmark_data. Результат выводится в JSON.
+    """
+
+    help = "Измеряет эффект сжатия ответов и условных запросов."
+
+    def add_arguments(self, parser):
+        """Добавляет аргументы командной строки."""
+        cfg = BenchmarkCompressionCfg
+        parser.add_argument(
+            "--urls",
+            nargs="+",
+            default=cfg.URLS,
+            help="Адреса страниц каталога.",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=cfg.REQUESTS,
+            help="Количество запросов для каждого варианта.",
+        )
+        parser.add_argument(
+            "--bandwidth",
+            type=float,
+            default=cfg.BANDWIDTH,
+            help="Пропускная способность канала клиента в Мбит/с.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Выполняет измерения и выводит результат.
+
+        Вызывает ошибку:
+            CommandError: Если нет продуктов или ответ не содержит ETag.
+        """
+        cfg = BenchmarkCompressionCfg
+        if not Product.objects.exists():
+            raise CommandError(cfg.NO_PRODUCTS_ERROR)
+        host = next(
+            (h.lstrip(".") for h in settings.ALLOWED_HOSTS if h != "*"),
+            cfg.DEFAULT_HOST,
+        )
+        client = Client(HTTP_HOST=host)
+        results = []
+        for url in options["urls"]:
+            etag = client.get(url).get(cfg.ETAG_HEADER)
+            if etag is None:
+                raise CommandError(cfg.NO_ETAG_ERROR.format(url=url))
+            variants = [
+                (cfg.IDENTITY, {cfg.ACCEPT_ENCODING_HEADER: cfg.IDENTITY})
+            ]
+            variants.extend(
+                (encoding, {cfg.ACCEPT_ENCODING_HEADER: encoding})
+                for encoding in get_encodings()
+            )
+            variants.append(
+                (
+                    cfg.NOT_MODIFIED,
+                    {
+                        cfg.ACCEPT_ENCODING_HEADER: cfg.IDENTITY,
+                        cfg.IF_NONE_MATCH_HEADER: etag,
+                    },
+                )
+            )
+            baseline = None
+            for variant, headers in variants:
+                result = self.measure(
+                    client, url, headers, options["requests"]
+                )
+                result = {"url": url, "variant": variant, **result}
+                result["transfer_ms"] = round(
+                    result["body_bytes"] * 8 / options["bandwidth"] / 1000, 3
+                )
+                result["total_ms"] = round(
+                    result["median_ms"] + result["transfer_ms"], 3
+                )
+                if baseline is None:
+                    baseline = result
+                result["saved_bytes"] = (
+                    baseline["body_bytes"] - result["body_bytes"]
+                )
+                result["saved_ms"] = round(
+                    baseline["total_ms"] - result["total_ms"], 3
+                )
+                results.append(result)
+        self.stdout.write(json.dumps(results, ensure_ascii=False, indent=2))
+
+    @staticmethod
+    def measure(
+        client: Client, url: str, headers: dict, requests: int
+    ) -> dict:
+        """
+        Выполняет запросы и измеряет размер и время ответа.
+
+        Параметры:
+            client (Client): Тестовый клиент Django.
+            url (str): Адрес страницы.
+            headers (dict): Заголовки запроса.
+            requests (int): Количество запросов.
+
+        Возвращает:
+            dict: Код ответа, размер тела и медианное время в миллисекундах.
+        """
+        response = client.get(url, headers=headers)
+        durations = []
+        for _ in range(requests):
+            started = time.perf_counter()
+            client.get(url, headers=headers)
+            durations.append(time.perf_counter() - started)
+        return {
+            "status": response.status_code,
+            "body_bytes": len(response.content),
+            "median_ms": round(statistics.median(durations) * 1000, 3),
+        }
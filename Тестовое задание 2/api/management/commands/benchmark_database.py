@@ -0,0 +1,219 @@
+"""Команда для сравнения конфигураций базы данных под нагрузкой."""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from core.constants import BenchmarkApiCfg, BenchmarkDatabaseCfg, DatabaseCfg
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+
+class Command(BaseCommand):
+    """
+    Сравнивает конфигурации подключений к базе данных под нагрузкой.
+
+    Для каждой конфигурации запускает команду benchmark_api с транспортом
+    http в отдельном процессе, задав переменные окружения конфигурации:
+    подключение на каждый запрос (DB_CONN_MAX_AGE=0), постоянные
+    подключения (DB_CONN_MAX_AGE=60), пул подключений PostgreSQL
+    (DB_POOL_MAX_SIZE) и, для SQLite, журнал отката вместо WAL. По
+    умолчанию выполняются сценарии изменения корзины.
+
+    Выводит в JSON полный результат каждой конфигурации и сводку:
+    пропускную способность, p99 задержки, количество ошибок и ускорение
+    относительно первой конфигурации для каждого сценария и уровня
+    параллельности. Данные создаются командой seed_benchmark_data.
+    """
+
+    help = "Сравнивает конфигурации базы данных под нагрузкой."
+
+    def add_arguments(self, parser):
+        """Добавляет аргументы командной строки."""
+        cfg = BenchmarkDatabaseCfg
+        parser.add_argument(
+            "--configs",
+            nargs="+",
+            choices=tuple(cfg.CONFIGS),
+            help=(
+                "Конфигурации, по умолчанию все доступные для текущей "
+                "базы данных."
+            ),
+        )
+        parser.add_argument(
+            "--scenarios",
+            nargs="+",
+            default=cfg.SCENARIOS,
+            help="Сценарии команды benchmark_api.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            nargs="+",
+            default=cfg.CONCURRENCY,
+            help="Уровни параллельности.",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=cfg.REQUESTS,
+            help="Количество измеряемых запросов в каждом сценарии.",
+        )
+        parser.add_argument(
+            "--output",
+            help="Файл для результата, по умолчанию стандартный вывод.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Выполняет нагрузочный тест каждой конфигурации и выводит результат.
+
+        Вызывает ошибку:
+            CommandError: Если конфигурация не поддерживается базой данных
+        или нагрузочный тест завершился ошибкой.
+        """
+        names = options["configs"] or self.get_default_configs()
+        for name in names:
+            self.check_config(name)
+        reports = {name: self.run_config(name, options) for name in names}
+        baseline = {
+            self.get_key(result): result
+            for result in reports[names[0]]["results"]
+        }
+        summary = [
+            {
+                "config": name,
+                "scenario": result["scenario"],
+                "concurrency": result["concurrency"],
+                "throughput_rps": result["throughput_rps"],
+                "p99_ms": result["latency_ms"]["p99"],
+                "errors": result["errors"],
+                "speedup": round(
+                    result["throughput_rps"]
+                    / baseline[self.get_key(result)]["throughput_rps"],
+                    2,
+                ),
+            }
+            for name, report in reports.items()
+            for result in report["results"]
+        ]
+        output = json.dumps(
+            {
+                "vendor": connection.vendor,
+                "configs": {
+                    name: BenchmarkDatabaseCfg.CONFIGS[name] for name in names
+                },
+                "summary": summary,
+                "reports": reports,
+            },
+            ensure_ascii=False,
+            indent=2,
+        )
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as file:
+                file.write(output)
+        else:
+            self.stdout.write(output)
+
+    @staticmethod
+    def get_default_configs() -> tuple:
+        """
+        Возвращает конфигурации по умолчанию для текущей базы данных.
+
+        Возвращает:
+            tuple: Названия конфигураций.
+        """
+        if connection.vendor == DatabaseCfg.SQLITE_VENDOR:
+            return BenchmarkDatabaseCfg.SQLITE_CONFIGS
+        if connection.vendor == BenchmarkDatabaseCfg.POSTGRESQL_VENDOR:
+            return BenchmarkDatabaseCfg.POSTGRESQL_CONFIGS
+        return (
+            BenchmarkDatabaseCfg.PER_REQUEST,
+            BenchmarkDatabaseCfg.PERSISTENT,
+        )
+
+    @staticmethod
+    def check_config(name: str) -> None:
+        """
+        Проверяет, что конфигурация поддерживается текущей базой данных.
+
+        Параметры:
+            name (str): Название конфигурации.
+
+        Вызывает ошибку:
+            CommandError: Если конфигурация не поддерживается.
+        """
+        cfg = BenchmarkDatabaseCfg
+        if (
+            name in cfg.SQLITE_ONLY_CONFIGS
+            and connection.vendor != DatabaseCfg.SQLITE_VENDOR
+        ) or (
+            name in cfg.POSTGRESQL_ONLY_CONFIGS
+            and connection.vendor != cfg.POSTGRESQL_VENDOR
+        ):
+            raise CommandError(
+                cfg.UNSUPPORTED_CONFIG_ERROR.format(
+                    name=name, vendor=connection.vendor
+                )
+            )
+
+    @staticmethod
+    def get_key(result: dict) -> tuple:
+        """
+        Возвращает ключ результата сценария.
+
+        Параметры:
+            result (dict): Результат сценария команды benchmark_api.
+
+        Возвращает:
+            tuple: Сценарий и уровень параллельности.
+        """
+        return tuple(result[key] for key in BenchmarkDatabaseCfg.RESULT_KEY)
+
+    @staticmethod
+    def run_config(name: str, options: dict) -> dict:
+        """
+        Запускает команду benchmark_api с переменными окружения конфигурации.
+
+        Параметры:
+            name (str): Название конфигурации.
+            options (dict): Аргументы командной строки.
+
+        Возвращает:
+            dict: Результат команды benchmark_api.
+
+        Вызывает ошибку:
+            CommandError: Если команда завершилась ошибкой.
+        """
+        cfg = BenchmarkDatabaseCfg
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, f"{name}.json")
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    settings.BASE_DIR / cfg.MANAGE_PY,
+                    cfg.BENCHMARK_COMMAND,
+                    "--transport",
+                    BenchmarkApiCfg.TRANSPORT_HTTP,
+                    "--requests",
+                    str(options["requests"]),
+                    "--concurrency",
+                    *map(str, options["concurrency"]),
+                    "--scenarios",
+                    *options["scenarios"],
+                    "--output",
+                    path,
+                ],
+                env={**os.environ, **cfg.CONFIGS[name]},
+                capture_output=True,
+                text=True,
+            )
+            if result.returncode:
+                raise CommandError(
+                    cfg.FAILED_ERROR.format(name=name, stderr=result.stderr)
+                )
+            with open(path, encoding="utf-8") as file:
+                return json.load(file)
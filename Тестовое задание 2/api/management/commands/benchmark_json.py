@@ -0,0 +1,157 @@
+"""Команда для сравнения скорости рендеринга и разбора JSON."""
+
+import io
+import json
+import timeit
+from decimal import Decimal
+
+from api.management.commands.benchmark_serializers import (
+    Command as BenchmarkSerializersCommand,
+)
+from api.parsers import JSONParser
+from api.renderers import JSONRenderer, is_fast_json_enabled
+from api.serializers import FastProductSerializer
+from api.views import ProductViewSet
+from core.constants import REQUEST, BenchmarkJSONCfg
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import RequestFactory
+from rest_framework import parsers, renderers
+from rest_framework.request import Request
+
+
+class Command(BaseCommand):
+    """
+    Сравнивает скорость JSON api.renderers и стандартного JSON DRF.
+
+    Для каждого размера страница продуктов в формате постраничной
+    пагинации рендерится и разбирается обоими способами. Вывод сверяется
+    побайтно как для цен-строк из сериализатора, так и для цен Decimal.
+    Тестовые данные создаются в транзакции, которая откатывается после
+    измерений. Результат выводится в JSON.
+    """
+
+    help = "Сравнивает скорость рендеринга и разбора JSON."
+
+    def add_arguments(self, parser):
+        """Добавляет аргументы командной строки."""
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=BenchmarkJSONCfg.PAGE_SIZES,
+            help="Количество продуктов на странице.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=BenchmarkJSONCfg.REPEAT,
+            help="Количество повторов, учитывается лучшее время.",
+        )
+
+    def handle(self, *args, **options):
+        """Создаёт тестовые данные, измеряет время и выводит результат."""
+        if not is_fast_json_enabled():
+            self.stderr.write(
+                self.style.WARNING(BenchmarkJSONCfg.NO_ORJSON_WARNING)
+            )
+        host = next(
+            (h.lstrip(".") for h in settings.ALLOWED_HOSTS if h != "*"),
+            "localhost",
+        )
+        context = {REQUEST: Request(RequestFactory(SERVER_NAME=host).get("/"))}
+        with transaction.atomic():
+            BenchmarkSerializersCommand.create_fixtures(max(options["sizes"]))
+            rows = FastProductSerializer.get_rows(
+                ProductViewSet.queryset.all()
+            )
+            results = [
+                self.measure(
+                    FastProductSerializer(rows[:size], context=context).data,
+                    options["repeat"],
+                )
+                for size in options["sizes"]
+            ]
+            transaction.set_rollback(True)
+        self.stdout.write(json.dumps(results, ensure_ascii=False, indent=2))
+
+    @staticmethod
+    def get_page(items: list) -> dict:
+        """
+        Возвращает страницу в формате постраничной пагинации.
+
+        Параметры:
+            items (list): Продукты страницы.
+
+        Возвращает:
+            dict: Страница с количеством, ссылками и продуктами.
+        """
+        cfg = BenchmarkJSONCfg
+        return {
+            cfg.PAGE_COUNT: len(items),
+            cfg.PAGE_NEXT: cfg.PAGE_URL,
+            cfg.PAGE_PREVIOUS: None,
+            cfg.PAGE_RESULTS: items,
+        }
+
+    def measure(self, items: list, repeat: int) -> dict:
+        """
+        Измеряет время рендеринга и разбора страницы обоими способами.
+
+        Параметры:
+            items (list): Продукты страницы, представленные сериализатором.
+            repeat (int): Количество повторов.
+
+        Возвращает:
+            dict: Лучшее время обоих способов в миллисекундах и ускорение.
+
+        Вызывает ошибку:
+            CommandError: Если вывод или результат разбора отличается.
+        """
+        cfg = BenchmarkJSONCfg
+        page = self.get_page(items)
+        decimal_page = self.get_page(
+            [{**item, cfg.PRICE: Decimal(item[cfg.PRICE])} for item in items]
+        )
+        stock_renderer = renderers.JSONRenderer()
+        fast_renderer = JSONRenderer()
+        for case, data in (
+            (str.__name__, page),
+            (Decimal.__name__, decimal_page),
+        ):
+            if stock_renderer.render(data) != fast_renderer.render(data):
+                raise CommandError(
+                    cfg.OUTPUT_MISMATCH_ERROR.format(
+                        size=len(items), case=case
+                    )
+                )
+        content = stock_renderer.render(page)
+        stock_parser = parsers.JSONParser()
+        fast_parser = JSONParser()
+        if stock_parser.parse(io.BytesIO(content)) != fast_parser.parse(
+            io.BytesIO(content)
+        ):
+            raise CommandError(
+                cfg.PARSE_MISMATCH_ERROR.format(size=len(items))
+            )
+
+        def best(function, *args) -> float:
+            return min(
+                timeit.repeat(lambda: function(*args), number=1, repeat=repeat)
+            )
+
+        stock_render = best(stock_renderer.render, page)
+        fast_render = best(fast_renderer.render, page)
+        stock_parse = best(lambda: stock_parser.parse(io.BytesIO(content)))
+        fast_parse = best(lambda: fast_parser.parse(io.BytesIO(content)))
+        return {
+            "page_size": len(items),
+            "bytes": len(content),
+            "stdlib_render_ms": round(stock_render * 1000, 3),
+            "fast_render_ms": round(fast_render * 1000, 3),
+            "render_speedup": round(stock_render / fast_render, 2),
+            "stdlib_parse_ms": round(stock_parse * 1000, 3),
+            "fast_parse_ms": round(fast_parse * 1000, 3),
+            "parse_speedup": round(stock_parse / fast_parse, 2),
+        }
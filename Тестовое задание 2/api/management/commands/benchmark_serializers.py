@@ -0,0 +1,187 @@
+"""Команда для сравнения скорости быстрых сериализаторов и ModelSerializer."""
+
+import json
+import timeit
+
+from api.serializers import (
+    FastProductCategorySerializer,
+    FastProductSerializer,
+    ProductCategorySerializer,
+    ProductSerializer,
+)
+from api.views import ProductCategoryViewSet, ProductViewSet
+from core.constants import REQUEST, BenchmarkSerializersCfg
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import RequestFactory
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from store.models import Product, ProductCategory, ProductSubCategory
+
+
+class Command(BaseCommand):
+    """
+    Сравнивает скорость быстрых сериализаторов и ModelSerializer.
+
+    Для каждого размера страницы продукты и категории сериализуются обоими
+    способами, вывод сверяется побайтно, а время измеряется вместе с
+    запросами к базе данных. Тестовые данные создаются в транзакции,
+    которая откатывается после измерений. Результат выводится в JSON.
+    """
+
+    help = "Сравнивает скорость быстрых сериализаторов и ModelSerializer."
+
+    def add_arguments(self, parser):
+        """Добавляет аргументы командной строки."""
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=BenchmarkSerializersCfg.PAGE_SIZES,
+            help="Размеры страниц для сравнения.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=BenchmarkSerializersCfg.REPEAT,
+            help="Количество повторов, учитывается лучшее время.",
+        )
+
+    def handle(self, *args, **options):
+        """Создаёт тестовые данные, измеряет время и выводит результат."""
+        host = next(
+            (h.lstrip(".") for h in settings.ALLOWED_HOSTS if h != "*"),
+            "localhost",
+        )
+        context = {REQUEST: Request(RequestFactory(SERVER_NAME=host).get("/"))}
+        cases = (
+            (
+                BenchmarkSerializersCfg.PRODUCT,
+                ProductViewSet.queryset,
+                ProductSerializer,
+                FastProductSerializer,
+            ),
+            (
+                BenchmarkSerializersCfg.CATEGORY,
+                ProductCategoryViewSet.queryset,
+                ProductCategorySerializer,
+                FastProductCategorySerializer,
+            ),
+        )
+        results = []
+        with transaction.atomic():
+            self.create_fixtures(max(options["sizes"]))
+            for name, queryset, serializer, fast_serializer in cases:
+                for size in options["sizes"]:
+                    results.append(
+                        self.measure(
+                            name,
+                            queryset,
+                            serializer,
+                            fast_serializer,
+                            size,
+                            context,
+                            options["repeat"],
+                        )
+                    )
+            transaction.set_rollback(True)
+        self.stdout.write(json.dumps(results, ensure_ascii=False, indent=2))
+
+    @staticmethod
+    def create_fixtures(count: int) -> None:
+        """
+        Создаёт категории, подкатегории и продукты для измерений.
+
+        Параметры:
+            count (int): Количество создаваемых категорий и продуктов.
+        """
+        cfg = BenchmarkSerializersCfg
+        categories = ProductCategory.objects.bulk_create(
+            ProductCategory(
+                title=cfg.TITLE.format(kind=cfg.CATEGORY, index=index),
+                slug=cfg.SLUG.format(kind=cfg.CATEGORY, index=index),
+                image=cfg.IMAGE.format(index=index),
+            )
+            for index in range(count)
+        )
+        subcategories = ProductSubCategory.objects.bulk_create(
+            ProductSubCategory(
+                title=cfg.TITLE.format(kind=cfg.SUBCATEGORY, index=index),
+                slug=cfg.SLUG.format(kind=cfg.SUBCATEGORY, index=index),
+                description=cfg.TITLE.format(
+                    kind=cfg.SUBCATEGORY, index=index
+                ),
+                image=cfg.IMAGE.format(index=index),
+                product_category=categories[
+                    index // cfg.SUBCATEGORIES_PER_CATEGORY
+                ],
+            )
+            for index in range(count * cfg.SUBCATEGORIES_PER_CATEGORY)
+        )
+        Product.objects.bulk_create(
+            Product(
+                title=cfg.TITLE.format(kind=cfg.PRODUCT, index=index),
+                slug=cfg.SLUG.format(kind=cfg.PRODUCT, index=index),
+                product_category=subcategory.product_category,
+                product_subcategory=subcategory,
+                price=cfg.PRICE.format(rubles=index, kopecks=index % 100),
+                image=cfg.IMAGE.format(index=index),
+            )
+            for index, subcategory in zip(range(count), subcategories)
+        )
+
+    @staticmethod
+    def measure(
+        name: str,
+        queryset,
+        serializer,
+        fast_serializer,
+        size: int,
+        context: dict,
+        repeat: int,
+    ) -> dict:
+        """
+        Измеряет время сериализации страницы обоими способами.
+
+        Параметры:
+            name (str): Название сериализуемой модели.
+            queryset (QuerySet): QuerySet представления.
+            serializer: Класс ModelSerializer.
+            fast_serializer: Класс быстрого сериализатора.
+            size (int): Размер страницы.
+            context (dict): Контекст сериализаторов.
+            repeat (int): Количество повторов.
+
+        Возвращает:
+            dict: Лучшее время обоих способов в миллисекундах и ускорение.
+
+        Вызывает ошибку:
+            CommandError: Если вывод быстрого сериализатора отличается.
+        """
+
+        def serialize():
+            return serializer(
+                queryset.all()[:size], many=True, context=context
+            ).data
+
+        def fast_serialize():
+            rows = fast_serializer.get_rows(queryset.all())[:size]
+            return fast_serializer(rows, context=context).data
+
+        renderer = JSONRenderer()
+        if renderer.render(serialize()) != renderer.render(fast_serialize()):
+            raise CommandError(
+                BenchmarkSerializersCfg.OUTPUT_MISMATCH_ERROR.format(
+                    serializer=fast_serializer.__name__, size=size
+                )
+            )
+        model_time = min(timeit.repeat(serialize, number=1, repeat=repeat))
+        fast_time = min(timeit.repeat(fast_serialize, number=1, repeat=repeat))
+        return {
+            "model": name,
+            "page_size": size,
+            "model_serializer_ms": round(model_time * 1000, 3),
+            "fast_serializer_ms": round(fast_time * 1000, 3),
+            "speedup": round(model_time / fast_time, 2),
+        }
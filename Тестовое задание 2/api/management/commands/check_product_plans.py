@@ -0,0 +1,105 @@
+"""Команда для проверки планов запросов списка продуктов."""
+
+import re
+
+from api.views import ProductViewSet
+from core.constants import CheckProductPlansCfg
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from rest_framework.request import Request
+from store.models import Product
+
+
+class Command(BaseCommand):
+    """
+    Проверяет, что фильтры и сортировки списка продуктов используют индексы.
+
+    Для каждого сочетания параметров запроса строится тот же QuerySet, что
+    и в ProductViewSet, и по результату EXPLAIN проверяется отсутствие
+    полного сканирования таблицы продуктов и, для запросов с сортировкой,
+    сортировки без индекса. Та же проверка выполняется тестом
+    api.tests.test_query_plans. Команду следует запускать на
+    базе данных с представительным объёмом данных и собранной статистикой,
+    иначе планировщик может предпочесть полное сканирование маленькой
+    таблицы.
+    """
+
+    help = "Проверяет, что запросы списка продуктов используют индексы."
+
+    def handle(self, *args, **options):
+        """Выводит результат проверки для каждого запроса."""
+        failed = False
+        for query in CheckProductPlansCfg.QUERIES:
+            error = self.get_plan_error(query, self.explain(query))
+            if error:
+                failed = True
+                self.stderr.write(error)
+            else:
+                self.stdout.write(
+                    CheckProductPlansCfg.PLAN_OK.format(query=query)
+                )
+        if failed:
+            raise CommandError(CheckProductPlansCfg.FAILED)
+
+    @classmethod
+    def get_plan_error(cls, query: str, plan: str) -> str | None:
+        """
+        Возвращает описание проблемы в плане запроса.
+
+        Проблемой считается полное сканирование таблицы продуктов, а для
+        запросов с параметром ordering ещё и сортировка всех подходящих
+        строк во временном B-дереве SQLite вместо чтения в порядке индекса.
+
+        Параметры:
+            query (str): Параметры запроса к списку продуктов.
+            plan (str): Результат EXPLAIN.
+
+        Возвращает:
+            str | None: Описание проблемы или None, если план использует
+        индексы.
+        """
+        cfg = CheckProductPlansCfg
+        table = Product._meta.db_table
+        if cls.get_full_scan_pattern().search(plan):
+            return cfg.PLAN_ERROR.format(query=query, table=table, plan=plan)
+        if cfg.ORDERING_PARAM in query and re.search(
+            cfg.FULL_SORT_PATTERN, plan
+        ):
+            return cfg.PLAN_SORT_ERROR.format(query=query, plan=plan)
+        return None
+
+    @staticmethod
+    def get_full_scan_pattern() -> re.Pattern:
+        """
+        Возвращает регулярное выражение полного сканирования продуктов.
+
+        Возвращает:
+            re.Pattern: Выражение, находящее в результате EXPLAIN SQLite
+        или PostgreSQL полное сканирование таблицы продуктов.
+        """
+        return re.compile(
+            CheckProductPlansCfg.FULL_SCAN_PATTERN.format(
+                table=re.escape(Product._meta.db_table)
+            ),
+            re.MULTILINE,
+        )
+
+    @staticmethod
+    def explain(query: str) -> str:
+        """
+        Возвращает план запроса первой страницы списка продуктов.
+
+        Параметры:
+            query (str): Параметры запроса к списку продуктов.
+
+        Возвращает:
+            str: Результат EXPLAIN.
+        """
+        view = ProductViewSet(
+            request=Request(RequestFactory().get("/?" + query)),
+            format_kwarg=None,
+            action="list",
+        )
+        queryset = view.filter_queryset(view.get_queryset())
+        page_size = view.paginator.get_page_size(view.request)
+        return queryset[:page_size].explain()
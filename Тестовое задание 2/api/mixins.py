@@ -0,0 +1,375 @@
+"""Миксины для представлений приложения api."""
+
+from hashlib import md5
+
+from asgiref.sync import (
+    iscoroutinefunction,
+    markcoroutinefunction,
+    sync_to_async,
+)
+from core.constants import CatalogCacheCfg
+from core.metrics import record_cache
+from core.routers import allow_replica_reads
+from django.conf import settings
+from django.http import HttpResponseBase
+from django.utils.http import (
+    http_date,
+    parse_etags,
+    parse_http_date_safe,
+    urlencode,
+)
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from store.cache import (
+    aget_catalog_versions,
+    get_catalog_cache,
+    get_catalog_versions,
+    get_last_modified,
+    get_version_tag,
+)
+
+
+class CatalogCacheMixin:
+    """
+    Миксин для кэширования ответов публичных эндпоинтов каталога.
+
+    Ключ кэша строится из адреса запроса, отсортированных параметров запроса,
+    формата ответа, адреса CDN и текущих версий моделей каталога. Версии
+    обновляются сигналами приложения store при любом изменении моделей,
+    поэтому устаревшие ответы никогда не возвращаются. Этот же ключ
+    используется как ETag, а время последнего изменения моделей каталога,
+    хранящееся в их версиях, — как Last-Modified. Если параметры запроса
+    корректны и клиент передал текущий ETag в If-None-Match или, без
+    If-None-Match, время не раньше последнего изменения в
+    If-Modified-Since, возвращается ответ 304 без тела.
+
+    Атрибуты:
+        catalog_models (tuple): Модели, от которых зависит ответ.
+    """
+
+    catalog_models = ()
+
+    def get_catalog_digest(self, request: Request, version: str) -> str:
+        """
+        Возвращает хэш, идентифицирующий представление ответа.
+
+        Параметры:
+            request (Request): Входящий запрос.
+            version (str): Текущие версии моделей каталога.
+
+        Возвращает:
+            str: Хэш адреса, параметров запроса, адреса CDN и версий
+        каталога.
+        """
+        parts = (
+            request.build_absolute_uri(request.path),
+            urlencode(sorted(request.query_params.lists()), doseq=True),
+            request.accepted_renderer.format,
+            settings.MEDIA_CDN_URL,
+            version,
+        )
+        return md5("\n".join(parts).encode()).hexdigest()
+
+    @staticmethod
+    def is_not_modified(
+        request: Request, etag: str, last_modified: float
+    ) -> bool:
+        """
+        Проверяет, есть ли у клиента актуальный ответ.
+
+        If-None-Match, как того требует RFC 9110, имеет приоритет над
+        If-Modified-Since.
+
+        Параметры:
+            request (Request): Входящий запрос.
+            etag (str): Текущий ETag ответа.
+            last_modified (float): Время последнего изменения каталога.
+
+        Возвращает:
+            bool: True, если у клиента уже есть актуальный ответ.
+        """
+        if_none_match = request.headers.get(
+            CatalogCacheCfg.IF_NONE_MATCH_HEADER
+        )
+        if if_none_match:
+            etags = parse_etags(if_none_match)
+            return etag in etags or CatalogCacheCfg.ANY_ETAG in etags
+        if_modified_since = parse_http_date_safe(
+            request.headers.get(CatalogCacheCfg.IF_MODIFIED_SINCE_HEADER)
+        )
+        return (
+            if_modified_since is not None
+            and int(last_modified) <= if_modified_since
+        )
+
+    def validate_catalog_request(self) -> None:
+        """
+        Проверяет параметры запроса до проверки условных заголовков.
+
+        Иначе запрос с некорректными параметрами и If-None-Match: * получил
+        бы ответ 304 вместо 400. Фильтры применяются к QuerySet без
+        выполнения запросов к базе данных.
+
+        Вызывает ошибку:
+            ValidationError: Если параметры фильтрации некорректны.
+        """
+        self.filter_queryset(self.get_queryset())
+
+    @staticmethod
+    def get_validator_headers(etag: str, last_modified: float) -> dict:
+        """
+        Возвращает заголовки ETag и Last-Modified ответа.
+
+        Параметры:
+            etag (str): Текущий ETag ответа.
+            last_modified (float): Время последнего изменения каталога.
+
+        Возвращает:
+            dict: Заголовки ответа.
+        """
+        return {
+            CatalogCacheCfg.ETAG_HEADER: etag,
+            CatalogCacheCfg.LAST_MODIFIED_HEADER: http_date(last_modified),
+        }
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        """
+        Возвращает список объектов каталога из кэша или из базы данных.
+
+        Параметры:
+            request (Request): Входящий запрос.
+            *args: Список аргументов переменной длины.
+            **kwargs: Произвольные именованные аргументы.
+
+        Возвращает:
+            Response: Ответ со списком объектов или ответ 304 без тела.
+        """
+        self.validate_catalog_request()
+        versions = get_catalog_versions(*self.catalog_models)
+        digest = self.get_catalog_digest(request, get_version_tag(versions))
+        etag = CatalogCacheCfg.ETAG.format(digest=digest)
+        last_modified = get_last_modified(versions)
+        if self.is_not_modified(request, etag, last_modified):
+            return self.get_not_modified_response(etag, last_modified)
+        response = self.get_catalog_response(request, digest, *args, **kwargs)
+        for header, value in self.get_validator_headers(
+            etag, last_modified
+        ).items():
+            response[header] = value
+        return response
+
+    def get_not_modified_response(
+        self, etag: str, last_modified: float
+    ) -> Response:
+        """
+        Возвращает ответ 304 без тела.
+
+        Параметры:
+            etag (str): Текущий ETag ответа.
+            last_modified (float): Время последнего изменения каталога.
+
+        Возвращает:
+            Response: Ответ 304 с заголовками ETag и Last-Modified.
+        """
+        return Response(
+            status=status.HTTP_304_NOT_MODIFIED,
+            headers=self.get_validator_headers(etag, last_modified),
+        )
+
+    def get_catalog_response(
+        self, request: Request, digest: str, *args, **kwargs
+    ) -> HttpResponseBase:
+        """
+        Возвращает ответ со списком объектов из кэша или из базы данных.
+
+        При промахе кэша ответ строится из основной базы данных, а не с
+        реплики: кэш, заполненный с отстающей реплики, отдавал бы под
+        новой версией каталога устаревшие данные, в том числе клиенту,
+        закреплённому за основной базой данных после изменения.
+
+        Параметры:
+            request (Request): Входящий запрос.
+            digest (str): Хэш, идентифицирующий представление ответа.
+            *args: Список аргументов переменной длины.
+            **kwargs: Произвольные именованные аргументы.
+
+        Возвращает:
+            HttpResponseBase: Ответ со списком объектов.
+        """
+        cache = get_catalog_cache()
+        key = CatalogCacheCfg.RESPONSE_KEY.format(digest=digest)
+        data = cache.get(key)
+        record_cache(data is not None)
+        if data is None:
+            with allow_replica_reads(False):
+                data = super().list(request, *args, **kwargs).data
+            cache.set(key, data, settings.CATALOG_CACHE_TIMEOUT)
+        return Response(data)
+
+
+class FastListMixin:
+    """
+    Миксин для вывода списка объектов быстрым сериализатором.
+
+    Вместо экземпляров моделей из базы данных выбираются именованные
+    кортежи, которые разбиваются на страницы и сериализуются быстрым
+    сериализатором с тем же выводом, что и у serializer_class. Быстрый
+    вывод отключается настройкой FAST_SERIALIZERS.
+
+    Атрибуты:
+        fast_serializer_class: Класс быстрого сериализатора.
+    """
+
+    fast_serializer_class = None
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        """
+        Возвращает список объектов, сериализованный быстрым сериализатором.
+
+        Параметры:
+            request (Request): Входящий запрос.
+            *args: Список аргументов переменной длины.
+            **kwargs: Произвольные именованные аргументы.
+
+        Возвращает:
+            Response: Ответ со списком объектов.
+        """
+        serializer_class = self.fast_serializer_class
+        if serializer_class is None or not settings.FAST_SERIALIZERS:
+            return super().list(request, *args, **kwargs)
+        rows = serializer_class.get_rows(
+            self.filter_queryset(self.get_queryset())
+        )
+        context = self.get_serializer_context()
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(
+                serializer_class(page, context=context).data
+            )
+        return Response(serializer_class(rows, context=context).data)
+
+
+class AsyncViewSetMixin:
+    """
+    Миксин для ViewSet с асинхронными обработчиками.
+
+    Представление помечается как асинхронное, поэтому при запуске через
+    ASGI асинхронные обработчики выполняются в цикле событий без
+    выделенного потока. Аутентификация, проверка прав и синхронные
+    обработчики выполняются в потоке через sync_to_async.
+    """
+
+    @classmethod
+    def as_view(cls, actions=None, **initkwargs):
+        """
+        Возвращает асинхронную функцию представления.
+
+        Параметры:
+            actions (dict): Соответствие HTTP-методов и действий.
+            **initkwargs: Атрибуты экземпляра представления.
+
+        Возвращает:
+            Callable: Функция представления, помеченная как асинхронная.
+        """
+        return markcoroutinefunction(super().as_view(actions, **initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs) -> Response:
+        """
+        Асинхронно обрабатывает запрос так же, как APIView.dispatch.
+
+        Параметры:
+            request (HttpRequest): Входящий запрос.
+            *args: Список аргументов переменной длины.
+            **kwargs: Произвольные именованные аргументы.
+
+        Возвращает:
+            Response: Ответ на запрос.
+        """
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            handler = self.http_method_not_allowed
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            if iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = await sync_to_async(handler)(
+                    request, *args, **kwargs
+                )
+        except Exception as exc:
+            response = self.handle_exception(exc)
+        self.response = self.finalize_response(
+            request, response, *args, **kwargs
+        )
+        return self.response
+
+
+class AsyncCatalogCacheMixin(AsyncViewSetMixin):
+    """
+    Асинхронный вариант CatalogCacheMixin.
+
+    Версии каталога, валидаторы и закэшированный ответ получаются асинхронным
+    API кэша, поэтому ответ из кэша и ответ 304 формируются без
+    выделенного потока. При промахе кэша ответ строится синхронным
+    get_catalog_response в потоке.
+    """
+
+    async def list(self, request: Request, *args, **kwargs) -> Response:
+        """
+        Асинхронно возвращает список объектов каталога.
+
+        Параметры:
+            request (Request): Входящий запрос.
+            *args: Список аргументов переменной длины.
+            **kwargs: Произвольные именованные аргументы.
+
+        Возвращает:
+            Response: Ответ со списком объектов или ответ 304 без тела.
+        """
+        self.validate_catalog_request()
+        versions = await aget_catalog_versions(*self.catalog_models)
+        digest = self.get_catalog_digest(request, get_version_tag(versions))
+        etag = CatalogCacheCfg.ETAG.format(digest=digest)
+        last_modified = get_last_modified(versions)
+        if self.is_not_modified(request, etag, last_modified):
+            return self.get_not_modified_response(etag, last_modified)
+        response = await self.aget_catalog_response(
+            request, digest, *args, **kwargs
+        )
+        for header, value in self.get_validator_headers(
+            etag, last_modified
+        ).items():
+            response[header] = value
+        return response
+
+    async def aget_catalog_response(
+        self, request: Request, digest: str, *args, **kwargs
+    ) -> HttpResponseBase:
+        """
+        Асинхронно возвращает ответ со списком объектов.
+
+        Параметры:
+            request (Request): Входящий запрос.
+            digest (str): Хэш, идентифицирующий представление ответа.
+            *args: Список аргументов переменной длины.
+            **kwargs: Произвольные именованные аргументы.
+
+        Возвращает:
+            HttpResponseBase: Ответ со списком объектов.
+        """
+        key = CatalogCacheCfg.RESPONSE_KEY.format(digest=digest)
+        data = await get_catalog_cache().aget(key)
+        if data is not None:
+            record_cache(True)
+            return Response(data)
+        return await sync_to_async(self.get_catalog_response)(
+            request, digest, *args, **kwargs
+        )
@@ -1,8 +1,356 @@
 """Настройки пагинации для представлений приложения api."""
+import json
+
+from core.constants import FiltersCfg
+from django.db.models import Q
 from rest_framework import pagination
+from rest_framework.exceptions import NotFound
+
+
+class KeysetCursorPagination(pagination.CursorPagination):
+    """
+    Пагинация по курсору с позицией по всем полям сортировки.
+
+    CursorPagination из DRF хранит в курсоре значение только первого поля
+    сортировки, а объекты с тем же значением пропускает смещением, которое
+    ограничено offset_cutoff. При сортировке по неуникальному полю, например
+    по цене, это OFFSET-сканирование внутри группы одинаковых значений, а
+    группа длиннее offset_cutoff проходится с повторами без конца. Здесь
+    курсор хранит значения всех полей сортировки, последнее из которых —
+    первичный ключ, и страница выбирается условием
+    (price, pk) > (цена, pk последнего объекта) без OFFSET.
+    """
+
+    def get_ordering(self, request, queryset, view) -> tuple:
+        """
+        Возвращает сортировку, которая заканчивается первичным ключом.
+
+        Параметры:
+            request (Request): Входящий запрос.
+            queryset (QuerySet): Данные для разбиения на страницы.
+            view (APIView): Представление, выполняющее запрос.
+
+        Возвращает:
+            tuple: Поля сортировки с уникальным последним полем.
+        """
+        ordering = super().get_ordering(request, queryset, view)
+        tiebreaker = FiltersCfg.ORDERING_TIEBREAKER
+        if ordering[-1].lstrip(FiltersCfg.DESCENDING) == tiebreaker:
+            return ordering
+        if ordering[0].startswith(FiltersCfg.DESCENDING):
+            tiebreaker = FiltersCfg.DESCENDING + tiebreaker
+        return (*ordering, tiebreaker)
+
+    @staticmethod
+    def reverse_ordering(ordering: tuple) -> tuple:
+        """
+        Возвращает сортировку в обратном направлении.
+
+        Параметры:
+            ordering (tuple): Поля сортировки.
+
+        Возвращает:
+            tuple: Поля с противоположным направлением.
+        """
+        return tuple(
+            (
+                field[1:]
+                if field.startswith(FiltersCfg.DESCENDING)
+                else FiltersCfg.DESCENDING + field
+            )
+            for field in ordering
+        )
+
+    @staticmethod
+    def get_position_filter(ordering: tuple, position: list) -> Q:
+        """
+        Возвращает условие выбора объектов после позиции курсора.
+
+        Условие лексикографически сравнивает поля сортировки с позицией.
+        Отдельная граница по первому полю позволяет базе данных начать
+        чтение индекса сразу с позиции курсора.
+
+        Параметры:
+            ordering (tuple): Поля сортировки в направлении выборки.
+            position (list): Значения полей сортировки в позиции курсора.
+
+        Возвращает:
+            Q: Условие фильтрации.
+        """
+        condition = None
+        for field, value in reversed(tuple(zip(ordering, position))):
+            name = field.lstrip(FiltersCfg.DESCENDING)
+            lookup = "lt" if field.startswith(FiltersCfg.DESCENDING) else "gt"
+            after = Q(**{f"{name}__{lookup}": value})
+            if condition is not None:
+                after |= Q(**{name: value}) & condition
+            condition = after
+        if len(ordering) == 1:
+            return condition
+        first = ordering[0]
+        name = first.lstrip(FiltersCfg.DESCENDING)
+        lookup = "lte" if first.startswith(FiltersCfg.DESCENDING) else "gte"
+        return Q(**{f"{name}__{lookup}": position[0]}) & condition
+
+    def get_instance_position(self, instance) -> list:
+        """
+        Возвращает значения полей сортировки объекта.
+
+        Параметры:
+            instance (Model): Объект страницы.
+
+        Возвращает:
+            list: Значения полей сортировки в виде строк.
+        """
+        return [
+            str(getattr(instance, field.lstrip(FiltersCfg.DESCENDING)))
+            for field in self.ordering
+        ]
+
+    def get_cursor_position(self) -> list | None:
+        """
+        Возвращает позицию из курсора запроса.
+
+        Возвращает:
+            list | None: Значения полей сортировки или None без курсора.
+
+        Вызывает ошибку:
+            NotFound: Если позиция не соответствует сортировке запроса.
+        """
+        if self.cursor is None or self.cursor.position is None:
+            return None
+        try:
+            position = json.loads(self.cursor.position)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        if (
+            not isinstance(position, list)
+            or len(position) != len(self.ordering)
+            or not all(isinstance(value, str) for value in position)
+        ):
+            raise NotFound(self.invalid_cursor_message)
+        return position
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Возвращает страницу после или перед позицией курсора.
+
+        Параметры:
+            queryset (QuerySet): Данные для разбиения на страницы.
+            request (Request): Входящий запрос.
+            view (APIView): Представление, выполняющее запрос.
+
+        Возвращает:
+            list | None: Элементы страницы или None без размера страницы.
+
+        Вызывает ошибку:
+            NotFound: Если курсор некорректен.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        position = self.get_cursor_position()
+        reverse = self.cursor is not None and self.cursor.reverse
+        ordering = self.ordering
+        if reverse:
+            ordering = self.reverse_ordering(ordering)
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(
+                self.get_position_filter(ordering, position)
+            )
+        results = list(queryset[: self.page_size + 1])
+        self.page = results[: self.page_size]
+        has_following = len(results) > self.page_size
+        if reverse:
+            self.page.reverse()
+            self.has_next = position is not None
+            self.has_previous = has_following
+        else:
+            self.has_next = has_following
+            self.has_previous = position is not None
+        self.next_position = position
+        self.previous_position = position
+        if self.page:
+            self.next_position = self.get_instance_position(self.page[-1])
+            self.previous_position = self.get_instance_position(self.page[0])
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def get_position_link(self, position: list, reverse: bool) -> str:
+        """
+        Возвращает ссылку на страницу от позиции.
+
+        Параметры:
+            position (list): Значения полей сортировки.
+            reverse (bool): True для страницы перед позицией.
+
+        Возвращает:
+            str: Адрес страницы с курсором.
+        """
+        return self.encode_cursor(
+            pagination.Cursor(
+                offset=0, reverse=reverse, position=json.dumps(position)
+            )
+        )
+
+    def get_next_link(self) -> str | None:
+        """
+        Возвращает ссылку на следующую страницу.
+
+        Возвращает:
+            str | None: Адрес страницы или None на последней странице.
+        """
+        if not self.has_next:
+            return None
+        return self.get_position_link(self.next_position, reverse=False)
+
+    def get_previous_link(self) -> str | None:
+        """
+        Возвращает ссылку на предыдущую страницу.
+
+        Возвращает:
+            str | None: Адрес страницы или None на первой странице.
+        """
+        if not self.has_previous:
+            return None
+        return self.get_position_link(self.previous_position, reverse=True)
+
 
+class KeysetPaginationMixin:
+    """
+    Миксин, добавляющий к постраничной пагинации режим курсора (keyset).
+
+    Режим курсора включается параметром запроса `pagination=cursor` или
+    наличием параметра `cursor`. В этом режиме не выполняется COUNT(*) и
+    OFFSET-сканирование: следующая страница выбирается по индексированному
+    стабильному ключу, поэтому время ответа не зависит от глубины страницы.
+    Сортировка из параметра ordering сохраняется, первичный ключ делает её
+    уникальной.
+    Без этих параметров сохраняется обычная постраничная пагинация.
+
+    Параметры:
+        cursor_query_param (str): Параметр запроса с курсором.
+        mode_query_param (str): Параметр запроса для выбора режима.
+        cursor_mode (str): Значение параметра, включающее режим курсора.
+        cursor_ordering (tuple): Индексированный стабильный ключ сортировки
+    без параметра ordering.
+    """
+
+    cursor_query_param = "cursor"
+    mode_query_param = "pagination"
+    cursor_mode = "cursor"
+    cursor_ordering = ("pk",)
+    cursor_paginator = None
+
+    def is_cursor_mode(self, request) -> bool:
+        """
+        Проверяет, запрошен ли режим курсора.
+
+        Параметры:
+            request (Request): Входящий запрос.
+
+        Возвращает:
+            bool: True, если запрошена пагинация по курсору.
+        """
+        return (
+            request.query_params.get(self.mode_query_param) == self.cursor_mode
+            or self.cursor_query_param in request.query_params
+        )
+
+    def get_cursor_paginator(self) -> KeysetCursorPagination:
+        """
+        Возвращает пагинатор по курсору с настройками текущей пагинации.
+
+        Возвращает:
+            KeysetCursorPagination: Пагинатор по курсору.
+        """
+        paginator = KeysetCursorPagination()
+        paginator.page_size = self.page_size
+        paginator.page_size_query_param = self.page_size_query_param
+        paginator.max_page_size = self.max_page_size
+        paginator.cursor_query_param = self.cursor_query_param
+        paginator.ordering = self.cursor_ordering
+        return paginator
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Разбивает queryset на страницы в выбранном режиме.
+
+        Параметры:
+            queryset (QuerySet): Данные для разбиения на страницы.
+            request (Request): Входящий запрос.
+            view (APIView): Представление, выполняющее запрос.
+
+        Возвращает:
+            list: Элементы текущей страницы.
+        """
+        if self.is_cursor_mode(request):
+            self.cursor_paginator = self.get_cursor_paginator()
+            return self.cursor_paginator.paginate_queryset(
+                queryset, request, view
+            )
+        self.cursor_paginator = None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        """
+        Возвращает ответ со страницей данных в выбранном режиме.
+
+        Параметры:
+            data (list): Сериализованные элементы страницы.
+
+        Возвращает:
+            Response: Ответ со ссылками на соседние страницы.
+        """
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
 
-class ProductCategoryPagination(pagination.PageNumberPagination):
+    def get_schema_operation_parameters(self, view) -> list:
+        """
+        Возвращает параметры запроса для документации API.
+
+        Параметры:
+            view (APIView): Представление с пагинацией.
+
+        Возвращает:
+            list: Параметры обоих режимов пагинации.
+        """
+        cursor_parameters = [
+            parameter
+            for parameter in (
+                self.get_cursor_paginator().get_schema_operation_parameters(
+                    view
+                )
+            )
+            if parameter["name"] == self.cursor_query_param
+        ]
+        mode_parameter = {
+            "name": self.mode_query_param,
+            "required": False,
+            "in": "query",
+            "description": (
+                "Режим пагинации: `cursor` включает пагинацию по курсору "
+                "без COUNT(*) и OFFSET."
+            ),
+            "schema": {"type": "string", "enum": [self.cursor_mode]},
+        }
+        return (
+            super().get_schema_operation_parameters(view)
+            + cursor_parameters
+            + [mode_parameter]
+        )
+
+
+class ProductCategoryPagination(
+    KeysetPaginationMixin, pagination.PageNumberPagination
+):
     """
     Пагинация для категорий продуктов.
 
@@ -10,13 +358,17 @@ class ProductCategoryPagination(pagination.PageNumberPagination):
         page_size (int): Количество элементов на одной странице по умолчанию.
         page_size_query_param (str): Параметр запроса для указания количества
     элементов на странице.
+        max_page_size (int): Максимальное количество элементов на странице.
     """
 
     page_size = 5
     page_size_query_param = "page_size"
+    max_page_size = 50
 
 
-class ProductPagination(pagination.PageNumberPagination):
+class ProductPagination(
+    KeysetPaginationMixin, pagination.PageNumberPagination
+):
     """
     Пагинация для продуктов.
 
@@ -24,7 +376,28 @@ class ProductPagination(pagination.PageNumberPagination):
         page_size (int): Количество элементов на одной странице по умолчанию.
         page_size_query_param (str): Параметр запроса для указания количества
     элементов на странице.
+        max_page_size (int): Максимальное количество элементов на странице.
+    """
+
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class ProductSearchPagination(pagination.PageNumberPagination):
+    """
+    Пагинация для результатов поиска продуктов.
+
+    Результаты упорядочены по релевантности, поэтому поддерживается только
+    постраничная пагинация.
+
+    Параметры:
+        page_size (int): Количество элементов на одной странице по умолчанию.
+        page_size_query_param (str): Параметр запроса для указания количества
+    элементов на странице.
+        max_page_size (int): Максимальное количество элементов на странице.
     """
 
     page_size = 10
     page_size_query_param = "page_size"
+    max_page_size = 100
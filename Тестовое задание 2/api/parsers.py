@@ -0,0 +1,55 @@
+"""Модуль с парсерами приложения api."""
+
+import codecs
+import io
+import re
+
+from api.renderers import JSONRenderer, is_fast_json_enabled, orjson
+from core.constants import JSONCfg
+from django.conf import settings
+from rest_framework import parsers
+
+
+class JSONParser(parsers.JSONParser):
+    """
+    JSONParser на orjson.
+
+    Тело запроса в UTF-8 разбирается orjson. Стандартный JSONParser
+    используется, если orjson не установлен или отключён, тело в другой
+    кодировке, в теле есть числа из 19 и более цифр (orjson превращает
+    целые числа больше 64 бит в float) или orjson не смог разобрать тело
+    (NaN, ошибки синтаксиса), поэтому результат и тексты ошибок не
+    меняются.
+    """
+
+    renderer_class = JSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Возвращает данные, разобранные из JSON-тела запроса.
+
+        Параметры:
+            stream: Поток с телом запроса.
+            media_type (str): Тип содержимого запроса.
+            parser_context (dict): Контекст представления.
+
+        Возвращает:
+            Разобранные данные.
+
+        Вызывает ошибку:
+            ParseError: Если тело запроса не является корректным JSON.
+        """
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if (
+            not is_fast_json_enabled()
+            or codecs.lookup(encoding).name != JSONCfg.ENCODING
+        ):
+            return super().parse(stream, media_type, parser_context)
+        content = stream.read()
+        if not re.search(JSONCfg.LONG_INTEGER_PATTERN, content):
+            try:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError:
+                pass
+        return super().parse(io.BytesIO(content), media_type, parser_context)
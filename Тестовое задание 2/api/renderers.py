@@ -0,0 +1,103 @@
+"""Модуль с рендерерами приложения api."""
+
+from core.constants import JSONCfg
+from core.metrics import record_serialization
+from django.conf import settings
+from rest_framework import renderers
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def is_fast_json_enabled() -> bool:
+    """
+    Проверяет, используется ли orjson для JSON.
+
+    Возвращает:
+        bool: True, если orjson установлен и не отключён настройкой
+        FAST_JSON.
+    """
+    return orjson is not None and settings.FAST_JSON
+
+
+class JSONRenderer(renderers.JSONRenderer):
+    """
+    JSONRenderer на orjson, учитывающий время рендеринга в метриках запроса.
+
+    Вывод совпадает с выводом стандартного JSONRenderer побайтно: кириллица
+    не экранируется, Decimal, даты и прочие типы преобразуются encoder_class,
+    а символы U+2028 и U+2029 экранируются. Отличается только запись float
+    в экспоненциальной форме (1e16 вместо 1e+16), значение при этом то же.
+    Стандартный JSONRenderer используется, если orjson не установлен или
+    отключён, запрошен отступ, выключены UNICODE_JSON или COMPACT_JSON, а
+    также для данных, которые orjson не поддерживает, например целых чисел
+    больше 64 бит.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Возвращает JSON-представление данных.
+
+        Параметры:
+            data: Данные ответа.
+            accepted_media_type (str): Согласованный тип содержимого.
+            renderer_context (dict): Контекст представления.
+
+        Возвращает:
+            bytes: JSON-представление данных.
+        """
+        with record_serialization():
+            if data is not None and self.is_fast(
+                accepted_media_type, renderer_context or {}
+            ):
+                try:
+                    return self.fast_render(data)
+                except orjson.JSONEncodeError:
+                    pass
+            return super().render(data, accepted_media_type, renderer_context)
+
+    def is_fast(
+        self, accepted_media_type: str, renderer_context: dict
+    ) -> bool:
+        """
+        Проверяет, можно ли рендерить данные через orjson.
+
+        Параметры:
+            accepted_media_type (str): Согласованный тип содержимого.
+            renderer_context (dict): Контекст представления.
+
+        Возвращает:
+            bool: True, если orjson даст тот же вывод, что и json.
+        """
+        return (
+            is_fast_json_enabled()
+            and not self.ensure_ascii
+            and self.compact
+            and self.get_indent(accepted_media_type, renderer_context) is None
+        )
+
+    def fast_render(self, data) -> bytes:
+        """
+        Возвращает JSON-представление данных, построенное orjson.
+
+        Параметры:
+            data: Данные ответа.
+
+        Возвращает:
+            bytes: JSON-представление данных.
+
+        Вызывает ошибку:
+            orjson.JSONEncodeError: Если данные не поддерживаются orjson.
+        """
+        content = orjson.dumps(
+            data,
+            default=self.encoder_class().default,
+            option=orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+        if JSONCfg.SEPARATORS_PREFIX in content:
+            for separator, escaped in JSONCfg.ESCAPED_SEPARATORS:
+                content = content.replace(separator, escaped)
+        return content
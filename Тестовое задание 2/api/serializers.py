@@ -1,7 +1,13 @@
 """Модуль для работы с сериалайзерами приложения api."""
 
-from core.constants import REQUEST, SerializersCfg
+from collections import defaultdict
+from decimal import Decimal
+
+from core.constants import REQUEST, CartItemCfg, ProductCfg, SerializersCfg
 from django.conf import settings
+from django.db.models import QuerySet
+from django.utils.encoding import filepath_to_uri
+from django.utils.functional import cached_property
 from rest_framework import serializers
 from rest_framework.request import Request
 from store.models import (
@@ -13,6 +19,57 @@ from store.models import (
 )
 
 
+def get_media_url(request) -> str | None:
+    """
+    Возвращает базовый адрес медиафайлов для ответа на запрос.
+
+    Если задана настройка MEDIA_CDN_URL, используется она, иначе MEDIA_URL
+    дополняется схемой и хостом запроса.
+
+    Параметры:
+        request: Запрос из контекста сериализатора.
+
+    Возвращает:
+        str | None: Базовый адрес медиафайлов или None, если запрос не
+    передан.
+    """
+    if not isinstance(request, Request):
+        return None
+    if settings.MEDIA_CDN_URL:
+        return settings.MEDIA_CDN_URL
+    return request.build_absolute_uri(settings.MEDIA_URL)
+
+
+def get_image_urls(
+    media_url: str | None,
+    image_name: str,
+    thumbnail_name: str,
+    preview_name: str,
+) -> list:
+    """
+    Возвращает адреса изображения, миниатюры и превью продукта.
+
+    Адреса строятся из сохранённых путей без обращения к хранилищу файлов.
+    Пока миниатюра и превью не созданы, вместо них выводится исходное
+    изображение.
+
+    Параметры:
+        media_url (str | None): Базовый адрес медиафайлов.
+        image_name (str): Путь к изображению.
+        thumbnail_name (str): Путь к миниатюре.
+        preview_name (str): Путь к превью.
+
+    Возвращает:
+        list: Список адресов или пустой список, если базовый адрес не задан.
+    """
+    if media_url is None:
+        return []
+    return [
+        media_url + filepath_to_uri(name or image_name)
+        for name in (image_name, thumbnail_name, preview_name)
+    ]
+
+
 class ProductSubCategorySerializer(serializers.ModelSerializer):
     """
     Сериализатор для модели ProductSubCategory.
@@ -96,20 +153,198 @@ class ProductSerializer(serializers.ModelSerializer):
         """
         Возвращает список URL-адресов изображений продукта.
 
+        Адреса строятся из сохранённых в продукте путей к изображению,
+        миниатюре и превью и базового адреса медиафайлов, вычисленного один
+        раз для всего списка, поэтому вывод не обращается к хранилищу файлов
+        и не создаёт изображения.
+
         Параметры:
             obj (Product): Экземпляр модели Product.
 
         Возвращает:
             list: Список URL-адресов изображений.
         """
-        request = self.context.get(REQUEST)
-        if not isinstance(request, Request):
+        return get_image_urls(
+            self.media_url,
+            obj.image.name,
+            obj.thumbnail_name,
+            obj.preview_name,
+        )
+
+    @cached_property
+    def media_url(self) -> str | None:
+        """Возвращает базовый адрес медиафайлов, общий для всего списка."""
+        return get_media_url(self.context.get(REQUEST))
+
+
+class FastSerializer:
+    """
+    Базовый класс быстрых сериализаторов только для чтения.
+
+    Быстрые сериализаторы строят вывод напрямую из именованных кортежей,
+    полученных через values_list, без создания экземпляров моделей и
+    привязки полей. Вывод совпадает с выводом соответствующего
+    ModelSerializer.
+
+    Атрибуты:
+        row_fields (tuple): Поля, выбираемые из базы данных для строки.
+    """
+
+    row_fields = ()
+
+    def __init__(self, instance, context: dict = None):
+        """
+        Инициализирует сериализатор.
+
+        Параметры:
+            instance: Строки, полученные методом get_rows.
+            context (dict): Контекст сериализатора.
+        """
+        self.instance = instance
+        self.context = context or {}
+
+    @classmethod
+    def get_rows(cls, queryset: QuerySet) -> QuerySet:
+        """
+        Возвращает QuerySet именованных кортежей для сериализации.
+
+        Параметры:
+            queryset (QuerySet): Исходный QuerySet.
+
+        Возвращает:
+            QuerySet: Именованные кортежи с полями row_fields.
+        """
+        return queryset.values_list(*cls.row_fields, named=True)
+
+    @cached_property
+    def data(self) -> list:
+        """Возвращает список представлений строк."""
+        return self.to_representation(self.instance)
+
+    def to_representation(self, rows) -> list:
+        """
+        Возвращает список представлений строк.
+
+        Параметры:
+            rows: Строки, полученные методом get_rows.
+
+        Возвращает:
+            list: Список представлений строк.
+        """
+        raise NotImplementedError
+
+
+class FastProductSerializer(FastSerializer):
+    """
+    Быстрый сериализатор продуктов.
+
+    Вывод совпадает с выводом ProductSerializer: названия категории и
+    подкатегории выбираются JOIN-запросом, цена форматируется полем
+    DecimalField с теми же параметрами, а базовый адрес медиафайлов
+    вычисляется один раз для всего списка.
+    """
+
+    row_fields = SerializersCfg.FAST_PRODUCT_ROW_FIELDS
+    price_field = serializers.DecimalField(
+        max_digits=ProductCfg.PRICE_MAX_DIGITS,
+        decimal_places=ProductCfg.PRICE_DECIMAL_PLACES,
+    )
+
+    def to_representation(self, rows) -> list:
+        """
+        Возвращает список представлений продуктов.
+
+        Параметры:
+            rows: Строки продуктов, полученные методом get_rows.
+
+        Возвращает:
+            list: Список представлений продуктов.
+        """
+        fields = SerializersCfg.PRODUCT_SERIALIZER_META_FIELDS
+        price = self.price_field.to_representation
+        media_url = get_media_url(self.context.get(REQUEST))
+        data = []
+        for row in rows:
+            images = get_image_urls(
+                media_url, row.image, row.thumbnail_name, row.preview_name
+            )
+            data.append(
+                dict(
+                    zip(
+                        fields,
+                        (
+                            row.title,
+                            row.slug,
+                            row.product_category__title,
+                            row.product_subcategory__title,
+                            price(row.price),
+                            images,
+                        ),
+                    )
+                )
+            )
+        return data
+
+
+class FastProductCategorySerializer(FastSerializer):
+    """
+    Быстрый сериализатор категорий продуктов с подкатегориями.
+
+    Вывод совпадает с выводом ProductCategorySerializer. Подкатегории всех
+    категорий списка выбираются одним запросом.
+    """
+
+    row_fields = SerializersCfg.FAST_PRODUCT_CATEGORY_ROW_FIELDS
+
+    @classmethod
+    def get_rows(cls, queryset: QuerySet) -> QuerySet:
+        """
+        Возвращает QuerySet именованных кортежей для сериализации.
+
+        Параметры:
+            queryset (QuerySet): Исходный QuerySet.
+
+        Возвращает:
+            QuerySet: Именованные кортежи с полями row_fields.
+        """
+        return super().get_rows(queryset.prefetch_related(None))
+
+    def to_representation(self, rows) -> list:
+        """
+        Возвращает список представлений категорий.
+
+        Параметры:
+            rows: Строки категорий, полученные методом get_rows.
+
+        Возвращает:
+            list: Список представлений категорий.
+        """
+        rows = list(rows)
+        if not rows:
             return []
-        base_url = request.build_absolute_uri(settings.MEDIA_URL)
+        subcategory_fields = (
+            SerializersCfg.PRODUCT_SUBCATEGORY_SERIALIZER_META_FIELDS
+        )
+        subcategory_rows = (
+            ProductSubCategory.objects.filter(
+                **{
+                    SerializersCfg.FAST_PRODUCT_SUBCATEGORY_FILTER: [
+                        row.pk for row in rows
+                    ]
+                }
+            )
+            .order_by(*SerializersCfg.CATEGORY_TREE_SUBCATEGORY_ORDER)
+            .values_list(*SerializersCfg.CATEGORY_TREE_SUBCATEGORY_FIELDS)
+        )
+        subcategories = defaultdict(list)
+        for category_id, *values in subcategory_rows:
+            subcategories[category_id].append(
+                dict(zip(subcategory_fields, values))
+            )
+        fields = SerializersCfg.PRODUCT_CATEGORY_SERIALIZER_META_FIELDS
         return [
-            base_url + str(obj.image),
-            base_url + str(obj.thumbnail),
-            base_url + str(obj.preview),
+            dict(zip(fields, (row.title, row.slug, subcategories[row.pk])))
+            for row in rows
         ]
 
 
@@ -163,6 +398,52 @@ class ShortCartItemSerializer(serializers.ModelSerializer):
         fields = SerializersCfg.SHORT_CART_ITEM_SERIALIZER_META_FIELDS
 
 
+class CartBatchOperationSerializer(serializers.Serializer):
+    """
+    Сериализатор для операции пакетного изменения корзины.
+
+    Поля:
+    - product: Наименование продукта.
+    - op: Операция с продуктом (add, update или remove).
+    - quantity: Количество продукта (для add по умолчанию 1, для update
+    обязательно, для remove не используется).
+    """
+
+    product = serializers.CharField()
+    op = serializers.ChoiceField(choices=SerializersCfg.CART_BATCH_OPERATIONS)
+    quantity = serializers.IntegerField(
+        required=False, min_value=SerializersCfg.QUANTITY_MIN_VALUE
+    )
+
+    def validate(self, attrs: dict) -> dict:
+        """
+        Проверяет наличие количества для операций, которым оно необходимо.
+
+        Параметры:
+            attrs (dict): Данные операции.
+
+        Возвращает:
+            dict: Данные операции с количеством по умолчанию для add.
+
+        Вызывает ошибку:
+            ValidationError: Если для операции update не указано количество.
+        """
+        op = attrs[SerializersCfg.OP]
+        if op == SerializersCfg.CART_BATCH_OP_ADD:
+            attrs.setdefault(
+                SerializersCfg.QUANTITY, SerializersCfg.QUANTITY_DEFAULT
+            )
+        elif (
+            op == SerializersCfg.CART_BATCH_OP_UPDATE
+            and SerializersCfg.QUANTITY not in attrs
+        ):
+            message = SerializersCfg.CART_BATCH_QUANTITY_REQUIRED_ERROR
+            raise serializers.ValidationError(
+                {SerializersCfg.QUANTITY: message.format(op=op)}
+            )
+        return attrs
+
+
 class CartSerializer(serializers.ModelSerializer):
     """
     Сериализатор для модели Cart.
@@ -191,7 +472,29 @@ class CartSerializer(serializers.ModelSerializer):
         fields = SerializersCfg.CART_SERIALIZER_META_FIELDS
 
     @staticmethod
-    def get_total_quantity(obj):
+    def get_totals(obj: Cart) -> dict:
+        """
+        Возвращает итоги корзины.
+
+        Если корзина получена через Cart.objects.with_contents(), итоги уже
+        подсчитаны в базе данных. Иначе они подсчитываются одним
+        агрегирующим запросом и сохраняются в объекте корзины.
+
+        Параметры:
+        - obj (Cart): Объект корзины.
+
+        Возвращает:
+        - dict: Общее количество и общая стоимость товаров в корзине.
+        """
+        if not hasattr(obj, CartItemCfg.TOTAL_QUANTITY):
+            for name, value in obj.items.totals().items():
+                setattr(obj, name, value)
+        return {
+            CartItemCfg.TOTAL_QUANTITY: obj.total_quantity,
+            CartItemCfg.TOTAL_PRICE: obj.total_price,
+        }
+
+    def get_total_quantity(self, obj: Cart) -> int:
         """
         Возвращает общее количество товаров в корзине.
 
@@ -201,10 +504,9 @@ class CartSerializer(serializers.ModelSerializer):
         Возвращает:
         - int: Общее количество товаров в корзине.
         """
-        return sum(item.quantity for item in obj.items.all())
+        return self.get_totals(obj)[CartItemCfg.TOTAL_QUANTITY]
 
-    @staticmethod
-    def get_total_price(obj):
+    def get_total_price(self, obj: Cart) -> Decimal | int:
         """
         Возвращает общую стоимость товаров в корзине.
 
@@ -212,8 +514,10 @@ class CartSerializer(serializers.ModelSerializer):
         - obj (Cart): Объект корзины.
 
         Возвращает:
-        - float: Общая стоимость товаров в корзине.
+        - Decimal | int: Общая стоимость товаров в корзине, для корзины без
+        товаров целое число 0.
         """
-        return sum(
-            item.product.price * item.quantity for item in obj.items.all()
-        )
+        total_price = self.get_totals(obj)[CartItemCfg.TOTAL_PRICE]
+        if total_price is None:
+            return CartItemCfg.TOTAL_PRICE_DEFAULT
+        return total_price
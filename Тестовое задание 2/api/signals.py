@@ -0,0 +1,42 @@
+"""Модуль для обработки сигналов приложения api."""
+
+from api.authentication import revoke_cached_token
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+
+@receiver(post_save, sender=Token)
+@receiver(post_delete, sender=Token)
+def revoke_token(sender, instance, created=False, **kwargs):
+    """
+    Отзывает закэшированный токен при его изменении или удалении.
+
+    Только что созданный токен ещё не может быть в кэше.
+
+    Параметры:
+        sender: Класс модели, отправляющий сигнал.
+        instance: Экземпляр токена.
+        created (bool): Создан ли токен при сохранении.
+        **kwargs: Дополнительные аргументы.
+    """
+    if not created:
+        revoke_cached_token(instance.key)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def revoke_user_tokens(sender, instance, **kwargs):
+    """
+    Отзывает закэшированные токены пользователя при его изменении.
+
+    Параметры:
+        sender: Класс модели, отправляющий сигнал.
+        instance: Экземпляр пользователя.
+        **kwargs: Дополнительные аргументы.
+    """
+    for key in Token.objects.filter(user_id=instance.pk).values_list(
+        "key", flat=True
+    ):
+        revoke_cached_token(key)
@@ -0,0 +1,95 @@
+"""Модуль для работы с предрассчитанными снимками каталога."""
+
+from typing import NamedTuple
+
+from api.renderers import JSONRenderer
+from api.serializers import FastProductCategorySerializer
+from asgiref.sync import sync_to_async
+from core.constants import CatalogCacheCfg
+from core.metrics import record_cache
+from core.routers import allow_replica_reads
+from store.cache import (
+    aget_catalog_version_tag,
+    get_catalog_cache,
+    get_catalog_version_tag,
+)
+from store.models import ProductCategory, ProductSubCategory
+
+
+class CategoryTree(NamedTuple):
+    """
+    Снимок дерева категорий с подкатегориями.
+
+    Атрибуты:
+        items (tuple): JSON-представления категорий в порядке вывода.
+        content (bytes): JSON-представление всего дерева.
+    """
+
+    items: tuple
+    content: bytes
+
+
+def build_category_tree() -> CategoryTree:
+    """
+    Строит снимок дерева категорий двумя запросами к базе данных.
+
+    Представление категорий строится FastProductCategorySerializer и
+    совпадает с выводом ProductCategorySerializer.
+
+    Возвращает:
+        CategoryTree: Снимок дерева категорий.
+    """
+    rows = FastProductCategorySerializer.get_rows(
+        ProductCategory.objects.all()
+    )
+    renderer = JSONRenderer()
+    items = tuple(
+        renderer.render(category)
+        for category in FastProductCategorySerializer(rows).data
+    )
+    return CategoryTree(items=items, content=b"[" + b",".join(items) + b"]")
+
+
+def get_category_tree() -> CategoryTree:
+    """
+    Возвращает актуальный снимок дерева категорий.
+
+    Снимок хранится в кэше каталога вместе с версиями категорий и
+    подкатегорий и перестраивается только после их изменения. Снимок
+    строится из основной базы данных: отстающая реплика закэшировала бы
+    под новой версией устаревшие данные до следующего изменения каталога.
+
+    Возвращает:
+        CategoryTree: Снимок дерева категорий.
+    """
+    version = get_catalog_version_tag(ProductCategory, ProductSubCategory)
+    cache = get_catalog_cache()
+    cached = cache.get(CatalogCacheCfg.CATEGORY_TREE_KEY)
+    is_hit = cached is not None and cached[0] == version
+    record_cache(is_hit)
+    if is_hit:
+        return cached[1]
+    with allow_replica_reads(False):
+        tree = build_category_tree()
+    cache.set(CatalogCacheCfg.CATEGORY_TREE_KEY, (version, tree), timeout=None)
+    return tree
+
+
+async def aget_category_tree() -> CategoryTree:
+    """
+    Асинхронно возвращает актуальный снимок дерева категорий.
+
+    Снимок из кэша возвращается без выделения потока, перестроение снимка
+    выполняется в потоке.
+
+    Возвращает:
+        CategoryTree: Снимок дерева категорий.
+    """
+    version = await aget_catalog_version_tag(
+        ProductCategory, ProductSubCategory
+    )
+    cached = await get_catalog_cache().aget(CatalogCacheCfg.CATEGORY_TREE_KEY)
+    if cached is not None and cached[0] == version:
+        record_cache(True)
+        return cached[1]
+    return await sync_to_async(get_category_tree)()
@@ -0,0 +1,22 @@
+"""Маршруты API с асинхронными представлениями для тестов."""
+
+from api.async_views import (
+    AsyncCartViewSet,
+    AsyncProductCategoryViewSet,
+    AsyncProductViewSet,
+)
+from django.urls import include, path
+from rest_framework.routers import DefaultRouter
+
+router = DefaultRouter()
+router.register(
+    prefix=r"product_categories",
+    viewset=AsyncProductCategoryViewSet,
+    basename="product_categories",
+)
+router.register(
+    prefix=r"products", viewset=AsyncProductViewSet, basename="products"
+)
+router.register(prefix=r"cart", viewset=AsyncCartViewSet, basename="cart")
+
+urlpatterns = [path("api/v1/", include(router.urls))]
@@ -0,0 +1,219 @@
+"""Тесты асинхронных представлений API."""
+
+from unittest import mock
+
+from api.tests.utils import create_products, create_user
+from asgiref.sync import iscoroutinefunction
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.urls import resolve, reverse
+from store.models import CartItem
+
+
+@override_settings(ROOT_URLCONF="api.tests.async_urls")
+class AsyncViewsTests(TestCase):
+    """
+    Проверяет асинхронные представления через асинхронный клиент.
+
+    Маршруты api.urls выбираются по ASYNC_API_VIEWS при импорте, поэтому
+    тесты используют отдельные маршруты с асинхронными представлениями.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создаёт продукты и пользователя с одним продуктом в корзине."""
+        cls.first, cls.second, cls.third = create_products(3)
+        cls.user, cls.authorization = create_user("buyer", [cls.first])
+
+    def setUp(self):
+        """Очищает кэши, чтобы первый ответ строился из базы данных."""
+        for cache in caches.all():
+            cache.clear()
+
+    async def cart(self, action: str, data=None, method: str = "post"):
+        """
+        Выполняет действие корзины асинхронным клиентом.
+
+        Параметры:
+            action (str): Имя маршрута действия корзины.
+            data: Тело запроса.
+            method (str): HTTP-метод.
+
+        Возвращает:
+            HttpResponse: Ответ на запрос.
+        """
+        return await getattr(self.async_client, method)(
+            reverse(f"cart-{action}"),
+            data,
+            content_type="application/json",
+            headers={"Authorization": self.authorization},
+        )
+
+    async def aget_quantities(self) -> dict:
+        """
+        Асинхронно возвращает количества продуктов в корзине.
+
+        Возвращает:
+            dict: Количества по наименованиям продуктов.
+        """
+        return {
+            title: quantity
+            async for title, quantity in CartItem.objects.filter(
+                cart__user=self.user
+            ).values_list("product__title", "quantity")
+        }
+
+    @staticmethod
+    def get_items(response) -> dict:
+        """
+        Возвращает количества продуктов из ответа корзины.
+
+        Параметры:
+            response (HttpResponse): Ответ с содержимым корзины.
+
+        Возвращает:
+            dict: Количества по наименованиям продуктов.
+        """
+        return {
+            item["product"]: item["quantity"]
+            for item in response.json()["items"]
+        }
+
+    def test_routes_are_async(self):
+        """Маршруты ведут на асинхронные функции представлений."""
+        for name in ("products-list", "product_categories-list", "cart-list"):
+            with self.subTest(name=name):
+                self.assertTrue(
+                    iscoroutinefunction(resolve(reverse(name)).func)
+                )
+
+    async def test_products_list(self):
+        """Список продуктов отдаётся с валидаторами кэширования."""
+        response = await self.async_client.get(reverse("products-list"))
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["count"], 3)
+        self.assertEqual(
+            [product["title"] for product in data["results"]],
+            sorted(
+                product.title
+                for product in (self.first, self.second, self.third)
+            ),
+        )
+        self.assertIn("ETag", response)
+        self.assertIn("Last-Modified", response)
+
+    async def test_products_list_from_cache(self):
+        """Повторный запрос отдаётся из кэша без построения ответа."""
+        url = reverse("products-list")
+        with mock.patch("api.mixins.record_cache") as record_cache:
+            first = await self.async_client.get(url)
+            second = await self.async_client.get(url)
+        self.assertEqual(
+            record_cache.call_args_list, [mock.call(False), mock.call(True)]
+        )
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(second["ETag"], first["ETag"])
+
+    async def test_categories_list_from_cache(self):
+        """Снимок дерева категорий для списка берётся из кэша."""
+        url = reverse("product_categories-list")
+        with mock.patch("api.snapshots.record_cache") as record_cache:
+            first = await self.async_client.get(url)
+            second = await self.async_client.get(url)
+        self.assertEqual(
+            record_cache.call_args_list, [mock.call(False), mock.call(True)]
+        )
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json(), first.json())
+
+    async def test_not_modified(self):
+        """С текущим ETag в If-None-Match возвращается 304 без тела."""
+        url = reverse("products-list")
+        etag = (await self.async_client.get(url))["ETag"]
+        response = await self.async_client.get(
+            url, headers={"If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], etag)
+        response = await self.async_client.get(
+            url, headers={"If-None-Match": '"stale"'}
+        )
+        self.assertEqual(response.status_code, 200)
+
+    async def test_invalid_query_before_not_modified(self):
+        """Некорректный фильтр даёт 400 даже с If-None-Match: *."""
+        response = await self.async_client.get(
+            reverse("products-list") + "?price_min=abc",
+            headers={"If-None-Match": "*"},
+        )
+        self.assertEqual(response.status_code, 400)
+
+    async def test_cart_list(self):
+        """Список корзины требует токен и возвращает её содержимое."""
+        response = await self.async_client.get(reverse("cart-list"))
+        self.assertEqual(response.status_code, 401)
+        response = await self.async_client.get(
+            reverse("cart-list"),
+            headers={"Authorization": self.authorization},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.get_items(response), {self.first.title: 1})
+
+    async def test_cart_mutations(self):
+        """Действия корзины изменяют её и возвращают итоговое содержимое."""
+        response = await self.cart(
+            "add-item", {"product": self.second.title, "quantity": 2}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self.get_items(response),
+            {self.first.title: 1, self.second.title: 2},
+        )
+        response = await self.cart(
+            "update-item",
+            {"product": self.first.title, "quantity": 5},
+            method="patch",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self.get_items(response),
+            {self.first.title: 5, self.second.title: 2},
+        )
+        response = await self.cart(
+            "remove-item", {"product": self.second.title}, method="delete"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.get_items(response), {self.first.title: 5})
+        response = await self.cart(
+            "batch",
+            [
+                {"product": self.third.title, "op": "add", "quantity": 3},
+                {"product": self.first.title, "op": "remove"},
+            ],
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.get_items(response), {self.third.title: 3})
+        self.assertEqual(response.json()["total_quantity"], 3)
+        response = await self.cart("clear-cart", method="delete")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.get_items(response), {})
+        self.assertEqual(await self.aget_quantities(), {})
+
+    async def test_cart_errors(self):
+        """Ошибки проверки возвращаются как 400, корзина не меняется."""
+        response = await self.cart("add-item", {"product": "missing"})
+        self.assertEqual(response.status_code, 400)
+        response = await self.cart(
+            "update-item",
+            {"product": self.second.title, "quantity": 2},
+            method="patch",
+        )
+        self.assertEqual(response.status_code, 400)
+        response = await self.cart(
+            "remove-item", {"product": self.third.title}, method="delete"
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(await self.aget_quantities(), {self.first.title: 1})
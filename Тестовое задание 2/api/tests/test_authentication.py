@@ -0,0 +1,100 @@
+"""Тесты аутентификации по токену с кэшированием."""
+
+from unittest import mock
+
+from api.authentication import get_token_cache, get_token_cache_key
+from api.tests.utils import create_user
+from core.constants import AuthenticationCfg
+from django.core.cache import caches
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+
+class CachedTokenAuthenticationTests(TestCase):
+    """Проверяет кэширование токенов и их отзыв сигналами."""
+
+    def setUp(self):
+        """Очищает кэши и создаёт пользователя с токеном."""
+        for cache in caches.all():
+            cache.clear()
+        self.client = APIClient()
+        self.user, self.authorization = create_user("buyer")
+        self.key = self.authorization.split()[1]
+
+    def get_cart(self):
+        """
+        Запрашивает корзину с токеном пользователя.
+
+        Возвращает:
+            Response: Ответ на запрос.
+        """
+        return self.client.get(
+            reverse("cart-list"), HTTP_AUTHORIZATION=self.authorization
+        )
+
+    def get_cached(self):
+        """
+        Возвращает запись о токене в кэше аутентификации.
+
+        Возвращает:
+            Пара (пользователь, токен), отметка об отзыве или None.
+        """
+        return get_token_cache().get(get_token_cache_key(self.key))
+
+    def test_token_cached(self):
+        """После первого запроса токен проверяется без базы данных."""
+        self.assertEqual(self.get_cart().status_code, 200)
+        user, token = self.get_cached()
+        self.assertEqual((user.pk, token.key), (self.user.pk, self.key))
+        with mock.patch.object(
+            TokenAuthentication, "authenticate_credentials"
+        ) as authenticate_credentials:
+            self.assertEqual(self.get_cart().status_code, 200)
+        authenticate_credentials.assert_not_called()
+
+    def test_token_deleted(self):
+        """После удаления токена следующий запрос получает 401."""
+        self.assertEqual(self.get_cart().status_code, 200)
+        Token.objects.get(key=self.key).delete()
+        self.assertEqual(self.get_cached(), AuthenticationCfg.REVOKED)
+        self.assertEqual(self.get_cart().status_code, 401)
+
+    def test_user_deactivated(self):
+        """После деактивации пользователя следующий запрос получает 401."""
+        self.assertEqual(self.get_cart().status_code, 200)
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.get_cart().status_code, 401)
+
+    def test_user_deleted(self):
+        """После удаления пользователя следующий запрос получает 401."""
+        self.assertEqual(self.get_cart().status_code, 200)
+        self.user.delete()
+        self.assertEqual(self.get_cart().status_code, 401)
+
+    def test_revoked_marker_blocks_racing_request(self):
+        """
+        Запрос, прочитавший токен до удаления, не возвращает его в кэш.
+
+        Токен удаляется между чтением из базы данных и записью в кэш, как
+        при выходе пользователя во время параллельного запроса.
+        """
+        read_credentials = TokenAuthentication.authenticate_credentials
+
+        def delete_after_read(authentication, key):
+            credentials = read_credentials(authentication, key)
+            Token.objects.get(key=key).delete()
+            return credentials
+
+        with mock.patch.object(
+            TokenAuthentication,
+            "authenticate_credentials",
+            autospec=True,
+            side_effect=delete_after_read,
+        ):
+            self.assertEqual(self.get_cart().status_code, 200)
+        self.assertEqual(self.get_cached(), AuthenticationCfg.REVOKED)
+        self.assertEqual(self.get_cart().status_code, 401)
@@ -0,0 +1,107 @@
+"""Тесты пакетного изменения корзины."""
+
+from api.tests.utils import create_products, create_user
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from store.models import CartItem
+
+
+class CartBatchTests(TestCase):
+    """Проверяет применение операций пакетного изменения корзины."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создаёт продукты и пользователя с одним продуктом в корзине."""
+        cls.first, cls.second, cls.third = create_products(3)
+        cls.user, cls.authorization = create_user("buyer", [cls.first])
+
+    def setUp(self):
+        """Создаёт клиент API."""
+        self.client = APIClient()
+
+    def batch(self, *operations: dict):
+        """
+        Отправляет пакет операций.
+
+        Параметры:
+            *operations (dict): Операции пакета.
+
+        Возвращает:
+            Response: Ответ на запрос.
+        """
+        return self.client.post(
+            reverse("cart-batch"),
+            list(operations),
+            format="json",
+            HTTP_AUTHORIZATION=self.authorization,
+        )
+
+    def get_quantities(self) -> dict:
+        """
+        Возвращает количества продуктов в корзине.
+
+        Возвращает:
+            dict: Количества по наименованиям продуктов.
+        """
+        return dict(
+            CartItem.objects.filter(cart__user=self.user).values_list(
+                "product__title", "quantity"
+            )
+        )
+
+    def test_operations_applied_in_order(self):
+        """Операции применяются по порядку, в ответе итоговая корзина."""
+        response = self.batch(
+            {"product": self.second.title, "op": "add", "quantity": 2},
+            {"product": self.second.title, "op": "add"},
+            {"product": self.first.title, "op": "update", "quantity": 5},
+            {"product": self.third.title, "op": "add", "quantity": 4},
+            {"product": self.third.title, "op": "remove"},
+            {"product": self.first.title, "op": "add", "quantity": 1},
+        )
+        self.assertEqual(response.status_code, 200)
+        expected = {self.first.title: 6, self.second.title: 3}
+        self.assertEqual(self.get_quantities(), expected)
+        self.assertEqual(
+            {
+                item["product"]: item["quantity"]
+                for item in response.data["items"]
+            },
+            expected,
+        )
+        self.assertEqual(response.data["total_quantity"], 9)
+
+    def test_remove_then_add(self):
+        """Удалённый в пакете продукт можно добавить заново."""
+        response = self.batch(
+            {"product": self.first.title, "op": "remove"},
+            {"product": self.first.title, "op": "add", "quantity": 2},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.get_quantities(), {self.first.title: 2})
+
+    def test_missing_product(self):
+        """Несуществующий продукт отклоняет весь пакет."""
+        response = self.batch(
+            {"product": self.second.title, "op": "add"},
+            {"product": "Несуществующий продукт", "op": "add"},
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.get_quantities(), {self.first.title: 1})
+
+    def test_absent_item(self):
+        """Изменение и удаление продукта не из корзины отклоняют пакет."""
+        for op, extra in (("update", {"quantity": 3}), ("remove", {})):
+            with self.subTest(op=op):
+                response = self.batch(
+                    {"product": self.first.title, "op": "remove"},
+                    {"product": self.second.title, "op": op, **extra},
+                )
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(self.get_quantities(), {self.first.title: 1})
+
+    def test_update_requires_quantity(self):
+        """Операция update без количества не проходит проверку."""
+        response = self.batch({"product": self.first.title, "op": "update"})
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,125 @@
+"""Тесты параллельного изменения корзины."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from api.tests.utils import create_products, create_user
+from django.db import connection
+from django.test import TransactionTestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from store.models import CartItem
+
+REQUESTS = 8
+
+
+class ConcurrentAddItemTests(TransactionTestCase):
+    """Проверяет, что параллельные добавления в корзину не теряются."""
+
+    def setUp(self):
+        """Создаёт продукт и пользователя с пустой корзиной."""
+        self.product = create_products(1)[0]
+        self.user, self.authorization = create_user("buyer")
+
+    def add_item(self, _) -> int:
+        """
+        Добавляет продукт в корзину в отдельном соединении.
+
+        Возвращает:
+            int: Код ответа.
+        """
+        try:
+            return (
+                APIClient()
+                .post(
+                    reverse("cart-add-item"),
+                    {"product": self.product.title, "quantity": 1},
+                    format="json",
+                    HTTP_AUTHORIZATION=self.authorization,
+                )
+                .status_code
+            )
+        finally:
+            connection.close()
+
+    def add_batch(self, _) -> int:
+        """
+        Добавляет продукт в корзину пакетом в отдельном соединении.
+
+        Возвращает:
+            int: Код ответа.
+        """
+        try:
+            return (
+                APIClient()
+                .post(
+                    reverse("cart-batch"),
+                    [{"product": self.product.title, "op": "add"}],
+                    format="json",
+                    HTTP_AUTHORIZATION=self.authorization,
+                )
+                .status_code
+            )
+        finally:
+            connection.close()
+
+    def update_item(self, _) -> int:
+        """
+        Изменяет количество продукта в корзине в отдельном соединении.
+
+        Возвращает:
+            int: Код ответа.
+        """
+        try:
+            return (
+                APIClient()
+                .patch(
+                    reverse("cart-update-item"),
+                    {"product": self.product.title, "quantity": 1},
+                    format="json",
+                    HTTP_AUTHORIZATION=self.authorization,
+                )
+                .status_code
+            )
+        finally:
+            connection.close()
+
+    def test_parallel_add_item(self):
+        """Все добавления учтены в одном элементе корзины."""
+        with ThreadPoolExecutor(max_workers=REQUESTS) as executor:
+            statuses = list(executor.map(self.add_item, range(REQUESTS)))
+        self.assertEqual(statuses, [200] * REQUESTS)
+        items = CartItem.objects.filter(
+            cart__user=self.user, product=self.product
+        )
+        self.assertEqual(items.count(), 1)
+        self.assertEqual(items.get().quantity, REQUESTS)
+
+    def test_parallel_batch_and_add_item(self):
+        """Пакеты и add_item, добавляющие новый продукт, не конфликтуют."""
+        requests = [self.add_item, self.add_batch] * (REQUESTS // 2)
+        with ThreadPoolExecutor(max_workers=REQUESTS) as executor:
+            statuses = list(
+                executor.map(lambda request: request(None), requests)
+            )
+        self.assertEqual(statuses, [200] * REQUESTS)
+        items = CartItem.objects.filter(
+            cart__user=self.user, product=self.product
+        )
+        self.assertEqual(items.count(), 1)
+        self.assertEqual(items.get().quantity, REQUESTS)
+
+    def test_parallel_update_and_add_item(self):
+        """update_item не падает, пока другие запросы пишут в базу."""
+        self.add_item(None)
+        requests = [self.add_item, self.update_item] * (REQUESTS // 2)
+        with ThreadPoolExecutor(max_workers=REQUESTS) as executor:
+            statuses = list(
+                executor.map(lambda request: request(None), requests)
+            )
+        self.assertEqual(statuses, [200] * REQUESTS)
+        self.assertEqual(
+            CartItem.objects.filter(
+                cart__user=self.user, product=self.product
+            ).count(),
+            1,
+        )
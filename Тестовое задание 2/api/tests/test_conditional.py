@@ -0,0 +1,109 @@
+"""Тесты условных запросов к каталогу."""
+
+from api.tests.utils import create_products
+from django.core.cache import caches
+from django.test import TestCase
+from django.urls import reverse
+from django.utils.http import http_date, parse_http_date
+from rest_framework.test import APIClient
+
+
+class ConditionalRequestTests(TestCase):
+    """Проверяет ETag, Last-Modified и ответы 304 списков каталога."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создаёт каталог."""
+        cls.products = create_products(3)
+
+    def setUp(self):
+        """Очищает кэши и создаёт клиент API."""
+        for cache in caches.all():
+            cache.clear()
+        self.client = APIClient()
+        self.url = reverse("products-list")
+
+    def get(self, url: str = None, **headers):
+        """
+        Выполняет GET-запрос с заголовками.
+
+        Параметры:
+            url (str): Адрес запроса, по умолчанию список продуктов.
+            **headers: Заголовки запроса.
+
+        Возвращает:
+            Response: Ответ на запрос.
+        """
+        return self.client.get(url or self.url, headers=headers)
+
+    def test_validators(self):
+        """Ответ содержит ETag и Last-Modified, ETag зависит от запроса."""
+        response = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertRegex(response["ETag"], r'^"[0-9a-f]{32}"$')
+        self.assertIsNotNone(parse_http_date(response["Last-Modified"]))
+        other = self.get(self.url + "?ordering=price")
+        self.assertNotEqual(other["ETag"], response["ETag"])
+
+    def test_if_none_match(self):
+        """Текущий ETag, в том числе в списке, даёт 304 без тела."""
+        etag = self.get()["ETag"]
+        for value in (etag, f'"stale", {etag}', "*"):
+            with self.subTest(value=value):
+                response = self.get(If_None_Match=value)
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response.content, b"")
+                self.assertEqual(response["ETag"], etag)
+        self.assertEqual(self.get(If_None_Match='"stale"').status_code, 200)
+
+    def test_etag_changes_with_catalog(self):
+        """После изменения каталога прежний ETag даёт полный ответ."""
+        etag = self.get()["ETag"]
+        product = self.products[0]
+        product.title = "Новое наименование"
+        with self.captureOnCommitCallbacks(execute=True):
+            product.save()
+        response = self.get(If_None_Match=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_if_modified_since(self):
+        """Время не раньше Last-Modified даёт 304, более раннее — 200."""
+        last_modified = self.get()["Last-Modified"]
+        response = self.get(If_Modified_Since=last_modified)
+        self.assertEqual(response.status_code, 304)
+        earlier = http_date(parse_http_date(last_modified) - 60)
+        self.assertEqual(self.get(If_Modified_Since=earlier).status_code, 200)
+
+    def test_if_none_match_has_priority(self):
+        """If-Modified-Since не учитывается, если передан If-None-Match."""
+        last_modified = self.get()["Last-Modified"]
+        response = self.get(
+            If_None_Match='"stale"', If_Modified_Since=last_modified
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_invalid_query_before_not_modified(self):
+        """Некорректные параметры дают 400 даже с If-None-Match: *."""
+        for url in (
+            self.url + "?price_min=abc",
+            self.url + "?price_max=nan",
+            reverse("products-search") + "?q=",
+        ):
+            with self.subTest(url=url):
+                self.assertEqual(self.get(url).status_code, 400)
+                self.assertEqual(
+                    self.get(url, If_None_Match="*").status_code, 400
+                )
+                self.assertEqual(
+                    self.get(
+                        url, If_Modified_Since=http_date(2**31)
+                    ).status_code,
+                    400,
+                )
+
+    def test_categories_not_modified(self):
+        """Список категорий тоже отвечает 304 на текущий ETag."""
+        url = reverse("product_categories-list")
+        etag = self.get(url)["ETag"]
+        self.assertEqual(self.get(url, If_None_Match=etag).status_code, 304)
@@ -0,0 +1,230 @@
+"""Тесты пагинации списков каталога."""
+
+from urllib.parse import parse_qs, urlsplit
+
+from api.pagination import (
+    KeysetCursorPagination,
+    ProductCategoryPagination,
+    ProductPagination,
+)
+from api.tests.utils import create_products
+from django.core.cache import caches
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from store.models import Product, ProductCategory
+
+PRICES = (300, 100, 200)
+
+
+class CursorWalkMixin:
+    """Обход всех страниц списка в режиме курсора."""
+
+    PAGE_SIZE = 4
+    maxDiff = None
+
+    def setUp(self):
+        """Очищает кэши и создаёт клиент API."""
+        for cache in caches.all():
+            cache.clear()
+        self.client = APIClient()
+
+    def get_page(self, url: str, **params) -> dict:
+        """
+        Запрашивает страницу списка.
+
+        Параметры:
+            url (str): Адрес страницы.
+            **params: Параметры запроса.
+
+        Возвращает:
+            dict: Данные ответа.
+        """
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def walk(self, url: str, **params) -> tuple:
+        """
+        Проходит все страницы по ссылкам next, а затем обратно по previous.
+
+        Параметры:
+            url (str): Адрес списка.
+            **params: Параметры запроса первой страницы.
+
+        Возвращает:
+            tuple: Страницы при обходе вперёд и назад, каждая — список slug.
+        """
+        page = self.get_page(url, pagination="cursor", **params)
+        forward = [[item["slug"] for item in page["results"]]]
+        while page["next"]:
+            page = self.get_page(page["next"])
+            forward.append([item["slug"] for item in page["results"]])
+        backward = [forward[-1]]
+        while page["previous"]:
+            page = self.get_page(page["previous"])
+            backward.append([item["slug"] for item in page["results"]])
+        return forward, backward[::-1]
+
+    def assert_walk(self, url: str, expected: list, **params):
+        """
+        Проверяет, что обход выдаёт все объекты по порядку без повторов.
+
+        Параметры:
+            url (str): Адрес списка.
+            expected (list): Ожидаемые slug в порядке сортировки.
+            **params: Параметры запроса первой страницы.
+        """
+        forward, backward = self.walk(url, **params)
+        self.assertEqual(sum(forward, []), expected)
+        self.assertTrue(
+            all(len(page) == self.PAGE_SIZE for page in forward[:-1])
+        )
+        self.assertEqual(backward, forward)
+
+
+class CursorPaginationTests(CursorWalkMixin, TestCase):
+    """
+    Проверяет обход всех страниц в режиме курсора.
+
+    У продуктов всего несколько различных цен, поэтому при сортировке по
+    цене страницы разрезают группы продуктов с одинаковой ценой.
+    """
+
+    PRODUCTS = 25
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создаёт каталог с повторяющимися ценами."""
+        create_products(cls.PRODUCTS)
+        for index, product in enumerate(Product.objects.order_by("pk")):
+            product.price = PRICES[index % len(PRICES)]
+            product.save(update_fields=("price",))
+
+    def test_products_by_pk(self):
+        """Без сортировки продукты обходятся по первичному ключу."""
+        self.assert_walk(
+            reverse("products-list"),
+            list(
+                Product.objects.order_by("pk").values_list("slug", flat=True)
+            ),
+            page_size=self.PAGE_SIZE,
+        )
+
+    def test_products_ordering_with_ties(self):
+        """Сортировка по неуникальному полю не теряет и не повторяет."""
+        for ordering in ("price", "-price"):
+            with self.subTest(ordering=ordering):
+                pk = f"{ordering[:-5]}pk"
+                self.assert_walk(
+                    reverse("products-list"),
+                    list(
+                        Product.objects.order_by(ordering, pk).values_list(
+                            "slug", flat=True
+                        )
+                    ),
+                    page_size=self.PAGE_SIZE,
+                    ordering=ordering,
+                )
+
+    def test_products_filtered(self):
+        """Фильтр и сортировка сохраняются в ссылках на страницы."""
+        queryset = Product.objects.filter(price__gte=200)
+        self.assert_walk(
+            reverse("products-list"),
+            list(
+                queryset.order_by("-price", "-pk").values_list(
+                    "slug", flat=True
+                )
+            ),
+            page_size=self.PAGE_SIZE,
+            ordering="-price",
+            price_min=200,
+        )
+
+    def test_categories(self):
+        """Категории обходятся по первичному ключу."""
+        self.assert_walk(
+            reverse("product_categories-list"),
+            list(
+                ProductCategory.objects.order_by("pk").values_list(
+                    "slug", flat=True
+                )
+            ),
+            page_size=self.PAGE_SIZE,
+        )
+
+    def test_invalid_cursor(self):
+        """Некорректный курсор и курсор другой сортировки дают 404."""
+        url = reverse("products-list")
+        page = self.get_page(url, pagination="cursor", ordering="price")
+        price_cursor = parse_qs(urlsplit(page["next"]).query)["cursor"][0]
+        for cursor in ("invalid", price_cursor):
+            with self.subTest(cursor=cursor):
+                response = self.client.get(url, {"cursor": cursor})
+                self.assertEqual(response.status_code, 404)
+
+
+class LargeTieGroupTests(CursorWalkMixin, TestCase):
+    """
+    Проверяет обход группы одинаковых цен длиннее offset_cutoff.
+
+    Курсор DRF пропускает такую группу смещением не больше offset_cutoff,
+    поэтому повторял бы страницы без конца.
+    """
+
+    PAGE_SIZE = ProductPagination.max_page_size
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создаёт каталог, в котором у всех продуктов одна цена."""
+        create_products(KeysetCursorPagination.offset_cutoff + 5)
+        Product.objects.update(price=PRICES[0])
+
+    def test_products_ordering_with_ties(self):
+        """Все продукты обходятся один раз."""
+        for ordering in ("price", "-price"):
+            with self.subTest(ordering=ordering):
+                pk = f"{ordering[:-5]}pk"
+                self.assert_walk(
+                    reverse("products-list"),
+                    list(
+                        Product.objects.order_by(ordering, pk).values_list(
+                            "slug", flat=True
+                        )
+                    ),
+                    page_size=self.PAGE_SIZE,
+                    ordering=ordering,
+                )
+
+
+class MaxPageSizeTests(TestCase):
+    """Проверяет ограничение размера страницы параметром page_size."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создаёт каталог длиннее наибольшей страницы."""
+        create_products(ProductPagination.max_page_size + 1)
+
+    def setUp(self):
+        """Очищает кэши и создаёт клиент API."""
+        for cache in caches.all():
+            cache.clear()
+        self.client = APIClient()
+
+    def test_max_page_size(self):
+        """page_size больше max_page_size уменьшается до max_page_size."""
+        for url, paginator in (
+            (reverse("products-list"), ProductPagination),
+            (reverse("product_categories-list"), ProductCategoryPagination),
+        ):
+            for mode in ("page", "cursor"):
+                with self.subTest(url=url, mode=mode):
+                    response = self.client.get(
+                        url, {"page_size": 10**6, "pagination": mode}
+                    )
+                    self.assertEqual(response.status_code, 200)
+                    self.assertEqual(
+                        len(response.json()["results"]),
+                        paginator.max_page_size,
+                    )
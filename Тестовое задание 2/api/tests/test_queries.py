@@ -0,0 +1,91 @@
+"""Тесты количества запросов к базе данных эндпоинтов API."""
+
+from unittest import mock
+
+from api.pagination import ProductCategoryPagination, ProductPagination
+from api.tests.utils import create_products, create_user
+from django.core.cache import caches
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+PAGE_SIZES = (10, 500)
+
+
+class QueryBudgetTests(TestCase):
+    """
+    Проверяет, что количество запросов не зависит от размера страницы.
+
+    Перед каждым запросом кэши очищаются, поэтому ответ строится из базы
+    данных, а токен проверяется запросом.
+    """
+
+    PRODUCTS_LIST_QUERIES = 2
+    CATEGORIES_LIST_QUERIES = 2
+    CART_LIST_QUERIES = 3
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создаёт каталог и пользователей с корзинами разного размера."""
+        products = create_products(max(PAGE_SIZES))
+        _, cls.small_cart = create_user("small", products[: min(PAGE_SIZES)])
+        _, cls.large_cart = create_user("large", products)
+
+    def setUp(self):
+        """Создаёт клиент API."""
+        self.client = APIClient()
+
+    def assert_queries(self, queries: int, url: str, **extra):
+        """
+        Выполняет GET-запрос с пустыми кэшами и проверяет число запросов.
+
+        Параметры:
+            queries (int): Ожидаемое количество запросов к базе данных.
+            url (str): Адрес запроса.
+            **extra: Параметры запроса и заголовки для APIClient.get.
+
+        Возвращает:
+            Response: Ответ на запрос.
+        """
+        for cache in caches.all():
+            cache.clear()
+        with self.assertNumQueries(queries):
+            response = self.client.get(url, **extra)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    @mock.patch.object(ProductPagination, "max_page_size", max(PAGE_SIZES))
+    def test_products_list(self):
+        """Список продуктов выполняет одинаковое число запросов."""
+        for page_size in PAGE_SIZES:
+            with self.subTest(page_size=page_size):
+                response = self.assert_queries(
+                    self.PRODUCTS_LIST_QUERIES,
+                    reverse("products-list"),
+                    data={"page_size": page_size},
+                )
+                self.assertEqual(len(response.json()["results"]), page_size)
+
+    @mock.patch.object(
+        ProductCategoryPagination, "max_page_size", max(PAGE_SIZES)
+    )
+    def test_categories_list(self):
+        """Список категорий выполняет одинаковое число запросов."""
+        for page_size in PAGE_SIZES:
+            with self.subTest(page_size=page_size):
+                response = self.assert_queries(
+                    self.CATEGORIES_LIST_QUERIES,
+                    reverse("product_categories-list"),
+                    data={"page_size": page_size},
+                )
+                self.assertEqual(len(response.json()["results"]), page_size)
+
+    def test_cart_list(self):
+        """Корзина выполняет одинаковое число запросов при любом размере."""
+        for authorization in (self.small_cart, self.large_cart):
+            with self.subTest(authorization=authorization):
+                self.assert_queries(
+                    self.CART_LIST_QUERIES,
+                    reverse("cart-list"),
+                    HTTP_AUTHORIZATION=authorization,
+                )
@@ -0,0 +1,47 @@
+"""Тесты планов запросов списка продуктов."""
+
+from io import StringIO
+
+from api.management.commands.check_product_plans import (
+    Command as CheckProductPlansCommand,
+)
+from core.constants import CheckProductPlansCfg
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from store.models import Product
+
+
+class ProductPlanTests(TestCase):
+    """
+    Проверяет, что фильтры и сортировки списка продуктов используют индексы.
+
+    Планы строятся на каталоге из нескольких тысяч продуктов с собранной
+    статистикой, чтобы планировщик не предпочёл полное сканирование
+    маленькой таблицы.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """Заполняет каталог и собирает статистику для планировщика."""
+        call_command("seed_benchmark_data", users=1, stdout=StringIO())
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def test_plans_use_indexes(self):
+        """Запросы не сканируют всю таблицу и сортируют по индексу."""
+        for query in CheckProductPlansCfg.QUERIES:
+            with self.subTest(query=query):
+                self.assertIsNone(
+                    CheckProductPlansCommand.get_plan_error(
+                        query, CheckProductPlansCommand.explain(query)
+                    )
+                )
+
+    def test_full_scan_detected(self):
+        """Запрос по полю без индекса распознаётся как полное сканирование."""
+        plan = Product.objects.filter(description="").explain()
+        self.assertIsNotNone(
+            CheckProductPlansCommand.get_full_scan_pattern().search(plan),
+            plan,
+        )
@@ -0,0 +1,56 @@
+"""Тесты чтения каталога с реплик."""
+
+from unittest import mock
+
+from api.tests.utils import create_products
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+
+@override_settings(DATABASE_REPLICAS=["default"])
+class ReplicaCacheFillTests(TestCase):
+    """
+    Проверяет, что кэши каталога заполняются из основной базы данных.
+
+    Реплика указывает на основную базу данных, а выбор реплики
+    отслеживается, поэтому тест не требует отдельной базы данных.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создаёт каталог."""
+        create_products(3)
+
+    def setUp(self):
+        """Очищает кэши перед каждым запросом."""
+        for cache in caches.all():
+            cache.clear()
+
+    def assert_primary_reads(self, url: str, **data) -> None:
+        """
+        Проверяет, что ответ при промахе кэша не читает реплики.
+
+        Параметры:
+            url (str): Адрес запроса.
+            **data: Параметры запроса.
+        """
+        with mock.patch(
+            "core.routers.random.choice",
+            side_effect=lambda choices: choices[0],
+        ) as choose_replica:
+            response = self.client.get(url, data)
+        self.assertEqual(response.status_code, 200)
+        choose_replica.assert_not_called()
+
+    def test_products_list(self):
+        """Список продуктов кэшируется из основной базы данных."""
+        self.assert_primary_reads(reverse("products-list"))
+
+    def test_categories_list(self):
+        """Список категорий кэшируется из основной базы данных."""
+        self.assert_primary_reads(reverse("product_categories-list"))
+
+    def test_category_tree(self):
+        """Снимок дерева категорий строится из основной базы данных."""
+        self.assert_primary_reads(reverse("product_categories-tree"))
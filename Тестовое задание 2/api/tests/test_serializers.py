@@ -0,0 +1,97 @@
+"""Тесты сериализаторов приложения api."""
+
+from contextlib import ExitStack
+from unittest import mock
+
+from api.pagination import ProductPagination
+from api.tests.utils import create_products, create_user
+from django.core.cache import caches
+from django.core.files.storage import default_storage
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from store.models import CartItem
+
+PRODUCTS = 50
+STORAGE_METHODS = ("exists", "url", "open", "size", "path")
+
+
+class ProductImagesTests(TestCase):
+    """Проверяет, что адреса изображений строятся без хранилища файлов."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создаёт продукты с изображениями."""
+        create_products(PRODUCTS)
+
+    def assert_no_storage_calls(self) -> None:
+        """Запрашивает страницу продуктов, запрещая вызовы хранилища."""
+        with ExitStack() as stack:
+            storage_calls = [
+                stack.enter_context(
+                    mock.patch.object(
+                        default_storage,
+                        method,
+                        side_effect=AssertionError(method),
+                    )
+                )
+                for method in STORAGE_METHODS
+            ]
+            for cache in caches.all():
+                cache.clear()
+            response = self.client.get(
+                reverse("products-list"), {"page_size": PRODUCTS}
+            )
+        self.assertEqual(response.status_code, 200)
+        results = response.json()["results"]
+        self.assertEqual(len(results), PRODUCTS)
+        self.assertTrue(all(product["images"] for product in results))
+        for storage_call in storage_calls:
+            storage_call.assert_not_called()
+
+    @mock.patch.object(ProductPagination, "max_page_size", PRODUCTS)
+    def test_products_list_without_storage_calls(self):
+        """Список продуктов не обращается к хранилищу файлов."""
+        for fast_serializers in (True, False):
+            with self.subTest(fast_serializers=fast_serializers):
+                with override_settings(FAST_SERIALIZERS=fast_serializers):
+                    self.assert_no_storage_calls()
+
+
+class CartTotalsTests(TestCase):
+    """Проверяет итоги корзины в JSON-ответе."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создаёт продукт и пользователя с пустой корзиной."""
+        cls.product = create_products(1)[0]
+        cls.product.price = "27.50"
+        cls.product.save()
+        cls.user, cls.authorization = create_user("buyer")
+
+    def get_totals(self) -> bytes:
+        """
+        Возвращает итоги корзины из JSON-ответа.
+
+        Возвращает:
+            bytes: Часть ответа с общим количеством и стоимостью.
+        """
+        content = self.client.get(
+            reverse("cart-list"), HTTP_AUTHORIZATION=self.authorization
+        ).content
+        start = content.index(b'"total_quantity"')
+        return content[start:]
+
+    def test_empty_cart(self):
+        """Стоимость корзины без товаров выводится целым числом 0."""
+        self.assertEqual(
+            self.get_totals(), b'"total_quantity":0,"total_price":0}'
+        )
+
+    def test_cart_with_items(self):
+        """Стоимость корзины с товарами выводится числом с дробной частью."""
+        CartItem.objects.create(
+            cart=self.user.cart, product=self.product, quantity=2
+        )
+        self.assertEqual(
+            self.get_totals(), b'"total_quantity":2,"total_price":55.0}'
+        )
@@ -0,0 +1,117 @@
+"""Тесты ответов со списком категорий из снимка дерева категорий."""
+
+import json
+
+from api.pagination import ProductCategoryPagination
+from api.serializers import ProductCategorySerializer
+from api.tests.utils import create_products
+from api.views import ProductCategoryViewSet
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import renderers
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+from store.models import ProductCategory
+
+CATEGORIES = 12
+
+
+class CategoryTreeSnapshotTests(TestCase):
+    """
+    Проверяет, что ответы из снимка совпадают с ответами DRF побайтно.
+
+    Ожидаемый ответ строится без снимка: ProductCategorySerializer,
+    ProductCategoryPagination и стандартным JSONRenderer.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создаёт категории с подкатегориями на несколько страниц."""
+        create_products(CATEGORIES)
+
+    def setUp(self):
+        """Очищает кэши и создаёт клиент API."""
+        for cache in caches.all():
+            cache.clear()
+        self.client = APIClient()
+        self.url = reverse("product_categories-list")
+
+    def get_expected(self, url: str, params: dict, paginate: bool) -> bytes:
+        """
+        Возвращает ответ DRF без снимка дерева категорий.
+
+        Параметры:
+            url (str): Адрес запроса.
+            params (dict): Параметры запроса.
+            paginate (bool): Разбивать ли категории на страницы.
+
+        Возвращает:
+            bytes: JSON-представление ответа.
+        """
+        request = Request(APIRequestFactory().get(url, params))
+        queryset = ProductCategoryViewSet.queryset.all()
+        if not paginate:
+            data = ProductCategorySerializer(queryset, many=True).data
+            return renderers.JSONRenderer().render(data)
+        paginator = ProductCategoryPagination()
+        page = paginator.paginate_queryset(queryset, request)
+        data = ProductCategorySerializer(page, many=True).data
+        return renderers.JSONRenderer().render(
+            paginator.get_paginated_response(data).data
+        )
+
+    def assert_snapshot_response(self, params: dict):
+        """
+        Проверяет страницу списка категорий из снимка.
+
+        Параметры:
+            params (dict): Параметры запроса.
+        """
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/json")
+        expected = self.get_expected(self.url, params, paginate=True)
+        self.assertEqual(response.json(), json.loads(expected))
+        self.assertEqual(response.content, expected)
+
+    def test_pages(self):
+        """Первая, средняя и последняя страницы совпадают с ответом DRF."""
+        pages = -(-CATEGORIES // ProductCategoryPagination.page_size)
+        for params in (
+            {},
+            {"page": 2},
+            {"page": pages},
+            {"page": "last"},
+            {"page_size": 1, "page": CATEGORIES},
+            {"page_size": CATEGORIES},
+            {"page_size": 10**6},
+        ):
+            for fast_json in (True, False):
+                with self.subTest(params=params, fast_json=fast_json):
+                    with override_settings(FAST_JSON=fast_json):
+                        self.assert_snapshot_response(params)
+
+    def test_empty(self):
+        """После удаления всех категорий снимок даёт пустую страницу."""
+        self.assert_snapshot_response({})
+        with self.captureOnCommitCallbacks(execute=True):
+            ProductCategory.objects.all().delete()
+        self.assert_snapshot_response({})
+
+    def test_page_not_found(self):
+        """Страница за последней даёт 404, как в DRF."""
+        for page in (CATEGORIES, 0, "invalid"):
+            with self.subTest(page=page):
+                response = self.client.get(self.url, {"page": page})
+                self.assertEqual(response.status_code, 404)
+
+    def test_tree(self):
+        """Дерево категорий совпадает с ответом DRF без пагинации."""
+        url = reverse("product_categories-tree")
+        for _ in range(2):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(
+                response.content, self.get_expected(url, {}, paginate=False)
+            )
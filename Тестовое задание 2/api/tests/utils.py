@@ -0,0 +1,42 @@
+"""Вспомогательные функции для тестов приложения api."""
+
+from api.management.commands.benchmark_serializers import (
+    Command as BenchmarkSerializersCommand,
+)
+from django.contrib.auth.models import User
+from rest_framework.authtoken.models import Token
+from store.models import Cart, CartItem, Product
+
+
+def create_products(count: int) -> list:
+    """
+    Создаёт категории, подкатегории и продукты.
+
+    Параметры:
+        count (int): Количество создаваемых категорий и продуктов.
+
+    Возвращает:
+        list: Созданные продукты.
+    """
+    BenchmarkSerializersCommand.create_fixtures(count)
+    return list(Product.objects.order_by("pk"))
+
+
+def create_user(username: str, products: tuple = ()) -> tuple:
+    """
+    Создаёт пользователя с токеном и корзиной.
+
+    Параметры:
+        username (str): Имя пользователя.
+        products (tuple): Продукты, добавляемые в корзину по одной штуке.
+
+    Возвращает:
+        tuple: Пользователь и значение заголовка Authorization.
+    """
+    user = User.objects.create_user(username=username, password=username)
+    cart = Cart.objects.create(user=user)
+    CartItem.objects.bulk_create(
+        CartItem(cart=cart, product=product, quantity=1)
+        for product in products
+    )
+    return user, f"Token {Token.objects.create(user=user).key}"
@@ -4,26 +4,41 @@
 Этот модуль содержит маршруты для API версии 1.
 """
 
+from api.async_views import (
+    AsyncCartViewSet,
+    AsyncProductCategoryViewSet,
+    AsyncProductViewSet,
+)
 from api.views import (
     CartViewSet,
     CustomObtainAuthToken,
     ProductCategoryViewSet,
     ProductViewSet,
 )
+from django.conf import settings
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
+if settings.ASYNC_API_VIEWS:
+    product_category_viewset = AsyncProductCategoryViewSet
+    product_viewset = AsyncProductViewSet
+    cart_viewset = AsyncCartViewSet
+else:
+    product_category_viewset = ProductCategoryViewSet
+    product_viewset = ProductViewSet
+    cart_viewset = CartViewSet
+
 router_v1 = DefaultRouter()
 
 router_v1.register(
     prefix=r"product_categories",
-    viewset=ProductCategoryViewSet,
+    viewset=product_category_viewset,
     basename="product_categories",
 )
 router_v1.register(
-    prefix=r"products", viewset=ProductViewSet, basename="products"
+    prefix=r"products", viewset=product_viewset, basename="products"
 )
-router_v1.register(prefix=r"cart", viewset=CartViewSet, basename="cart")
+router_v1.register(prefix=r"cart", viewset=cart_viewset, basename="cart")
 
 urlpatterns = [
     path("v1/", include(router_v1.urls)),
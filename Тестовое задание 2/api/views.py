@@ -1,17 +1,40 @@
 """Модуль для работы с представлениями приложения api."""
 
-from api.pagination import ProductCategoryPagination, ProductPagination
+import json
+
+from api.authentication import CachedTokenAuthentication
+from api.filters import ProductFilterBackend, StableOrderingFilter
+from api.mixins import CatalogCacheMixin, FastListMixin
+from api.pagination import (
+    ProductCategoryPagination,
+    ProductPagination,
+    ProductSearchPagination,
+)
+from api.renderers import JSONRenderer
 from api.serializers import (
+    CartBatchOperationSerializer,
     CartItemSerializer,
     CartSerializer,
+    FastProductCategorySerializer,
+    FastProductSerializer,
     ProductCategorySerializer,
     ProductSerializer,
     ShortCartItemSerializer,
 )
-from core.constants import TOKEN, USERNAME, ProductSubCategoryCfg, ViewsCfg
+from api.snapshots import CategoryTree, get_category_tree
+from core.constants import (
+    TOKEN,
+    USER,
+    USERNAME,
+    FiltersCfg,
+    ProductSubCategoryCfg,
+    ViewsCfg,
+)
+from django.db import IntegrityError, transaction
+from django.http import HttpResponse, HttpResponseBase
+from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import mixins, status, viewsets
-from rest_framework.authentication import TokenAuthentication
 from rest_framework.authtoken.models import Token
 from rest_framework.authtoken.views import ObtainAuthToken
 from rest_framework.decorators import action
@@ -19,7 +42,14 @@ from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
-from store.models import Cart, CartItem, Product, ProductCategory
+from store.models import (
+    Cart,
+    CartItem,
+    Product,
+    ProductCategory,
+    ProductSubCategory,
+)
+from store.search import SearchResults, get_search_backend
 
 
 class CustomObtainAuthToken(ObtainAuthToken):
@@ -43,43 +73,239 @@ class CustomObtainAuthToken(ObtainAuthToken):
             Response: JSON-ответ, содержащий аутентификационный токен и имя
         пользователя
         """
-        response = super(CustomObtainAuthToken, self).post(
-            request, *args, **kwargs
-        )
-        token = Token.objects.get(key=response.data[TOKEN])
-        return Response({TOKEN: token.key, USERNAME: token.user.username})
-
-
-class ProductCategoryViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        user = serializer.validated_data[USER]
+        token, created = Token.objects.get_or_create(user=user)
+        return Response({TOKEN: token.key, USERNAME: user.username})
+
+
+class ProductCategoryViewSet(
+    CatalogCacheMixin,
+    FastListMixin,
+    mixins.ListModelMixin,
+    viewsets.GenericViewSet,
+):
     """
     Предоставляет операцию чтения для модели ProductCategory.
 
     Операции:
     - просмотр списка категорий продуктов с подкатегориями;
+    - просмотр всего дерева категорий с подкатегориями.
 
     Пагинация по умолчанию выводит по 5 категорий продуктов на странице.
+    JSON-ответы собираются из предрассчитанного снимка дерева категорий,
+    который перестраивается только после изменения категорий или
+    подкатегорий.
     """
 
+    catalog_models = (ProductCategory, ProductSubCategory)
     queryset = ProductCategory.objects.all().prefetch_related(
         ProductSubCategoryCfg.PRODUCT_CATEGORY_RELATED_NAME
     )
     serializer_class = ProductCategorySerializer
+    fast_serializer_class = FastProductCategorySerializer
     pagination_class = ProductCategoryPagination
 
+    def get_catalog_response(
+        self, request: Request, digest: str, *args, **kwargs
+    ) -> HttpResponseBase:
+        """
+        Возвращает ответ со списком или деревом категорий.
+
+        JSON-ответы собираются из снимка дерева категорий без запросов к
+        базе данных и сериализаторов. Для других форматов и пагинации по
+        курсору используется быстрый сериализатор.
+
+        Параметры:
+            request (Request): Входящий запрос.
+            digest (str): Хэш, идентифицирующий представление ответа.
+            *args: Список аргументов переменной длины.
+            **kwargs: Произвольные именованные аргументы.
+
+        Возвращает:
+            HttpResponseBase: Ответ со списком или деревом категорий.
+        """
+        if self.is_snapshot_request(request):
+            return self.get_snapshot_response(request, get_category_tree())
+        return super().get_catalog_response(request, digest, *args, **kwargs)
+
+    def is_snapshot_request(self, request: Request) -> bool:
+        """
+        Проверяет, строится ли ответ из снимка дерева категорий.
+
+        Параметры:
+            request (Request): Входящий запрос.
+
+        Возвращает:
+            bool: True для дерева категорий и JSON-ответов с постраничной
+        пагинацией.
+        """
+        return self.action == ViewsCfg.TREE or (
+            request.accepted_renderer.format == ViewsCfg.JSON
+            and not self.paginator.is_cursor_mode(request)
+        )
+
+    def get_snapshot_response(
+        self, request: Request, tree: CategoryTree
+    ) -> HttpResponseBase:
+        """
+        Возвращает ответ со списком или деревом категорий из снимка.
+
+        Параметры:
+            request (Request): Входящий запрос.
+            tree (CategoryTree): Снимок дерева категорий.
+
+        Возвращает:
+            HttpResponseBase: Ответ со списком или деревом категорий.
+        """
+        if self.action == ViewsCfg.TREE:
+            content = tree.content
+        else:
+            content = self.paginate_category_tree(tree)
+        if request.accepted_renderer.format != ViewsCfg.JSON:
+            return Response(json.loads(content))
+        return HttpResponse(content, content_type=ViewsCfg.JSON_CONTENT_TYPE)
+
+    def paginate_category_tree(self, tree: CategoryTree) -> bytes:
+        """
+        Возвращает страницу категорий из снимка дерева категорий.
+
+        Параметры:
+            tree (CategoryTree): Снимок дерева категорий.
+
+        Возвращает:
+            bytes: JSON-представление страницы в формате постраничной
+        пагинации.
+        """
+        page = self.paginate_queryset(tree.items)
+        envelope = JSONRenderer().render(
+            {
+                ViewsCfg.PAGE_COUNT: self.paginator.page.paginator.count,
+                ViewsCfg.PAGE_NEXT: self.paginator.get_next_link(),
+                ViewsCfg.PAGE_PREVIOUS: self.paginator.get_previous_link(),
+            }
+        )
+        return (
+            envelope[:-1]
+            + ViewsCfg.PAGE_RESULTS
+            + b",".join(page)
+            + ViewsCfg.PAGE_END
+        )
+
+    @action(
+        detail=False,
+        methods=ViewsCfg.TREE_HTTP_METHODS,
+        pagination_class=None,
+    )
+    def tree(self, request: Request) -> HttpResponseBase:
+        """
+        Возвращает всё дерево категорий с подкатегориями без пагинации.
+
+        Возвращает:
+            HttpResponseBase: Готовое JSON-представление дерева категорий.
+        """
+        return self.list(request)
+
 
-class ProductViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+class ProductViewSet(
+    CatalogCacheMixin,
+    FastListMixin,
+    mixins.ListModelMixin,
+    viewsets.GenericViewSet,
+):
     """
     Предоставляет операцию чтения для модели Product.
 
     Операции:
     - просмотр списка продуктов;
+    - фильтрация по slug категории и подкатегории и диапазону стоимости;
+    - сортировка по стоимости или наименованию;
+    - полнотекстовый поиск по наименованию и описанию.
 
     Пагинация по умолчанию выводит по 10 продуктов на странице.
+    Ответы кэшируются до изменения продуктов, категорий или подкатегорий
+    и строятся быстрым сериализатором без создания экземпляров моделей.
     """
 
-    queryset = Product.objects.all()
+    catalog_models = (Product, ProductCategory, ProductSubCategory)
+
+    queryset = Product.objects.catalog()
     serializer_class = ProductSerializer
+    fast_serializer_class = FastProductSerializer
     pagination_class = ProductPagination
+    filter_backends = (ProductFilterBackend, StableOrderingFilter)
+    ordering_fields = FiltersCfg.PRODUCT_ORDERING_FIELDS
+
+    def get_search_query(self) -> str:
+        """
+        Возвращает поисковый запрос из параметра q.
+
+        Возвращает:
+            str: Поисковый запрос.
+
+        Вызывает ошибку:
+            ValidationError: Если запрос не содержит слов для поиска.
+        """
+        query = self.request.query_params.get(ViewsCfg.SEARCH_QUERY_PARAM, "")
+        if not get_search_backend().get_tokens(query):
+            raise ValidationError(
+                {
+                    ViewsCfg.SEARCH_QUERY_PARAM: (
+                        ViewsCfg.SEARCH_QUERY_REQUIRED_ERROR
+                    )
+                }
+            )
+        return query
+
+    def paginate_queryset(self, queryset):
+        """
+        Разбивает продукты на страницы.
+
+        При поиске на страницы разбиваются результаты поиска в порядке
+        релевантности, а продукты страницы выбираются по идентификаторам.
+
+        Параметры:
+            queryset (QuerySet): Продукты или строки продуктов.
+
+        Возвращает:
+            list: Продукты текущей страницы.
+        """
+        if self.action == ViewsCfg.SEARCH:
+            queryset = SearchResults(
+                get_search_backend(), self.get_search_query(), queryset
+            )
+        return super().paginate_queryset(queryset)
+
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter(
+                ViewsCfg.SEARCH_QUERY_PARAM,
+                openapi.IN_QUERY,
+                description=ViewsCfg.SEARCH_QUERY_DESCRIPTION,
+                type=openapi.TYPE_STRING,
+                required=True,
+            )
+        ]
+    )
+    @action(
+        detail=False,
+        methods=ViewsCfg.SEARCH_HTTP_METHODS,
+        pagination_class=ProductSearchPagination,
+        filter_backends=(),
+    )
+    def search(self, request: Request) -> Response:
+        """
+        Возвращает продукты, найденные по словам из параметра q.
+
+        Продукты упорядочены по релевантности: совпадения в наименовании
+        важнее совпадений в описании.
+
+        Возвращает:
+            Response: Страница найденных продуктов.
+        """
+        self.get_search_query()
+        return self.list(request)
 
 
 class CartViewSet(viewsets.ViewSet):
@@ -95,7 +321,7 @@ class CartViewSet(viewsets.ViewSet):
     Требуется аутентификация пользователя по токену.
     """
 
-    authentication_classes = (TokenAuthentication,)
+    authentication_classes = (CachedTokenAuthentication,)
     permission_classes = (IsAuthenticated,)
 
     def get_queryset(self) -> Cart:
@@ -109,6 +335,20 @@ class CartViewSet(viewsets.ViewSet):
         """
         return Cart.objects.get_or_create(user=self.request.user)[0]
 
+    def get_cart_contents(self) -> Cart:
+        """
+        Возвращает корзину текущего пользователя с содержимым и итогами.
+
+        Элементы корзины с продуктами и итоги корзины загружаются
+        фиксированным числом запросов независимо от количества товаров.
+
+        Возвращает:
+            Cart: Корзина текущего пользователя.
+        """
+        return Cart.objects.with_contents().get_or_create(
+            user=self.request.user
+        )[0]
+
     def list(self, request: Request) -> Response:
         """
         Возвращает содержимое корзины текущего пользователя.
@@ -118,8 +358,7 @@ class CartViewSet(viewsets.ViewSet):
         Возвращает:
             Response: Сериализованное содержимое корзины.
         """
-        cart = self.get_queryset()
-        serializer = CartSerializer(cart)
+        serializer = CartSerializer(self.get_cart_contents())
         return Response(serializer.data)
 
     @staticmethod
@@ -140,40 +379,43 @@ class CartViewSet(viewsets.ViewSet):
         try:
             return Product.objects.get(title=product_title)
         except Product.DoesNotExist:
-            raise ValidationError(
-                detail=ViewsCfg.GET_PRODUCT_VALIDATION_ERROR.format(
-                    product_title=product_title
-                ),
-                code=status.HTTP_404_NOT_FOUND,
-            )
+            raise CartViewSet.get_product_error(product_title)
 
     @staticmethod
-    def get_cart_item(
-        cart: Cart, product: Product
-    ) -> CartItem | ValidationError:
+    def get_product_error(product_title: str) -> ValidationError:
         """
-        Возвращает элемент корзины по корзине и продукту.
+        Возвращает ошибку об отсутствии продукта.
 
         Параметры:
-            cart (Cart): Корзина пользователя.
-            product (Product): Продукт.
+            product_title (str): Наименование продукта.
 
         Возвращает:
-            CartItem: Элемент корзины.
+            ValidationError: Ошибка об отсутствии продукта.
+        """
+        return ValidationError(
+            detail=ViewsCfg.GET_PRODUCT_VALIDATION_ERROR.format(
+                product_title=product_title
+            ),
+            code=status.HTTP_404_NOT_FOUND,
+        )
 
-        Вызывает ошибку:
-            ValidationError: Если элемент корзины с указанным продуктом не
-        существует.
+    @staticmethod
+    def get_cart_item_error(product: Product) -> ValidationError:
         """
-        try:
-            return CartItem.objects.get(cart=cart, product=product)
-        except CartItem.DoesNotExist:
-            raise ValidationError(
-                detail=ViewsCfg.CART_ITEM_VALIDATION_ERROR.format(
-                    product=product.title
-                ),
-                code=status.HTTP_404_NOT_FOUND,
-            )
+        Возвращает ошибку об отсутствии продукта в корзине.
+
+        Параметры:
+            product (Product): Продукт.
+
+        Возвращает:
+            ValidationError: Ошибка об отсутствии элемента корзины.
+        """
+        return ValidationError(
+            detail=ViewsCfg.CART_ITEM_VALIDATION_ERROR.format(
+                product=product.title
+            ),
+            code=status.HTTP_404_NOT_FOUND,
+        )
 
     @swagger_auto_schema(
         request_body=CartItemSerializer,
@@ -193,16 +435,16 @@ class CartViewSet(viewsets.ViewSet):
         """
         product = self.get_product(request.data.get(ViewsCfg.PRODUCT))
         cart = self.get_queryset()
-        cart_item, created = CartItem.objects.get_or_create(
-            cart=cart, product=product
+        CartItem.objects.add_quantity(
+            cart=cart,
+            product=product,
+            quantity=int(
+                request.data.get(
+                    ViewsCfg.QUANTITY, ViewsCfg.QUANTITY_DEFAULT_VALUE
+                )
+            ),
         )
-        cart_item.quantity += int(
-            request.data.get(
-                ViewsCfg.QUANTITY, ViewsCfg.QUANTITY_DEFAULT_VALUE
-            )
-        )
-        cart_item.save()
-        return Response(CartSerializer(cart).data)
+        return Response(CartSerializer(self.get_cart_contents()).data)
 
     @swagger_auto_schema(
         request_body=ShortCartItemSerializer,
@@ -222,9 +464,13 @@ class CartViewSet(viewsets.ViewSet):
         product = self.get_product(
             product_title=request.data.get(ViewsCfg.PRODUCT)
         )
-        cart_item = self.get_cart_item(cart=cart, product=product)
-        cart_item.delete()
-        serializer = CartSerializer(cart)
+        with transaction.atomic():
+            deleted, _ = CartItem.objects.filter(
+                cart=cart, product=product
+            ).delete()
+            if not deleted:
+                raise self.get_cart_item_error(product)
+        serializer = CartSerializer(self.get_cart_contents())
         return Response(serializer.data)
 
     @swagger_auto_schema(
@@ -245,11 +491,176 @@ class CartViewSet(viewsets.ViewSet):
         """
         cart = self.get_queryset()
         product = self.get_product(request.data.get(ViewsCfg.PRODUCT))
-        cart_item = self.get_cart_item(cart=cart, product=product)
-        quantity = request.data.get(ViewsCfg.QUANTITY)
-        cart_item.quantity = quantity
-        cart_item.save()
-        serializer = CartSerializer(cart)
+        with transaction.atomic():
+            updated = CartItem.objects.filter(
+                cart=cart, product=product
+            ).update(quantity=request.data.get(ViewsCfg.QUANTITY))
+            if not updated:
+                raise self.get_cart_item_error(product)
+        serializer = CartSerializer(self.get_cart_contents())
+        return Response(serializer.data)
+
+    @staticmethod
+    def get_products(product_titles: set) -> dict:
+        """
+        Возвращает продукты по их наименованиям одним запросом.
+
+        Параметры:
+            product_titles (set): Наименования продуктов.
+
+        Возвращает:
+            dict: Продукты по наименованиям.
+
+        Вызывает ошибку:
+            ValidationError: Если какого-либо продукта не существует.
+        """
+        products = {
+            product.title: product
+            for product in Product.objects.filter(
+                title__in=product_titles
+            ).only(ViewsCfg.PRODUCT_TITLE)
+        }
+        missing_titles = product_titles - products.keys()
+        if missing_titles:
+            raise CartViewSet.get_product_error(min(missing_titles))
+        return products
+
+    def apply_operations(self, cart: Cart, operations: list) -> None:
+        """
+        Применяет операции пакетного изменения к корзине.
+
+        Корзина блокируется до конца транзакции, поэтому пакеты одной
+        корзины применяются по очереди. Операции применяются по порядку к
+        количествам в памяти, после чего изменения сохраняются тремя
+        массовыми запросами: удаление, обновление и создание элементов
+        корзины. Если элемент корзины успел создать другой запрос
+        (например, add_item, который корзину не блокирует), количество
+        добавляется к нему через CartItem.objects.add_quantity.
+
+        Параметры:
+            cart (Cart): Корзина пользователя.
+            operations (list): Проверенные операции.
+
+        Вызывает ошибку:
+            ValidationError: Если продукта не существует или изменяемого
+        продукта нет в корзине.
+        """
+        Cart.objects.lock(cart)
+        products = self.get_products(
+            {operation[ViewsCfg.PRODUCT] for operation in operations}
+        )
+        items = {
+            item.product_id: item
+            for item in CartItem.objects.select_for_update().filter(
+                cart=cart, product__in=products.values()
+            )
+        }
+        quantities = {
+            product_id: item.quantity for product_id, item in items.items()
+        }
+        for operation in operations:
+            product = products[operation[ViewsCfg.PRODUCT]]
+            if operation[ViewsCfg.OP] == ViewsCfg.OP_ADD:
+                quantities[product.pk] = (
+                    quantities.get(product.pk, 0)
+                    + operation[ViewsCfg.QUANTITY]
+                )
+            elif product.pk not in quantities:
+                raise self.get_cart_item_error(product)
+            elif operation[ViewsCfg.OP] == ViewsCfg.OP_UPDATE:
+                quantities[product.pk] = operation[ViewsCfg.QUANTITY]
+            else:
+                del quantities[product.pk]
+        CartItem.objects.filter(
+            pk__in=[
+                item.pk
+                for product_id, item in items.items()
+                if product_id not in quantities
+            ]
+        ).delete()
+        changed = []
+        for product_id, item in items.items():
+            if quantities.get(product_id, item.quantity) != item.quantity:
+                item.quantity = quantities[product_id]
+                changed.append(item)
+        CartItem.objects.bulk_update(changed, fields=(ViewsCfg.QUANTITY,))
+        self.create_items(
+            cart,
+            [
+                CartItem(
+                    cart=cart, product=product, quantity=quantities[product.pk]
+                )
+                for product in products.values()
+                if product.pk in quantities and product.pk not in items
+            ],
+        )
+
+    @staticmethod
+    def create_items(cart: Cart, new_items: list) -> None:
+        """
+        Создаёт новые элементы корзины одним запросом.
+
+        Если элемент корзины с тем же продуктом уже создан другим запросом,
+        срабатывает ограничение уникальности, и количества добавляются к
+        существующим элементам по одному.
+
+        Параметры:
+            cart (Cart): Корзина пользователя.
+            new_items (list): Несохранённые элементы корзины.
+        """
+        try:
+            with transaction.atomic():
+                CartItem.objects.bulk_create(new_items)
+        except IntegrityError:
+            for item in new_items:
+                CartItem.objects.add_quantity(
+                    cart=cart, product=item.product, quantity=item.quantity
+                )
+
+    def apply_batch(self, operations: list) -> None:
+        """
+        Применяет операции к корзине текущего пользователя в транзакции.
+
+        Корзина получается до начала транзакции, чтобы её блокировка была
+        первым запросом транзакции.
+
+        Параметры:
+            operations (list): Проверенные операции.
+        """
+        cart = self.get_queryset()
+        with transaction.atomic():
+            self.apply_operations(cart, operations)
+
+    @swagger_auto_schema(
+        request_body=CartBatchOperationSerializer(many=True),
+    )
+    @action(detail=False, methods=ViewsCfg.BATCH_HTTP_METHODS)
+    def batch(self, request: Request) -> Response:
+        """
+        Применяет список операций к корзине текущего пользователя.
+
+        Все продукты загружаются одним запросом, операции применяются в одной
+        транзакции массовыми запросами, а корзина сериализуется один раз.
+
+        Параметры запроса (список операций):
+        - product: Наименование продукта.
+        - op: Операция (add, update или remove).
+        - quantity: Количество продукта (для add по умолчанию 1, для update
+        обязательно).
+
+        Возвращает:
+            Response: Сериализованное содержимое корзины после применения
+        всех операций.
+        """
+        serializer = CartBatchOperationSerializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=ViewsCfg.BATCH_MAX_OPERATIONS,
+        )
+        serializer.is_valid(raise_exception=True)
+        self.apply_batch(serializer.validated_data)
+        serializer = CartSerializer(self.get_cart_contents())
         return Response(serializer.data)
 
     @action(detail=False, methods=ViewsCfg.CLEAR_CART_HTTP_METHODS)
@@ -262,5 +673,5 @@ class CartViewSet(viewsets.ViewSet):
         """
         cart = self.get_queryset()
         cart.items.all().delete()
-        serializer = CartSerializer(cart)
+        serializer = CartSerializer(self.get_cart_contents())
         return Response(serializer.data)
@@ -0,0 +1,27 @@
+"""
+ASGI конфиг для проекта test_django_ecosystem_alpha.
+
+Он предоставляет вызываемый ASGI как переменную уровня модуля с именем
+ «application». При запуске через ASGI по умолчанию подключаются
+асинхронные представления API (ASYNC_API_VIEWS=True), а постоянные
+подключения к базе данных отключаются (DB_CONN_MAX_AGE=0): под ASGI
+запросы выполняются в разных потоках, и каждый поток держал бы своё
+подключение открытым. Для переиспользования подключений с PostgreSQL
+включите пул psycopg (DB_POOL_MAX_SIZE) или используйте внешний пулер,
+например PgBouncer; с SQLite подключение открывается на каждый запрос.
+
+Запуск: uvicorn config.asgi:application.
+
+Дополнительная информация об этом файле доступна по ссылке
+https://docs.djangoproject.com/en/stable/howto/deployment/asgi/
+"""
+
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+os.environ.setdefault("ASYNC_API_VIEWS", "True")
+os.environ["DB_CONN_MAX_AGE"] = "0"
+
+application = get_asgi_application()
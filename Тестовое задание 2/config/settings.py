@@ -3,7 +3,8 @@
 import os
 from pathlib import Path
 
-from decouple import config
+from decouple import Csv, config
+from django.core.exceptions import ImproperlyConfigured
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -26,13 +27,17 @@ INSTALLED_APPS = [
     "rest_framework.authtoken",
     "imagekit",
     "drf_yasg",
+    "api.apps.ApiConfig",
     "core.apps.CoreConfig",
     "store.apps.StoreConfig",
     "users.apps.UsersConfig",
 ]
 
 MIDDLEWARE = [
+    "core.middleware.RequestMetricsMiddleware",
+    "core.middleware.CompressionMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "core.middleware.ReplicaReadMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -63,11 +68,91 @@ WSGI_APPLICATION = "config.wsgi.application"
 
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+        "ENGINE": config("DB_ENGINE", default="django.db.backends.sqlite3"),
+        "NAME": config("DB_NAME", default="") or BASE_DIR / "db.sqlite3",
+        "USER": config("DB_USER", default=""),
+        "PASSWORD": config("DB_PASSWORD", default=""),
+        "HOST": config("DB_HOST", default=""),
+        "PORT": config("DB_PORT", default=""),
+        "CONN_MAX_AGE": config("DB_CONN_MAX_AGE", default=60, cast=int),
+        "CONN_HEALTH_CHECKS": config(
+            "DB_CONN_HEALTH_CHECKS", default=True, cast=bool
+        ),
+        "OPTIONS": {},
     }
 }
 
+DB_POOL_MAX_SIZE = config("DB_POOL_MAX_SIZE", default=0, cast=int)
+if DB_POOL_MAX_SIZE:
+    if DATABASES["default"]["ENGINE"] != "django.db.backends.postgresql":
+        raise ImproperlyConfigured(
+            "DB_POOL_MAX_SIZE поддерживается только для PostgreSQL."
+        )
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        "min_size": config("DB_POOL_MIN_SIZE", default=2, cast=int),
+        "max_size": DB_POOL_MAX_SIZE,
+        "timeout": config("DB_POOL_TIMEOUT", default=10, cast=int),
+    }
+
+if DATABASES["default"]["ENGINE"] == "django.db.backends.sqlite3":
+    DATABASES["default"]["OPTIONS"]["timeout"] = config(
+        "SQLITE_TIMEOUT", default=20, cast=int
+    )
+    # Тестовая база в файле, а не в памяти: в общей памяти SQLite
+    # блокирует таблицы без ожидания, и параллельные тесты падают.
+    DATABASES["default"]["TEST"] = {"NAME": BASE_DIR / "test_db.sqlite3"}
+
+DATABASE_REPLICAS = []
+for index, replica in enumerate(
+    config("DB_REPLICAS", default="", cast=Csv()), start=1
+):
+    alias = f"replica_{index}"
+    DATABASES[alias] = {
+        **DATABASES["default"],
+        "OPTIONS": dict(DATABASES["default"]["OPTIONS"]),
+        "TEST": {"MIRROR": "default"},
+    }
+    if DATABASES[alias]["ENGINE"] == "django.db.backends.sqlite3":
+        DATABASES[alias]["NAME"] = replica
+    else:
+        DATABASES[alias]["HOST"] = replica
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ["core.routers.PrimaryReplicaRouter"]
+REPLICA_READ_MODELS = (
+    "store.Product",
+    "store.ProductCategory",
+    "store.ProductSubCategory",
+)
+REPLICA_STICKY_TIMEOUT = config("REPLICA_STICKY_TIMEOUT", default=10, cast=int)
+
+SQLITE_PRAGMAS = {
+    "journal_mode": config("SQLITE_JOURNAL_MODE", default="wal"),
+    "synchronous": config("SQLITE_SYNCHRONOUS", default="normal"),
+    "cache_size": config("SQLITE_CACHE_SIZE", default=-65536, cast=int),
+    "mmap_size": config("SQLITE_MMAP_SIZE", default=268435456, cast=int),
+    "temp_store": "memory",
+}
+
+CACHES = {
+    "default": {
+        "BACKEND": config(
+            "CACHE_BACKEND",
+            default="django.core.cache.backends.locmem.LocMemCache",
+        ),
+        "LOCATION": config("CACHE_LOCATION", default=""),
+    }
+}
+
+CATALOG_CACHE_ALIAS = config("CATALOG_CACHE_ALIAS", default="default")
+CATALOG_CACHE_TIMEOUT = config("CATALOG_CACHE_TIMEOUT", default=300, cast=int)
+
+AUTH_TOKEN_CACHE_ALIAS = config("AUTH_TOKEN_CACHE_ALIAS", default="default")
+AUTH_TOKEN_CACHE_TIMEOUT = config(
+    "AUTH_TOKEN_CACHE_TIMEOUT", default=300, cast=int
+)
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -93,6 +178,25 @@ STATIC_ROOT = os.path.join(BASE_DIR, "static")
 
 MEDIA_URL = "media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
+MEDIA_CDN_URL = config("MEDIA_CDN_URL", default="")
+
+IMAGEKIT_DEFAULT_CACHEFILE_STRATEGY = "store.renditions.DeferredStrategy"
+
+RENDITION_WORKERS = config("RENDITION_WORKERS", default=2, cast=int)
+
+FAST_SERIALIZERS = config("FAST_SERIALIZERS", default=True, cast=bool)
+
+ASYNC_API_VIEWS = config("ASYNC_API_VIEWS", default=False, cast=bool)
+
+REQUEST_METRICS = config("REQUEST_METRICS", default=True, cast=bool)
+METRICS_ALLOWED_IPS = config("METRICS_ALLOWED_IPS", default="", cast=Csv())
+
+FAST_JSON = config("FAST_JSON", default=True, cast=bool)
+
+COMPRESSION = config("COMPRESSION", default=True, cast=bool)
+COMPRESSION_MIN_SIZE = config("COMPRESSION_MIN_SIZE", default=1024, cast=int)
+
+PRODUCT_SEARCH_BACKEND = config("PRODUCT_SEARCH_BACKEND", default="")
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
@@ -114,9 +218,18 @@ SWAGGER_SETTINGS = {
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.TokenAuthentication",
+        "api.authentication.CachedTokenAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.AllowAny",
     ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "api.renderers.JSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "api.parsers.JSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
 }
@@ -7,12 +7,15 @@ URL-адреса:
 - `swagger<format>/`: JSON-документация API.
 - `swagger/`: Интерфейс Swagger UI для документации API.
 - `redoc/`: Интерфейс Redoc для документации API.
+- `metrics`: Метрики производительности в формате Prometheus, доступны
+  адресам из METRICS_ALLOWED_IPS.
 
 Список `urlpatterns` направляет URL-адреса в соответствующие представления.
 Дополнительная информация об этом файле доступна по ссылке
     https://docs.djangoproject.com/en/stable/topics/http/urls/
 """
 
+from core.views import metrics
 from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
@@ -53,6 +56,7 @@ urlpatterns = [
         schema_view.with_ui("redoc", cache_timeout=0),
         name="schema-redoc",
     ),
+    path("metrics", metrics, name="metrics"),
 ]
 
 if settings.DEBUG:
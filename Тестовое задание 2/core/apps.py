@@ -5,5 +5,14 @@ from django.apps import AppConfig
 
 class CoreConfig(AppConfig):
     """Базовая конфигурация для приложения core."""
+
     default_auto_field = "django.db.models.BigAutoField"
     name = "core"
+
+    def ready(self):
+        """
+        Импортирует сигналы при готовности приложения.
+
+        Этот метод вызывается, когда приложение Django готово к использованию.
+        """
+        import core.signals
@@ -0,0 +1,142 @@
+"""
+Модуль для сжатия ответов.
+
+Поддерживаются gzip и, если установлен пакет brotli, br. Кодировка
+выбирается по заголовку Accept-Encoding с учётом q-значений, при равных
+значениях предпочитается br. Строгий ETag сжатого ответа получает суффикс
+кодировки, так как сжатое представление побайтно отличается от
+несжатого.
+"""
+
+import gzip
+
+from core.constants import CompressionCfg
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def get_encodings() -> tuple:
+    """
+    Возвращает доступные кодировки в порядке предпочтения сервера.
+
+    Возвращает:
+        tuple: br, если установлен brotli, и gzip.
+    """
+    if brotli is None:
+        return (CompressionCfg.GZIP,)
+    return (CompressionCfg.BROTLI, CompressionCfg.GZIP)
+
+
+def get_quality(params: str) -> float:
+    """
+    Возвращает q-значение кодировки из заголовка Accept-Encoding.
+
+    Параметры:
+        params (str): Параметры кодировки после первой точки с запятой.
+
+    Возвращает:
+        float: q-значение, 1.0 по умолчанию и 0.0 для некорректного.
+    """
+    for param in params.split(";"):
+        name, _, value = param.partition("=")
+        if name.strip().lower() == CompressionCfg.QUALITY:
+            try:
+                return float(value)
+            except ValueError:
+                return 0.0
+    return 1.0
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    """
+    Выбирает кодировку ответа по заголовку Accept-Encoding.
+
+    Параметры:
+        accept_encoding (str): Значение заголовка Accept-Encoding.
+
+    Возвращает:
+        str | None: Кодировка с наибольшим q-значением или None, если
+        клиент не принимает ни одну из доступных.
+    """
+    qualities = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if coding:
+            qualities[coding] = get_quality(params)
+    default = qualities.get(CompressionCfg.ANY_ENCODING, 0.0)
+    best, best_quality = None, 0.0
+    for encoding in get_encodings():
+        quality = qualities.get(encoding, default)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(content: bytes, encoding: str) -> bytes:
+    """
+    Сжимает содержимое ответа.
+
+    Параметры:
+        content (bytes): Содержимое ответа.
+        encoding (str): Кодировка, выбранная negotiate_encoding.
+
+    Возвращает:
+        bytes: Сжатое содержимое.
+    """
+    if encoding == CompressionCfg.BROTLI:
+        return brotli.compress(content, quality=CompressionCfg.BROTLI_QUALITY)
+    return gzip.compress(content, CompressionCfg.GZIP_LEVEL, mtime=0)
+
+
+def is_compressible(content_type: str) -> bool:
+    """
+    Проверяет, имеет ли смысл сжимать содержимое этого типа.
+
+    Параметры:
+        content_type (str): Значение заголовка Content-Type.
+
+    Возвращает:
+        bool: True для текста, JSON, JavaScript и XML.
+    """
+    content_type = content_type.lower()
+    return any(
+        marker in content_type for marker in CompressionCfg.COMPRESSIBLE_TYPES
+    )
+
+
+def add_etag_encoding(etag: str, encoding: str) -> str:
+    """
+    Добавляет суффикс кодировки к строгому ETag.
+
+    Параметры:
+        etag (str): ETag несжатого ответа.
+        encoding (str): Кодировка сжатого ответа.
+
+    Возвращает:
+        str: ETag с суффиксом, слабый ETag возвращается без изменений.
+    """
+    if not etag.startswith('"'):
+        return etag
+    return etag[:-1] + CompressionCfg.ETAG_SUFFIX.format(encoding=encoding)
+
+
+def strip_etag_encoding(etag: str) -> str:
+    """
+    Удаляет суффикс кодировки из ETag, полученного от клиента.
+
+    Параметры:
+        etag (str): ETag из заголовка If-None-Match.
+
+    Возвращает:
+        str: ETag несжатого ответа.
+    """
+    for encoding in (CompressionCfg.BROTLI, CompressionCfg.GZIP):
+        suffix = CompressionCfg.ETAG_SUFFIX.format(encoding=encoding)
+        if etag.endswith(suffix):
+            end = len(etag) - len(suffix)
+            return etag[:end] + '"'
+    return etag
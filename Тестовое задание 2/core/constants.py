@@ -1,6 +1,8 @@
 """Константы и настройки для моделей проекта."""
+
 REQUEST = "request"
 TOKEN = "token"
+USER = "user"
 USERNAME = "username"
 
 
@@ -48,6 +50,14 @@ class AdminStoreCfg:
     )
 
 
+class AuthenticationCfg:
+    """Настройки аутентификации по токену."""
+
+    TOKEN_CACHE_KEY = "auth:token:{digest}"
+    REVOKED = "revoked"
+    REVOKED_TIMEOUT = 60
+
+
 class BaseProductCategoryCfg:
     """Настройки для абстрактной модели BaseProductCategory."""
 
@@ -73,6 +83,9 @@ class CartCfg:
     """Настройки для модели Cart."""
 
     CART_STR = "Корзина пользователя {username}"
+    USER = "user"
+    ITEMS_LOOKUP = "items__"
+    UPDATED_AT = "updated_at"
 
 
 class CartItemCfg:
@@ -81,6 +94,459 @@ class CartItemCfg:
     CART_ITEM_STR = "{quantity} x {product} in {cart}"
     CART_ITEM_RELATED_NAME = "items"
     CART_ITEM_DEFAULT_QUANTITY = 0
+    UNIQUE_CART_PRODUCT_FIELDS = ("cart", "product")
+    UNIQUE_CART_PRODUCT_NAME = "unique_cart_item_product"
+    PRODUCT = "product"
+    CONTENTS_ONLY_FIELDS = ("cart", "quantity", "product__title")
+    QUANTITY = "quantity"
+    PRODUCT_PRICE = "product__price"
+    TOTAL_QUANTITY = "total_quantity"
+    TOTAL_PRICE = "total_price"
+    TOTAL_QUANTITY_DEFAULT = 0
+    TOTAL_PRICE_DEFAULT = 0
+    PK = "pk"
+    DUPLICATE_COUNT = "duplicate_count"
+    DUPLICATE_KEEP = "duplicate_keep"
+    DUPLICATE_TOTAL = "duplicate_total"
+    MERGE_SUMMARY = "Удалено дубликатов элементов корзины: {count}."
+
+
+class CatalogCacheCfg:
+    """Настройки кэширования ответов каталога."""
+
+    VERSION_KEY = "catalog:version:v2:{model}"
+    VERSION = "{timestamp:.6f}{separator}{token}"
+    VERSION_SEPARATOR = ":"
+    RESPONSE_KEY = "catalog:response:{digest}"
+    CATEGORY_TREE_KEY = "catalog:category_tree"
+    ETAG = '"{digest}"'
+    ETAG_HEADER = "ETag"
+    LAST_MODIFIED_HEADER = "Last-Modified"
+    IF_NONE_MATCH_HEADER = "If-None-Match"
+    IF_MODIFIED_SINCE_HEADER = "If-Modified-Since"
+    ANY_ETAG = "*"
+
+
+class CompressionCfg:
+    """Настройки сжатия ответов."""
+
+    GZIP = "gzip"
+    BROTLI = "br"
+    ANY_ENCODING = "*"
+    QUALITY = "q"
+    GZIP_LEVEL = 6
+    BROTLI_QUALITY = 5
+    COMPRESSIBLE_TYPES = ("text/", "json", "javascript", "xml")
+    ETAG_SUFFIX = '-{encoding}"'
+    SAFE_METHODS = ("GET", "HEAD")
+    ACCEPT_ENCODING_HEADER = "Accept-Encoding"
+    CONTENT_ENCODING_HEADER = "Content-Encoding"
+    CONTENT_LENGTH_HEADER = "Content-Length"
+    CONTENT_TYPE_HEADER = "Content-Type"
+    ETAG_HEADER = "ETag"
+    IF_NONE_MATCH_META = "HTTP_IF_NONE_MATCH"
+
+
+class ImportProductsCfg:
+    """Настройки команды импорта продуктов."""
+
+    CSV = "csv"
+    JSONL = "jsonl"
+    FORMATS = (CSV, JSONL)
+    STDIN = "-"
+    ENCODING = "utf-8"
+    BATCH_SIZE = 1000
+    MAX_PENDING_BATCHES = 2
+    TITLE = "title"
+    SLUG = "slug"
+    DESCRIPTION = "description"
+    CATEGORY = "category"
+    SUBCATEGORY = "subcategory"
+    PRICE = "price"
+    IMAGE = "image"
+    UNKNOWN_FORMAT_ERROR = (
+        "Не удалось определить формат файла {path}, укажите --format."
+    )
+    ROW_ERROR = "Строка {line}: {error}"
+    MISSING_FIELD_ERROR = "не заполнено поле {field}."
+    UNKNOWN_CATEGORY_ERROR = "категория {slug} не существует."
+    UNKNOWN_SUBCATEGORY_ERROR = "подкатегория {slug} не существует."
+    SUBCATEGORY_MISMATCH_ERROR = (
+        "подкатегория {subcategory} не относится к категории {category}."
+    )
+    INVALID_PRICE_ERROR = "некорректная стоимость {price}."
+    BATCH_ERROR = "Не удалось сохранить строки {start}-{end}: {error}"
+    PROGRESS = "Импортировано {count} продуктов ({rate:.0f} продуктов/с)."
+    SUMMARY = (
+        "Импортировано {count} продуктов за {elapsed:.1f} с "
+        "({rate:.0f} продуктов/с), изображений создано: {images}."
+    )
+
+
+class BenchmarkSerializersCfg:
+    """Настройки команды сравнения скорости сериализаторов."""
+
+    PAGE_SIZES = (10, 100, 1000)
+    REPEAT = 5
+    SUBCATEGORIES_PER_CATEGORY = 3
+    SLUG = "bench-{kind}-{index}"
+    TITLE = "Бенчмарк {kind} {index}"
+    PRICE = "{rubles}.{kopecks:02d}"
+    IMAGE = "products/bench-{index}.jpg"
+    CATEGORY = "category"
+    SUBCATEGORY = "subcategory"
+    PRODUCT = "product"
+    OUTPUT_MISMATCH_ERROR = (
+        "Вывод {serializer} для {size} объектов отличается от "
+        "вывода ModelSerializer."
+    )
+
+
+class SeedBenchmarkDataCfg:
+    """Настройки команды заполнения базы данных для нагрузочных тестов."""
+
+    CATEGORIES = 10
+    SUBCATEGORIES = 5
+    PRODUCTS = 100
+    USERS = 100
+    CART_ITEMS = 5
+    BATCH_SIZE = 1000
+    RANDOM_SEED = 20240601
+    PRICE_MIN = 100
+    PRICE_MAX = 100000
+    PREFIX = "load-"
+    SLUG = "load-{kind}-{index}"
+    TITLE = "Нагрузка {kind} {index}"
+    DESCRIPTION = "Описание {kind} {index} для нагрузочного теста"
+    IMAGE = "products/load-{index}.jpg"
+    USERNAME = "load-user-{index}"
+    PASSWORD = "load-password"
+    TOKEN = "load-token-{index}"
+    CATEGORY = "category"
+    SUBCATEGORY = "subcategory"
+    PRODUCT = "product"
+    SUMMARY = (
+        "Создано категорий: {categories}, подкатегорий: {subcategories}, "
+        "продуктов: {products}, пользователей с корзинами: {users} "
+        "за {elapsed:.1f} с."
+    )
+
+
+class BenchmarkApiCfg:
+    """Настройки команды нагрузочного тестирования API."""
+
+    TRANSPORT_CLIENT = "client"
+    TRANSPORT_HTTP = "http"
+    TRANSPORTS = (TRANSPORT_CLIENT, TRANSPORT_HTTP)
+    REQUESTS = 200
+    CONCURRENCY = (1, 8)
+    WARMUP = 10
+    TIMEOUT = 30
+    HOST = "127.0.0.1"
+    DEFAULT_HOST = "localhost"
+    SERVER_URL = "http://{host}:{port}"
+    HOST_HEADER = "Host"
+    CONTENT_TYPE_HEADER = "Content-Type"
+    AUTHORIZATION_HEADER = "Authorization"
+    AUTHORIZATION = "Token {key}"
+    JSON_CONTENT_TYPE = "application/json"
+    GIT_COMMIT_COMMAND = ("git", "rev-parse", "--short", "HEAD")
+    TOKEN_KEY = "key"
+    TOKEN_ORDERING = "user_id"
+    PRODUCT_ORDERING = "pk"
+    CART_PRODUCTS = 20
+    QUANTITY = 2
+    PERCENTILES = (50, 90, 95, 99)
+    QUERIES_PATTERN = r'db;[^,]*desc="(\d+) queries"'
+    GET = "get"
+    MAX_PAGES = 10
+    PRODUCTS_URL = "/api/v1/products/?page={page}"
+    CATEGORIES_URL = "/api/v1/product_categories/?page={page}"
+    CART_URL = "/api/v1/cart/"
+    CART_ACTION_URL = "/api/v1/cart/{action}/"
+    ADD_ITEM = "add_item"
+    UPDATE_ITEM = "update_item"
+    REMOVE_ITEM = "remove_item"
+    BATCH = "batch"
+    CLEAR_CART = "clear_cart"
+    PRODUCTS_LIST = "products-list"
+    CATEGORIES_LIST = "product-categories-list"
+    CART_LIST = "cart-list"
+    CART_ADD_ITEM = "cart-add-item"
+    CART_UPDATE_ITEM = "cart-update-item"
+    CART_REMOVE_ITEM = "cart-remove-item"
+    CART_BATCH = "cart-batch"
+    CART_CLEAR_CART = "cart-clear-cart"
+    SCENARIOS = (
+        PRODUCTS_LIST,
+        CATEGORIES_LIST,
+        CART_LIST,
+        CART_ADD_ITEM,
+        CART_UPDATE_ITEM,
+        CART_REMOVE_ITEM,
+        CART_BATCH,
+        CART_CLEAR_CART,
+    )
+    NO_USERS_ERROR = (
+        "Нет пользователей для нагрузочного теста. Выполните команду "
+        "seed_benchmark_data."
+    )
+    NO_PRODUCTS_ERROR = (
+        "Нет продуктов для нагрузочного теста. Выполните команду "
+        "seed_benchmark_data."
+    )
+    UNKNOWN_SCENARIO_ERROR = "Неизвестный сценарий: {scenario}."
+
+
+class BenchmarkDatabaseCfg:
+    """Настройки команды сравнения конфигураций базы данных."""
+
+    PER_REQUEST = "per-request"
+    PERSISTENT = "persistent"
+    POOL = "pool"
+    ROLLBACK_JOURNAL = "rollback-journal"
+    CONFIGS = {
+        ROLLBACK_JOURNAL: {
+            "DB_CONN_MAX_AGE": "0",
+            "DB_POOL_MAX_SIZE": "0",
+            "SQLITE_JOURNAL_MODE": "delete",
+            "SQLITE_SYNCHRONOUS": "full",
+        },
+        PER_REQUEST: {"DB_CONN_MAX_AGE": "0", "DB_POOL_MAX_SIZE": "0"},
+        PERSISTENT: {"DB_CONN_MAX_AGE": "60", "DB_POOL_MAX_SIZE": "0"},
+        POOL: {"DB_CONN_MAX_AGE": "0", "DB_POOL_MAX_SIZE": "16"},
+    }
+    SQLITE_CONFIGS = (ROLLBACK_JOURNAL, PER_REQUEST, PERSISTENT)
+    POSTGRESQL_CONFIGS = (PER_REQUEST, PERSISTENT, POOL)
+    POSTGRESQL_VENDOR = "postgresql"
+    SQLITE_ONLY_CONFIGS = (ROLLBACK_JOURNAL,)
+    POSTGRESQL_ONLY_CONFIGS = (POOL,)
+    SCENARIOS = (
+        BenchmarkApiCfg.CART_ADD_ITEM,
+        BenchmarkApiCfg.CART_UPDATE_ITEM,
+        BenchmarkApiCfg.CART_BATCH,
+    )
+    CONCURRENCY = (1, 8)
+    REQUESTS = 200
+    BENCHMARK_COMMAND = "benchmark_api"
+    MANAGE_PY = "manage.py"
+    RESULT_KEY = ("scenario", "concurrency")
+    UNSUPPORTED_CONFIG_ERROR = (
+        "Конфигурация {name} не поддерживается базой данных {vendor}."
+    )
+    FAILED_ERROR = (
+        "Нагрузочный тест конфигурации {name} завершился ошибкой:\n{stderr}"
+    )
+
+
+class BenchmarkAsgiCfg:
+    """Настройки команды сравнения развёртываний WSGI и ASGI."""
+
+    WSGI = "wsgi"
+    ASGI = "asgi"
+    DEPLOYMENTS = {
+        WSGI: ("wsgi", "config.wsgi:application"),
+        ASGI: ("asgi3", "config.asgi:application"),
+    }
+    SERVER_COMMAND = (
+        "-m",
+        "uvicorn",
+        "--host",
+        "{host}",
+        "--port",
+        "{port}",
+        "--interface",
+        "{interface}",
+        "--log-level",
+        "warning",
+        "--no-access-log",
+        "{application}",
+    )
+    SCENARIOS = (
+        BenchmarkApiCfg.PRODUCTS_LIST,
+        BenchmarkApiCfg.CATEGORIES_LIST,
+        BenchmarkApiCfg.CART_LIST,
+        BenchmarkApiCfg.CART_ADD_ITEM,
+    )
+    CONCURRENCY = (1, 8, 32)
+    REQUESTS = 400
+    BENCHMARK_COMMAND = "benchmark_api"
+    STARTUP_TIMEOUT = 30
+    STARTUP_POLL_INTERVAL = 0.1
+    STOP_TIMEOUT = 10
+    RESULT_KEY = ("scenario", "concurrency")
+    NO_UVICORN_ERROR = (
+        "Для сравнения нужен ASGI-сервер uvicorn: pip install uvicorn."
+    )
+    STARTUP_ERROR = "Сервер {deployment} не запустился:\n{stderr}"
+
+
+class BenchmarkJSONCfg:
+    """Настройки команды сравнения скорости рендеринга и разбора JSON."""
+
+    PAGE_SIZES = (100, 1000)
+    REPEAT = 20
+    PRICE = "price"
+    PAGE_COUNT = "count"
+    PAGE_NEXT = "next"
+    PAGE_PREVIOUS = "previous"
+    PAGE_RESULTS = "results"
+    PAGE_URL = "http://localhost/api/v1/products/?page=2"
+    OUTPUT_MISMATCH_ERROR = (
+        "Вывод api.renderers.JSONRenderer для страницы из {size} продуктов "
+        "({case}) отличается от вывода стандартного JSONRenderer."
+    )
+    PARSE_MISMATCH_ERROR = (
+        "Результат api.parsers.JSONParser для страницы из {size} продуктов "
+        "отличается от результата стандартного JSONParser."
+    )
+    NO_ORJSON_WARNING = (
+        "orjson не установлен или отключён настройкой FAST_JSON, "
+        "сравнивается стандартный JSON сам с собой."
+    )
+
+
+class BenchmarkCompressionCfg:
+    """Настройки команды измерения эффекта сжатия и условных запросов."""
+
+    URLS = (
+        "/api/v1/products/?page=1",
+        "/api/v1/products/?page=2",
+        "/api/v1/product_categories/?page=1",
+        "/api/v1/product_categories/tree/",
+    )
+    REQUESTS = 50
+    BANDWIDTH = 10.0
+    DEFAULT_HOST = "localhost"
+    IDENTITY = "identity"
+    NOT_MODIFIED = "not-modified"
+    ACCEPT_ENCODING_HEADER = "Accept-Encoding"
+    IF_NONE_MATCH_HEADER = "If-None-Match"
+    ETAG_HEADER = "ETag"
+    NO_PRODUCTS_ERROR = (
+        "Нет продуктов для измерений. Выполните команду seed_benchmark_data."
+    )
+    NO_ETAG_ERROR = "Ответ {url} не содержит заголовка ETag."
+
+
+class DatabaseCfg:
+    """Настройки подключений к базе данных."""
+
+    SQLITE_VENDOR = "sqlite"
+    PRAGMA = "PRAGMA {name} = {value}"
+    PRIMARY_PIN_KEY = "db:primary:{digest}"
+    PRIMARY_PIN_HEADER = "Authorization"
+    PRIMARY_PIN_COOKIES = ("sessionid",)
+
+
+class MetricsCfg:
+    """Настройки метрик производительности запросов."""
+
+    DURATION_BUCKETS = (
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+    )
+    QUERIES_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+    ROUTE = "route"
+    METHOD = "method"
+    METHODS = ("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS")
+    OTHER_METHOD = "other"
+    STATUS = "status"
+    UNMATCHED_ROUTE = "unmatched"
+    REQUEST_DURATION = "http_request_duration_seconds"
+    REQUEST_DURATION_HELP = "Время обработки запроса."
+    DB_DURATION = "http_request_db_duration_seconds"
+    DB_DURATION_HELP = "Время запросов к базе данных за запрос."
+    DB_QUERIES = "http_request_db_queries"
+    DB_QUERIES_HELP = "Количество запросов к базе данных за запрос."
+    SERIALIZATION_DURATION = "http_request_serialization_duration_seconds"
+    SERIALIZATION_DURATION_HELP = "Время сериализации ответа."
+    REQUESTS = "http_requests_total"
+    REQUESTS_HELP = "Количество обработанных запросов."
+    CACHE_HITS = "http_request_cache_hits_total"
+    CACHE_HITS_HELP = "Количество попаданий в кэш."
+    CACHE_MISSES = "http_request_cache_misses_total"
+    CACHE_MISSES_HELP = "Количество промахов кэша."
+    HELP = "# HELP {name} {documentation}"
+    TYPE = "# TYPE {name} {type}"
+    HISTOGRAM = "histogram"
+    COUNTER = "counter"
+    SAMPLE = "{name}{{{labels}}} {value}"
+    LABEL = '{name}="{value}"'
+    BUCKET = "_bucket"
+    SUM = "_sum"
+    COUNT = "_count"
+    LE = "le"
+    INF = "+Inf"
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+    REMOTE_ADDR = "REMOTE_ADDR"
+    SERVER_TIMING_HEADER = "Server-Timing"
+    SERVER_TIMING = (
+        "app;dur={app:.2f}, "
+        'db;dur={db:.2f};desc="{queries} queries", '
+        "serialize;dur={serialization:.2f}, "
+        'cache;desc="{hits} hits, {misses} misses"'
+    )
+
+
+class JSONCfg:
+    """Настройки рендеринга и разбора JSON."""
+
+    ENCODING = "utf-8"
+    LONG_INTEGER_PATTERN = rb"\d{19}"
+    SEPARATORS_PREFIX = "\u2028".encode()[:2]
+    ESCAPED_SEPARATORS = (
+        ("\u2028".encode(), b"\\u2028"),
+        ("\u2029".encode(), b"\\u2029"),
+    )
+
+
+class SearchCfg:
+    """Настройки полнотекстового поиска продуктов."""
+
+    FIELDS = ("title", "description")
+    ROW_FIELDS = ("pk", "title", "description")
+    TOKEN_PATTERN = r"\w+"
+    MAX_TOKENS = 10
+    FTS5_TABLE = "store_product_fts"
+    FTS5_TOKENIZER = "unicode61 remove_diacritics 2"
+    FTS5_TITLE_WEIGHT = 10.0
+    FTS5_DESCRIPTION_WEIGHT = 1.0
+    FTS5_CREATE_TABLE = (
+        "CREATE VIRTUAL TABLE IF NOT EXISTS {table} "
+        "USING fts5(title, description, tokenize='{tokenizer}')"
+    )
+    FTS5_TABLE_EXISTS = (
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s"
+    )
+    FTS5_DELETE = "DELETE FROM {table} WHERE rowid IN ({placeholders})"
+    FTS5_DELETE_ALL = "DELETE FROM {table}"
+    FTS5_INSERT = (
+        "INSERT INTO {table} (rowid, title, description) VALUES (%s, %s, %s)"
+    )
+    FTS5_COUNT = "SELECT COUNT(*) FROM {table} WHERE {table} MATCH %s"
+    FTS5_SEARCH = (
+        "SELECT rowid FROM {table} WHERE {table} MATCH %s "
+        "ORDER BY bm25({table}, %s, %s), rowid LIMIT %s OFFSET %s"
+    )
+    FTS5_TERM = '"{token}"*'
+    FTS5_AND = " AND "
+    TITLE_LOOKUP = "title__icontains"
+    DESCRIPTION_LOOKUP = "description__icontains"
+    TITLE_MATCH = "title_match"
+    DATABASE_ORDER = ("-title_match", "pk")
+    PK_IN_LOOKUP = "pk__in"
+    REBUILD_BATCH_SIZE = 1000
+    REBUILD_SUMMARY = "Проиндексировано {count} продуктов за {elapsed:.1f} с."
 
 
 class ProductCfg:
@@ -119,12 +585,46 @@ class ProductCfg:
     PREVIEW_PROCESSORS_WIDTH = 400
     PREVIEW_PROCESSORS_HEIGHT = 400
     PREVIEW_OPTIONS = {"quality": 75}
+    TITLE_INDEX_FIELDS = ("title",)
+    TITLE_INDEX_NAME = "product_title_idx"
+    PRICE_INDEX_FIELDS = ("price", "id")
+    PRICE_INDEX_NAME = "product_price_idx"
+    CATEGORY_PRICE_INDEX_FIELDS = ("product_category", "price", "id")
+    CATEGORY_PRICE_INDEX_NAME = "product_cat_price_idx"
+    CATEGORY_TITLE_INDEX_FIELDS = ("product_category", "title", "id")
+    CATEGORY_TITLE_INDEX_NAME = "product_cat_title_idx"
+    SUBCATEGORY_PRICE_INDEX_FIELDS = ("product_subcategory", "price", "id")
+    SUBCATEGORY_PRICE_INDEX_NAME = "product_subcat_price_idx"
+    SUBCATEGORY_TITLE_INDEX_FIELDS = ("product_subcategory", "title", "id")
+    SUBCATEGORY_TITLE_INDEX_NAME = "product_subcat_title_idx"
+    RENDITION_NAME_MAX_LENGTH = 255
+    THUMBNAIL_NAME_VERBOSE_NAME = "Путь к миниатюре продукта"
+    PREVIEW_NAME_VERBOSE_NAME = "Путь к превью продукта"
+    IMAGE = "image"
+    RENDITIONS = (
+        ("thumbnail", "thumbnail_name"),
+        ("preview", "preview_name"),
+    )
+    CATALOG_ORDER = ("pk",)
+    CATALOG_RELATED_FIELDS = ("product_category", "product_subcategory")
+    CATALOG_ONLY_FIELDS = (
+        "title",
+        "slug",
+        "price",
+        "image",
+        "thumbnail_name",
+        "preview_name",
+        "product_category__title",
+        "product_subcategory__title",
+    )
 
 
 class ProductCategoryCfg:
     """Настройки для модели Product."""
 
     PRODUCT_CATEGORY_ORDER = ["title"]
+    TITLE_INDEX_FIELDS = ("title",)
+    TITLE_INDEX_NAME = "product_category_title_idx"
     VERBOSE_NAME = "категория продуктов"
     VERBOSE_NAME_PLURAL = "категории продуктов"
 
@@ -155,6 +655,20 @@ class SerializersCfg:
 
     PRODUCT_TITLE = "product.title"
     QUANTITY_DEFAULT = 1
+    QUANTITY_MIN_VALUE = 1
+    OP = "op"
+    QUANTITY = "quantity"
+    CART_BATCH_OP_ADD = "add"
+    CART_BATCH_OP_UPDATE = "update"
+    CART_BATCH_OP_REMOVE = "remove"
+    CART_BATCH_OPERATIONS = (
+        CART_BATCH_OP_ADD,
+        CART_BATCH_OP_UPDATE,
+        CART_BATCH_OP_REMOVE,
+    )
+    CART_BATCH_QUANTITY_REQUIRED_ERROR = (
+        "Для операции {op} необходимо указать quantity."
+    )
     PRODUCT_SUBCATEGORY_SERIALIZER_META_FIELDS = ("title", "slug")
     PRODUCT_CATEGORY_SERIALIZER_META_FIELDS = (
         "title",
@@ -171,6 +685,22 @@ class SerializersCfg:
     )
     CART_ITEM_SERIALIZER_META_FIELDS = ("product", "quantity")
     SHORT_CART_ITEM_SERIALIZER_META_FIELDS = ("product",)
+    CATEGORY_TREE_CATEGORY_FIELDS = ("pk", "title", "slug")
+    CATEGORY_TREE_SUBCATEGORY_FIELDS = ("product_category", "title", "slug")
+    CATEGORY_TREE_SUBCATEGORY_ORDER = ("pk",)
+    FAST_PRODUCT_ROW_FIELDS = (
+        "pk",
+        "title",
+        "slug",
+        "product_category__title",
+        "product_subcategory__title",
+        "price",
+        "image",
+        "thumbnail_name",
+        "preview_name",
+    )
+    FAST_PRODUCT_CATEGORY_ROW_FIELDS = ("pk", "title", "slug")
+    FAST_PRODUCT_SUBCATEGORY_FILTER = "product_category__in"
     CART_SERIALIZER_META_FIELDS = (
         "user",
         "items",
@@ -179,6 +709,56 @@ class SerializersCfg:
     )
 
 
+class FiltersCfg:
+    """Настройки фильтров приложения api."""
+
+    CATEGORY = "category"
+    SUBCATEGORY = "subcategory"
+    PRICE_MIN = "price_min"
+    PRICE_MAX = "price_max"
+    CATEGORY_LOOKUP = "product_category__slug"
+    SUBCATEGORY_LOOKUP = "product_subcategory__slug"
+    PRICE_MIN_LOOKUP = "price__gte"
+    PRICE_MAX_LOOKUP = "price__lte"
+    PRODUCT_ORDERING_FIELDS = ("price", "title")
+    ORDERING_TIEBREAKER = "pk"
+    DESCENDING = "-"
+    INVALID_PRICE_ERROR = "Некорректная стоимость: {price}."
+    CATEGORY_DESCRIPTION = "Slug категории продуктов."
+    SUBCATEGORY_DESCRIPTION = "Slug подкатегории продуктов."
+    PRICE_MIN_DESCRIPTION = "Минимальная стоимость продукта."
+    PRICE_MAX_DESCRIPTION = "Максимальная стоимость продукта."
+    ORDERING_DESCRIPTION = "Сортировка: price, -price, title или -title."
+
+
+class CheckProductPlansCfg:
+    """Настройки команды проверки планов запросов к продуктам."""
+
+    QUERIES = (
+        "category=c",
+        "subcategory=s",
+        "price_min=1&price_max=2",
+        "category=c&ordering=price",
+        "category=c&ordering=-title",
+        "subcategory=s&ordering=-price",
+        "subcategory=s&ordering=title",
+        "category=c&price_min=1&price_max=2&ordering=price",
+        "subcategory=s&price_min=1&price_max=2&ordering=-price",
+        "ordering=price",
+        "ordering=-title",
+    )
+    FULL_SCAN_PATTERN = (
+        r"^(?!.*USING (COVERING )?INDEX).*SCAN {table}\b"
+        r"|Seq Scan on {table}\b"
+    )
+    FULL_SORT_PATTERN = r"USE TEMP B-TREE FOR ORDER BY"
+    ORDERING_PARAM = "ordering="
+    PLAN_OK = "{query}: план использует индексы."
+    PLAN_ERROR = "{query}: полное сканирование {table}.\n{plan}"
+    PLAN_SORT_ERROR = "{query}: сортировка без индекса.\n{plan}"
+    FAILED = "Найдены запросы с полным сканированием таблицы продуктов."
+
+
 class ViewsCfg:
     """Настройки для представлений приложения api."""
 
@@ -186,8 +766,28 @@ class ViewsCfg:
     REMOVE_ITEM_HTTP_METHODS = ("delete",)
     UPDATE_ITEM_HTTP_METHODS = ("patch",)
     CLEAR_CART_HTTP_METHODS = ("delete",)
+    BATCH_HTTP_METHODS = ("post",)
+    TREE_HTTP_METHODS = ("get",)
+    TREE = "tree"
+    SEARCH_HTTP_METHODS = ("get",)
+    SEARCH = "search"
+    SEARCH_QUERY_PARAM = "q"
+    SEARCH_QUERY_DESCRIPTION = "Слова для поиска в наименовании и описании."
+    SEARCH_QUERY_REQUIRED_ERROR = "Укажите слова для поиска."
+    JSON = "json"
+    JSON_CONTENT_TYPE = "application/json"
+    PAGE_COUNT = "count"
+    PAGE_NEXT = "next"
+    PAGE_PREVIOUS = "previous"
+    PAGE_RESULTS = b',"results":['
+    PAGE_END = b"]}"
+    BATCH_MAX_OPERATIONS = 500
     PRODUCT = "product"
     QUANTITY = "quantity"
+    OP = "op"
+    OP_ADD = "add"
+    OP_UPDATE = "update"
+    PRODUCT_TITLE = "title"
     QUANTITY_DEFAULT_VALUE = 1
     GET_PRODUCT_VALIDATION_ERROR = (
         "Продукта с наименованием {product_title} не существует."
@@ -0,0 +1,391 @@
+"""
+Модуль для сбора метрик производительности запросов.
+
+Метрики текущего запроса (запросы к базе данных, сериализация ответа,
+обращения к кэшу) накапливаются в объекте RequestMetrics, доступном через
+переменную контекста request_metrics. Вне запроса функции записи метрик
+ничего не делают.
+
+Гистограммы и счётчики хранятся в памяти процесса и выводятся в текстовом
+формате Prometheus. Реестр метрик свой у каждого процесса и между
+процессами не разделяется: если gunicorn или uvicorn запущен с
+несколькими воркерами на одном порту, запрос к /metrics обслуживает
+случайный воркер, и в ответе будут только его числа. Для полной картины
+каждый воркер опрашивается как отдельная цель Prometheus (например, по
+одному воркеру на контейнер), а суммирование выполняет Prometheus.
+
+Нестандартные HTTP-методы учитываются в метке method как other, чтобы
+клиент не мог создавать новые временные ряды произвольными методами.
+"""
+
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from time import perf_counter
+
+from core.constants import MetricsCfg
+
+request_metrics = ContextVar("request_metrics", default=None)
+
+
+class RequestMetrics:
+    """
+    Метрики одного запроса.
+
+    Атрибуты:
+        started (float): Время начала запроса по perf_counter.
+        db_queries (int): Количество запросов к базе данных.
+        db_time (float): Время запросов к базе данных в секундах.
+        serialization_time (float): Время сериализации ответа в секундах.
+        cache_hits (int): Количество попаданий в кэш.
+        cache_misses (int): Количество промахов кэша.
+    """
+
+    __slots__ = (
+        "started",
+        "db_queries",
+        "db_time",
+        "serialization_time",
+        "cache_hits",
+        "cache_misses",
+    )
+
+    def __init__(self):
+        """Начинает сбор метрик запроса."""
+        self.started = perf_counter()
+        self.db_queries = 0
+        self.db_time = 0.0
+        self.serialization_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def get_server_timing(self, duration: float) -> str:
+        """
+        Возвращает значение заголовка Server-Timing.
+
+        Параметры:
+            duration (float): Время обработки запроса в секундах.
+
+        Возвращает:
+            str: Значение заголовка с длительностями в миллисекундах.
+        """
+        return MetricsCfg.SERVER_TIMING.format(
+            app=duration * 1000,
+            db=self.db_time * 1000,
+            queries=self.db_queries,
+            serialization=self.serialization_time * 1000,
+            hits=self.cache_hits,
+            misses=self.cache_misses,
+        )
+
+
+def record_query(execute, sql, params, many, context):
+    """
+    Учитывает запрос к базе данных в метриках текущего запроса.
+
+    Подключается ко всем соединениям с базой данных как execute_wrapper.
+
+    Параметры:
+        execute: Следующая функция выполнения запроса.
+        sql (str): SQL-запрос.
+        params: Параметры запроса.
+        many (bool): Выполняется ли executemany.
+        context (dict): Соединение и курсор.
+
+    Возвращает:
+        Результат выполнения запроса.
+    """
+    metrics = request_metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.db_time += perf_counter() - started
+        metrics.db_queries += 1
+
+
+@contextmanager
+def record_serialization():
+    """Учитывает время выполнения блока как время сериализации ответа."""
+    metrics = request_metrics.get()
+    if metrics is None:
+        yield
+        return
+    started = perf_counter()
+    try:
+        yield
+    finally:
+        metrics.serialization_time += perf_counter() - started
+
+
+def record_cache(hit: bool) -> None:
+    """
+    Учитывает обращение к кэшу в метриках текущего запроса.
+
+    Параметры:
+        hit (bool): True для попадания в кэш, False для промаха.
+    """
+    metrics = request_metrics.get()
+    if metrics is None:
+        return
+    if hit:
+        metrics.cache_hits += 1
+    else:
+        metrics.cache_misses += 1
+
+
+def format_labels(labels: tuple, values: tuple) -> str:
+    """
+    Возвращает метки образца в формате Prometheus.
+
+    Параметры:
+        labels (tuple): Имена меток.
+        values (tuple): Значения меток.
+
+    Возвращает:
+        str: Метки через запятую.
+    """
+    return ",".join(
+        MetricsCfg.LABEL.format(name=name, value=value)
+        for name, value in zip(labels, values)
+    )
+
+
+class Counter:
+    """Счётчик с метками."""
+
+    type = MetricsCfg.COUNTER
+
+    def __init__(self, name: str, documentation: str, labels: tuple):
+        """
+        Создает счётчик.
+
+        Параметры:
+            name (str): Имя метрики.
+            documentation (str): Описание метрики.
+            labels (tuple): Имена меток.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self.values = {}
+        self.lock = Lock()
+
+    def inc(self, values: tuple, amount: float = 1) -> None:
+        """
+        Увеличивает счётчик.
+
+        Параметры:
+            values (tuple): Значения меток.
+            amount (float): На сколько увеличить счётчик.
+        """
+        with self.lock:
+            self.values[values] = self.values.get(values, 0) + amount
+
+    def collect(self) -> list:
+        """
+        Возвращает образцы счётчика в формате Prometheus.
+
+        Возвращает:
+            list: Строки с образцами.
+        """
+        with self.lock:
+            values = sorted(self.values.items())
+        return [
+            MetricsCfg.SAMPLE.format(
+                name=self.name,
+                labels=format_labels(self.labels, label_values),
+                value=value,
+            )
+            for label_values, value in values
+        ]
+
+
+class Histogram:
+    """Гистограмма с метками и фиксированными границами корзин."""
+
+    type = MetricsCfg.HISTOGRAM
+
+    def __init__(
+        self, name: str, documentation: str, labels: tuple, buckets: tuple
+    ):
+        """
+        Создает гистограмму.
+
+        Параметры:
+            name (str): Имя метрики.
+            documentation (str): Описание метрики.
+            labels (tuple): Имена меток.
+            buckets (tuple): Верхние границы корзин по возрастанию.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self.buckets = buckets
+        self.values = {}
+        self.lock = Lock()
+
+    def observe(self, values: tuple, value: float) -> None:
+        """
+        Учитывает наблюдение в гистограмме.
+
+        Параметры:
+            values (tuple): Значения меток.
+            value (float): Наблюдаемое значение.
+        """
+        index = bisect_left(self.buckets, value)
+        with self.lock:
+            counts, total = self.values.get(values, (None, 0))
+            if counts is None:
+                counts = [0] * (len(self.buckets) + 1)
+            counts[index] += 1
+            self.values[values] = (counts, total + value)
+
+    def collect(self) -> list:
+        """
+        Возвращает образцы гистограммы в формате Prometheus.
+
+        Корзины выводятся накопительно, как того требует формат.
+
+        Возвращает:
+            list: Строки с образцами.
+        """
+        with self.lock:
+            values = sorted(
+                (label_values, list(counts), total)
+                for label_values, (counts, total) in self.values.items()
+            )
+        lines = []
+        bounds = [str(bound) for bound in self.buckets] + [MetricsCfg.INF]
+        for label_values, counts, total in values:
+            labels = format_labels(self.labels, label_values)
+            prefix = labels + "," if labels else ""
+            cumulative = 0
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                lines.append(
+                    MetricsCfg.SAMPLE.format(
+                        name=self.name + MetricsCfg.BUCKET,
+                        labels=prefix
+                        + MetricsCfg.LABEL.format(
+                            name=MetricsCfg.LE, value=bound
+                        ),
+                        value=cumulative,
+                    )
+                )
+            lines.append(
+                MetricsCfg.SAMPLE.format(
+                    name=self.name + MetricsCfg.SUM, labels=labels, value=total
+                )
+            )
+            lines.append(
+                MetricsCfg.SAMPLE.format(
+                    name=self.name + MetricsCfg.COUNT,
+                    labels=labels,
+                    value=cumulative,
+                )
+            )
+        return lines
+
+
+ROUTE_LABELS = (MetricsCfg.ROUTE,)
+
+REQUEST_DURATION = Histogram(
+    MetricsCfg.REQUEST_DURATION,
+    MetricsCfg.REQUEST_DURATION_HELP,
+    ROUTE_LABELS,
+    MetricsCfg.DURATION_BUCKETS,
+)
+DB_DURATION = Histogram(
+    MetricsCfg.DB_DURATION,
+    MetricsCfg.DB_DURATION_HELP,
+    ROUTE_LABELS,
+    MetricsCfg.DURATION_BUCKETS,
+)
+DB_QUERIES = Histogram(
+    MetricsCfg.DB_QUERIES,
+    MetricsCfg.DB_QUERIES_HELP,
+    ROUTE_LABELS,
+    MetricsCfg.QUERIES_BUCKETS,
+)
+SERIALIZATION_DURATION = Histogram(
+    MetricsCfg.SERIALIZATION_DURATION,
+    MetricsCfg.SERIALIZATION_DURATION_HELP,
+    ROUTE_LABELS,
+    MetricsCfg.DURATION_BUCKETS,
+)
+REQUESTS = Counter(
+    MetricsCfg.REQUESTS,
+    MetricsCfg.REQUESTS_HELP,
+    (MetricsCfg.ROUTE, MetricsCfg.METHOD, MetricsCfg.STATUS),
+)
+CACHE_HITS = Counter(
+    MetricsCfg.CACHE_HITS, MetricsCfg.CACHE_HITS_HELP, ROUTE_LABELS
+)
+CACHE_MISSES = Counter(
+    MetricsCfg.CACHE_MISSES, MetricsCfg.CACHE_MISSES_HELP, ROUTE_LABELS
+)
+METRICS = (
+    REQUEST_DURATION,
+    DB_DURATION,
+    DB_QUERIES,
+    SERIALIZATION_DURATION,
+    REQUESTS,
+    CACHE_HITS,
+    CACHE_MISSES,
+)
+
+
+def observe_request(
+    route: str, method: str, status: int, metrics: RequestMetrics
+) -> float:
+    """
+    Учитывает завершённый запрос в гистограммах и счётчиках.
+
+    Параметры:
+        route (str): Имя маршрута, например products-list.
+        method (str): HTTP-метод, нестандартные учитываются как other.
+        status (int): Код ответа.
+        metrics (RequestMetrics): Метрики запроса.
+
+    Возвращает:
+        float: Время обработки запроса в секундах.
+    """
+    duration = perf_counter() - metrics.started
+    labels = (route,)
+    REQUEST_DURATION.observe(labels, duration)
+    DB_DURATION.observe(labels, metrics.db_time)
+    DB_QUERIES.observe(labels, metrics.db_queries)
+    SERIALIZATION_DURATION.observe(labels, metrics.serialization_time)
+    if method not in MetricsCfg.METHODS:
+        method = MetricsCfg.OTHER_METHOD
+    REQUESTS.inc((route, method, status))
+    if metrics.cache_hits:
+        CACHE_HITS.inc(labels, metrics.cache_hits)
+    if metrics.cache_misses:
+        CACHE_MISSES.inc(labels, metrics.cache_misses)
+    return duration
+
+
+def render_metrics() -> str:
+    """
+    Возвращает все метрики в текстовом формате Prometheus.
+
+    Возвращает:
+        str: Метрики с описаниями и типами.
+    """
+    lines = []
+    for metric in METRICS:
+        lines.append(
+            MetricsCfg.HELP.format(
+                name=metric.name, documentation=metric.documentation
+            )
+        )
+        lines.append(
+            MetricsCfg.TYPE.format(name=metric.name, type=metric.type)
+        )
+        lines.extend(metric.collect())
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,364 @@
+"""Промежуточные слои приложения core."""
+
+from hashlib import sha256
+from http import HTTPStatus
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from core.compression import (
+    add_etag_encoding,
+    compress,
+    is_compressible,
+    negotiate_encoding,
+    strip_etag_encoding,
+)
+from core.constants import CompressionCfg, DatabaseCfg, MetricsCfg
+from core.metrics import RequestMetrics, observe_request, request_metrics
+from core.routers import allow_replica_reads
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+
+
+class RequestMetricsMiddleware:
+    """
+    Собирает метрики производительности каждого запроса.
+
+    Для запроса учитываются время обработки, количество и время запросов
+    к базе данных, время сериализации ответа и обращения к кэшу. Метрики
+    передаются клиенту в заголовке Server-Timing и накапливаются в
+    гистограммах по имени маршрута (например, products-list или
+    cart-add-item), которые отдаёт представление /metrics.
+
+    Отключается настройкой REQUEST_METRICS=False.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        """
+        Инициализирует промежуточный слой.
+
+        Вызывает ошибку:
+            MiddlewareNotUsed: Если сбор метрик отключён.
+        """
+        if not settings.REQUEST_METRICS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    @staticmethod
+    def get_route(request: HttpRequest) -> str:
+        """
+        Возвращает имя маршрута запроса.
+
+        Параметры:
+            request (HttpRequest): Обработанный запрос.
+
+        Возвращает:
+            str: Имя маршрута или unmatched для неизвестного адреса.
+        """
+        if request.resolver_match is None:
+            return MetricsCfg.UNMATCHED_ROUTE
+        return request.resolver_match.view_name
+
+    def finalize_response(
+        self,
+        request: HttpRequest,
+        response: HttpResponse,
+        metrics: RequestMetrics,
+    ) -> HttpResponse:
+        """
+        Учитывает метрики запроса и добавляет заголовок Server-Timing.
+
+        Параметры:
+            request (HttpRequest): Обработанный запрос.
+            response (HttpResponse): Ответ на запрос.
+            metrics (RequestMetrics): Метрики запроса.
+
+        Возвращает:
+            HttpResponse: Ответ с заголовком Server-Timing.
+        """
+        duration = observe_request(
+            self.get_route(request),
+            request.method,
+            response.status_code,
+            metrics,
+        )
+        response[MetricsCfg.SERVER_TIMING_HEADER] = metrics.get_server_timing(
+            duration
+        )
+        return response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """
+        Выполняет запрос со сбором метрик.
+
+        Параметры:
+            request (HttpRequest): Входящий запрос.
+
+        Возвращает:
+            HttpResponse: Ответ на запрос.
+        """
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics = RequestMetrics()
+        token = request_metrics.set(metrics)
+        try:
+            response = self.get_response(request)
+        finally:
+            request_metrics.reset(token)
+        return self.finalize_response(request, response, metrics)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        """
+        Асинхронный вариант __call__.
+
+        Параметры:
+            request (HttpRequest): Входящий запрос.
+
+        Возвращает:
+            HttpResponse: Ответ на запрос.
+        """
+        metrics = RequestMetrics()
+        token = request_metrics.set(metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            request_metrics.reset(token)
+        return self.finalize_response(request, response, metrics)
+
+
+class ReplicaReadMiddleware:
+    """
+    Распределяет чтение каталога между репликами базы данных.
+
+    Читающие запросы могут читать модели каталога с реплик. Изменяющие
+    запросы (POST, PATCH, DELETE и т.д.) выполняются целиком на
+    основной базе данных. После такого запроса клиент, определяемый по
+    заголовку Authorization или cookie сессии, ещё REPLICA_STICKY_TIMEOUT
+    секунд читает из основной базы данных, чтобы видеть свои изменения
+    до их появления на репликах.
+
+    Поддерживает синхронный и асинхронный режимы, поэтому при запуске
+    через ASGI не переключает запрос в поток.
+    """
+
+    safe_methods = ("GET", "HEAD", "OPTIONS")
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        """Инициализирует промежуточный слой."""
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    @staticmethod
+    def get_pin_key(request: HttpRequest) -> str | None:
+        """
+        Возвращает ключ кэша, закрепляющий клиента за основной базой данных.
+
+        Параметры:
+            request (HttpRequest): Входящий запрос.
+
+        Возвращает:
+            str | None: Ключ кэша или None для анонимного клиента.
+        """
+        credentials = request.headers.get(DatabaseCfg.PRIMARY_PIN_HEADER, "")
+        if not credentials:
+            credentials = "".join(
+                request.COOKIES.get(name, "")
+                for name in DatabaseCfg.PRIMARY_PIN_COOKIES
+            )
+        if not credentials:
+            return None
+        return DatabaseCfg.PRIMARY_PIN_KEY.format(
+            digest=sha256(credentials.encode()).hexdigest()
+        )
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """
+        Выполняет запрос на основной базе данных или с чтением с реплик.
+
+        Параметры:
+            request (HttpRequest): Входящий запрос.
+
+        Возвращает:
+            HttpResponse: Ответ на запрос.
+        """
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not settings.DATABASE_REPLICAS:
+            return self.get_response(request)
+        key = self.get_pin_key(request)
+        is_write = request.method not in self.safe_methods
+        pinned = is_write or (key is not None and cache.get(key, False))
+        with allow_replica_reads(not pinned):
+            response = self.get_response(request)
+        if is_write and key is not None:
+            cache.set(key, True, settings.REPLICA_STICKY_TIMEOUT)
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        """
+        Асинхронный вариант __call__.
+
+        Параметры:
+            request (HttpRequest): Входящий запрос.
+
+        Возвращает:
+            HttpResponse: Ответ на запрос.
+        """
+        if not settings.DATABASE_REPLICAS:
+            return await self.get_response(request)
+        key = self.get_pin_key(request)
+        is_write = request.method not in self.safe_methods
+        pinned = is_write or (key is not None and await cache.aget(key, False))
+        with allow_replica_reads(not pinned):
+            response = await self.get_response(request)
+        if is_write and key is not None:
+            await cache.aset(key, True, settings.REPLICA_STICKY_TIMEOUT)
+        return response
+
+
+class CompressionMiddleware:
+    """
+    Сжимает ответы gzip или brotli по заголовку Accept-Encoding.
+
+    Сжимаются только ответы на GET и HEAD с текстом, JSON, JavaScript или
+    XML не короче COMPRESSION_MIN_SIZE байт, если сжатый ответ короче
+    исходного. Ответы на изменяющие запросы не сжимаются: в них могут быть
+    токены, а сжатие вместе с отражёнными данными открывает атаку BREACH.
+
+    К строгому ETag сжатого ответа добавляется суффикс кодировки. Суффикс
+    удаляется из If-None-Match до передачи запроса представлению, поэтому
+    представления сравнивают ETag несжатого ответа, а в ответе 304 клиент
+    получает тот ETag, который прислал.
+
+    Отключается настройкой COMPRESSION=False.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        """
+        Инициализирует промежуточный слой.
+
+        Вызывает ошибку:
+            MiddlewareNotUsed: Если сжатие отключено.
+        """
+        if not settings.COMPRESSION:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    @staticmethod
+    def process_request(request: HttpRequest) -> dict:
+        """
+        Удаляет суффиксы кодировок из ETag в заголовке If-None-Match.
+
+        Параметры:
+            request (HttpRequest): Входящий запрос.
+
+        Возвращает:
+            dict: ETag, переданные клиентом, по ETag без суффиксов.
+        """
+        if_none_match = request.META.get(CompressionCfg.IF_NONE_MATCH_META)
+        if not if_none_match:
+            return {}
+        etags = {
+            strip_etag_encoding(etag): etag
+            for etag in parse_etags(if_none_match)
+        }
+        request.META[CompressionCfg.IF_NONE_MATCH_META] = ", ".join(etags)
+        return etags
+
+    @staticmethod
+    def process_response(
+        request: HttpRequest, response: HttpResponse, etags: dict
+    ) -> HttpResponse:
+        """
+        Сжимает ответ, если клиент принимает сжатие.
+
+        Параметры:
+            request (HttpRequest): Обработанный запрос.
+            response (HttpResponse): Ответ на запрос.
+            etags (dict): ETag, переданные клиентом, по ETag без суффиксов.
+
+        Возвращает:
+            HttpResponse: Сжатый или исходный ответ.
+        """
+        if request.method not in CompressionCfg.SAFE_METHODS:
+            return response
+        if response.status_code == HTTPStatus.NOT_MODIFIED:
+            etag = response.get(CompressionCfg.ETAG_HEADER)
+            if etag in etags:
+                response[CompressionCfg.ETAG_HEADER] = etags[etag]
+            patch_vary_headers(
+                response, (CompressionCfg.ACCEPT_ENCODING_HEADER,)
+            )
+            return response
+        if (
+            response.streaming
+            or response.has_header(CompressionCfg.CONTENT_ENCODING_HEADER)
+            or not is_compressible(
+                response.get(CompressionCfg.CONTENT_TYPE_HEADER, "")
+            )
+        ):
+            return response
+        patch_vary_headers(response, (CompressionCfg.ACCEPT_ENCODING_HEADER,))
+        if len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+        encoding = negotiate_encoding(
+            request.headers.get(CompressionCfg.ACCEPT_ENCODING_HEADER, "")
+        )
+        if encoding is None:
+            return response
+        content = compress(response.content, encoding)
+        if len(content) >= len(response.content):
+            return response
+        response.content = content
+        response[CompressionCfg.CONTENT_LENGTH_HEADER] = str(len(content))
+        response[CompressionCfg.CONTENT_ENCODING_HEADER] = encoding
+        if response.has_header(CompressionCfg.ETAG_HEADER):
+            response[CompressionCfg.ETAG_HEADER] = add_etag_encoding(
+                response[CompressionCfg.ETAG_HEADER], encoding
+            )
+        return response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """
+        Выполняет запрос и сжимает ответ.
+
+        Параметры:
+            request (HttpRequest): Входящий запрос.
+
+        Возвращает:
+            HttpResponse: Ответ на запрос.
+        """
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        etags = self.process_request(request)
+        response = self.get_response(request)
+        return self.process_response(request, response, etags)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        """
+        Асинхронный вариант __call__.
+
+        Параметры:
+            request (HttpRequest): Входящий запрос.
+
+        Возвращает:
+            HttpResponse: Ответ на запрос.
+        """
+        etags = self.process_request(request)
+        response = await self.get_response(request)
+        return self.process_response(request, response, etags)
@@ -0,0 +1,83 @@
+"""Модуль для распределения запросов между базами данных."""
+
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+replica_reads = ContextVar("replica_reads", default=False)
+
+
+@contextmanager
+def allow_replica_reads(allowed: bool = True):
+    """
+    Разрешает чтение моделей каталога с реплик внутри блока.
+
+    Вне такого блока (в командах управления, фоновых задачах и изменяющих
+    запросах) и при заполнении кэшей каталога все чтения выполняются из
+    основной базы данных.
+
+    Параметры:
+        allowed (bool): False, чтобы читать из основной базы данных.
+    """
+    token = replica_reads.set(allowed)
+    try:
+        yield
+    finally:
+        replica_reads.reset(token)
+
+
+class PrimaryReplicaRouter:
+    """
+    Маршрутизатор основной базы данных и реплик для чтения.
+
+    Внутри блока allow_replica_reads чтение моделей из настройки
+    REPLICA_READ_MODELS выполняется со случайной реплики из
+    DATABASE_REPLICAS. Остальные модели (корзины, пользователи, токены)
+    читаются и все изменения записываются в основную базу данных.
+    """
+
+    def db_for_read(self, model, **hints) -> str:
+        """
+        Возвращает псевдоним базы данных для чтения модели.
+
+        Параметры:
+            model: Класс модели.
+            **hints: Подсказки маршрутизации.
+
+        Возвращает:
+            str: Псевдоним реплики или основной базы данных.
+        """
+        if (
+            settings.DATABASE_REPLICAS
+            and replica_reads.get()
+            and model._meta.label in settings.REPLICA_READ_MODELS
+        ):
+            return random.choice(settings.DATABASE_REPLICAS)
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints) -> str:
+        """
+        Возвращает псевдоним базы данных для записи модели.
+
+        Параметры:
+            model: Класс модели.
+            **hints: Подсказки маршрутизации.
+
+        Возвращает:
+            str: Псевдоним основной базы данных.
+        """
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool:
+        """
+        Разрешает связи между объектами основной базы данных и реплик.
+
+        Реплики содержат те же данные, что и основная база данных.
+
+        Возвращает:
+            bool: Всегда True.
+        """
+        return True
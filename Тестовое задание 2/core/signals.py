@@ -0,0 +1,45 @@
+"""Модуль для обработки сигналов приложения core."""
+
+from core.constants import DatabaseCfg
+from core.metrics import record_query
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+
+@receiver(connection_created)
+def configure_sqlite(sender, connection, **kwargs):
+    """
+    Настраивает новое подключение к SQLite.
+
+    Включает журнал WAL, при котором чтение не блокируется записью, и
+    применяет остальные параметры из настройки SQLITE_PRAGMAS. Время
+    ожидания блокировки задаётся параметром timeout в OPTIONS.
+
+    Параметры:
+        sender: Класс подключения, отправляющий сигнал.
+        connection: Созданное подключение к базе данных.
+        **kwargs: Дополнительные аргументы.
+    """
+    if connection.vendor != DatabaseCfg.SQLITE_VENDOR:
+        return
+    with connection.cursor() as cursor:
+        for name, value in settings.SQLITE_PRAGMAS.items():
+            cursor.execute(DatabaseCfg.PRAGMA.format(name=name, value=value))
+
+
+@receiver(connection_created)
+def install_query_metrics(sender, connection, **kwargs):
+    """
+    Подключает учёт запросов к базе данных в метриках запроса.
+
+    Обёртка добавляется в начало списка execute_wrappers один раз на
+    подключение и не снимается при выходе из блоков execute_wrapper.
+
+    Параметры:
+        sender: Класс подключения, отправляющий сигнал.
+        connection: Созданное подключение к базе данных.
+        **kwargs: Дополнительные аргументы.
+    """
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, record_query)
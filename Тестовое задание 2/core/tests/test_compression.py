@@ -0,0 +1,164 @@
+"""Тесты сжатия ответов."""
+
+import gzip
+import zlib
+from types import SimpleNamespace
+from unittest import mock
+
+from api.tests.utils import create_products
+from core.compression import negotiate_encoding
+from core.middleware import CompressionMiddleware
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.test import (
+    RequestFactory,
+    SimpleTestCase,
+    TestCase,
+    override_settings,
+)
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+FAKE_BROTLI = SimpleNamespace(
+    compress=lambda content, quality: zlib.compress(content),
+    decompress=zlib.decompress,
+)
+
+
+class NegotiateEncodingTests(SimpleTestCase):
+    """Проверяет выбор кодировки по заголовку Accept-Encoding."""
+
+    def test_gzip_only(self):
+        """Без brotli выбирается gzip, если клиент его принимает."""
+        with mock.patch("core.compression.brotli", None):
+            self.assertEqual(negotiate_encoding("gzip, br"), "gzip")
+            self.assertEqual(negotiate_encoding("br"), None)
+            self.assertEqual(negotiate_encoding("*"), "gzip")
+
+    def test_brotli(self):
+        """При равных q-значениях предпочитается br."""
+        with mock.patch("core.compression.brotli", FAKE_BROTLI):
+            self.assertEqual(negotiate_encoding("gzip, deflate, br"), "br")
+            self.assertEqual(negotiate_encoding("br;q=0.5, gzip"), "gzip")
+            self.assertEqual(negotiate_encoding("*;q=0.1, gzip"), "gzip")
+
+    def test_refused(self):
+        """Кодировки с q=0, identity и пустой заголовок не дают сжатия."""
+        for accept_encoding in ("", "identity", "gzip;q=0", "*;q=0"):
+            with self.subTest(accept_encoding=accept_encoding):
+                self.assertIsNone(negotiate_encoding(accept_encoding))
+
+
+class CompressionMiddlewareTests(TestCase):
+    """Проверяет сжатие ответов API промежуточным слоем."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создаёт каталог, список которого длиннее порога сжатия."""
+        create_products(30)
+
+    def setUp(self):
+        """Очищает кэши и создаёт клиент API."""
+        for cache in caches.all():
+            cache.clear()
+        self.client = APIClient()
+        self.url = reverse("products-list")
+
+    def get(self, **headers):
+        """
+        Запрашивает список продуктов с заголовками.
+
+        Параметры:
+            **headers: Заголовки запроса.
+
+        Возвращает:
+            Response: Ответ на запрос.
+        """
+        return self.client.get(self.url, headers=headers)
+
+    def assertVaryAcceptEncoding(self, response):
+        """Проверяет, что ответ зависит от заголовка Accept-Encoding."""
+        self.assertIn("Accept-Encoding", response.get("Vary", ""))
+
+    def test_gzip(self):
+        """Ответ сжимается gzip, ETag получает суффикс кодировки."""
+        plain = self.get()
+        self.assertGreater(len(plain.content), 1024)
+        response = self.get(Accept_Encoding="gzip, deflate")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(response.content), plain.content)
+        self.assertEqual(
+            int(response["Content-Length"]), len(response.content)
+        )
+        self.assertEqual(response["ETag"], plain["ETag"][:-1] + '-gzip"')
+        self.assertVaryAcceptEncoding(response)
+
+    def test_brotli(self):
+        """При установленном brotli ответ сжимается br."""
+        plain = self.get()
+        with mock.patch("core.compression.brotli", FAKE_BROTLI):
+            response = self.get(Accept_Encoding="gzip, br")
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertEqual(
+            FAKE_BROTLI.decompress(response.content), plain.content
+        )
+        self.assertEqual(response["ETag"], plain["ETag"][:-1] + '-br"')
+
+    def test_not_accepted(self):
+        """Без подходящей кодировки ответ не сжимается, Vary остаётся."""
+        for accept_encoding in ("", "identity", "br", "gzip;q=0"):
+            with self.subTest(accept_encoding=accept_encoding):
+                with mock.patch("core.compression.brotli", None):
+                    response = self.get(Accept_Encoding=accept_encoding)
+                self.assertFalse(response.has_header("Content-Encoding"))
+                self.assertVaryAcceptEncoding(response)
+
+    def test_min_size(self):
+        """Ответ короче COMPRESSION_MIN_SIZE не сжимается."""
+        size = len(self.get().content)
+        with override_settings(COMPRESSION_MIN_SIZE=size + 1):
+            response = self.get(Accept_Encoding="gzip")
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertVaryAcceptEncoding(response)
+        with override_settings(COMPRESSION_MIN_SIZE=size):
+            response = self.get(Accept_Encoding="gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+
+    def test_not_modified_round_trip(self):
+        """ETag сжатого ответа даёт 304 с тем же ETag в ответе."""
+        for encoding, brotli in (("gzip", None), ("br", FAKE_BROTLI)):
+            with self.subTest(encoding=encoding), mock.patch(
+                "core.compression.brotli", brotli
+            ):
+                etag = self.get(Accept_Encoding=encoding)["ETag"]
+                self.assertTrue(etag.endswith(f'-{encoding}"'))
+                response = self.get(
+                    Accept_Encoding=encoding, If_None_Match=f'"stale", {etag}'
+                )
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response["ETag"], etag)
+                self.assertVaryAcceptEncoding(response)
+
+    def test_not_modified_plain_etag(self):
+        """ETag несжатого ответа тоже подходит для сжатого."""
+        etag = self.get()["ETag"]
+        response = self.get(Accept_Encoding="gzip", If_None_Match=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_unsafe_method(self):
+        """Ответы на изменяющие запросы не сжимаются."""
+        content = b'{"token": "%s"}' % (b"x" * 2048)
+        middleware = CompressionMiddleware(
+            lambda request: HttpResponse(
+                content, content_type="application/json"
+            )
+        )
+        factory = RequestFactory(headers={"Accept-Encoding": "gzip"})
+        response = middleware(factory.get("/"))
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        for method in ("post", "patch", "delete"):
+            with self.subTest(method=method):
+                response = middleware(getattr(factory, method)("/"))
+                self.assertFalse(response.has_header("Content-Encoding"))
+                self.assertEqual(response.content, content)
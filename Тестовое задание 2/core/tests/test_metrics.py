@@ -0,0 +1,27 @@
+"""Тесты метрик производительности запросов."""
+
+from core.metrics import RequestMetrics, observe_request, render_metrics
+from django.test import SimpleTestCase
+
+
+class ObserveRequestTests(SimpleTestCase):
+    """Проверяет учёт запросов в счётчиках."""
+
+    ROUTE = "test-observe-request"
+
+    def test_standard_method(self):
+        """Стандартный метод попадает в метку method без изменений."""
+        observe_request(self.ROUTE, "PATCH", 200, RequestMetrics())
+        self.assertIn(
+            f'route="{self.ROUTE}",method="PATCH",status="200"',
+            render_metrics(),
+        )
+
+    def test_non_standard_method(self):
+        """Нестандартный метод учитывается в метке method как other."""
+        observe_request(self.ROUTE, "PURGE", 405, RequestMetrics())
+        content = render_metrics()
+        self.assertIn(
+            f'route="{self.ROUTE}",method="other",status="405"', content
+        )
+        self.assertNotIn('method="PURGE"', content)
@@ -0,0 +1,46 @@
+"""Тесты представлений приложения core."""
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+
+class MetricsViewTests(TestCase):
+    """Проверяет доступ к метрикам по адресу клиента."""
+
+    def get(self, address: str) -> int:
+        """
+        Запрашивает метрики с указанного адреса.
+
+        Параметры:
+            address (str): Адрес клиента.
+
+        Возвращает:
+            int: Код ответа.
+        """
+        return self.client.get(
+            reverse("metrics"), REMOTE_ADDR=address
+        ).status_code
+
+    @override_settings(METRICS_ALLOWED_IPS=[])
+    def test_disabled_by_default(self):
+        """Без разрешённых адресов метрики недоступны."""
+        self.assertEqual(self.get("127.0.0.1"), 404)
+
+    @override_settings(METRICS_ALLOWED_IPS=["127.0.0.1", "10.0.0.0/8"])
+    def test_allowed_ips(self):
+        """Метрики доступны только разрешённым адресам и сетям."""
+        for address, status in (
+            ("127.0.0.1", 200),
+            ("10.1.2.3", 200),
+            ("192.168.0.1", 404),
+            ("::1", 404),
+        ):
+            with self.subTest(address=address):
+                self.assertEqual(self.get(address), status)
+
+    @override_settings(
+        REQUEST_METRICS=False, METRICS_ALLOWED_IPS=["0.0.0.0/0"]
+    )
+    def test_request_metrics_disabled(self):
+        """При выключенных метриках представление отвечает 404."""
+        self.assertEqual(self.get("127.0.0.1"), 404)
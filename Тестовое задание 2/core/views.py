@@ -0,0 +1,55 @@
+"""Модуль с представлениями приложения core."""
+
+from ipaddress import ip_address, ip_network
+
+from core.constants import MetricsCfg
+from core.metrics import render_metrics
+from django.conf import settings
+from django.http import Http404, HttpRequest, HttpResponse
+from django.views.decorators.http import require_safe
+
+
+def is_metrics_allowed(request: HttpRequest) -> bool:
+    """
+    Проверяет, разрешено ли клиенту получать метрики.
+
+    Адрес клиента берётся из REMOTE_ADDR, поэтому за обратным прокси в
+    METRICS_ALLOWED_IPS указывается адрес, с которого прокси передаёт
+    запросы Prometheus.
+
+    Параметры:
+        request (HttpRequest): Входящий запрос.
+
+    Возвращает:
+        bool: True, если метрики включены, а адрес клиента входит в одну
+        из сетей METRICS_ALLOWED_IPS.
+    """
+    if not settings.REQUEST_METRICS:
+        return False
+    try:
+        address = ip_address(request.META.get(MetricsCfg.REMOTE_ADDR, ""))
+    except ValueError:
+        return False
+    return any(
+        address in ip_network(network, strict=False)
+        for network in settings.METRICS_ALLOWED_IPS
+    )
+
+
+@require_safe
+def metrics(request: HttpRequest) -> HttpResponse:
+    """
+    Возвращает метрики производительности в формате Prometheus.
+
+    Параметры:
+        request (HttpRequest): Входящий запрос.
+
+    Возвращает:
+        HttpResponse: Метрики текущего процесса.
+
+    Вызывает ошибку:
+        Http404: Если метрики отключены или адрес клиента не разрешён.
+    """
+    if not is_metrics_allowed(request):
+        raise Http404
+    return HttpResponse(render_metrics(), content_type=MetricsCfg.CONTENT_TYPE)
@@ -83,9 +83,14 @@ class ProductAdmin(admin.ModelAdmin):
 
     def image_thumbnail(self, obj):
         """Выводит миниатюру подкатегории товара в админ-панель."""
-        if obj.thumbnail:
+        if obj.thumbnail_name:
             return format_html(
-                AdminStoreCfg.IMAGE_THUMBNAIL_FORMAT_STRING, obj.thumbnail.url
+                AdminStoreCfg.IMAGE_THUMBNAIL_FORMAT_STRING,
+                obj.image.storage.url(obj.thumbnail_name),
+            )
+        if obj.image:
+            return format_html(
+                AdminStoreCfg.IMAGE_THUMBNAIL_FORMAT_STRING, obj.image.url
             )
         return AdminStoreCfg.IMAGE_THUMBNAIL_NO_IMAGE
 
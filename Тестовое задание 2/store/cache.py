@@ -0,0 +1,167 @@
+"""Модуль для работы с версиями каталога в кэше."""
+
+import time
+from uuid import uuid4
+
+from core.constants import CatalogCacheCfg
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Model
+
+
+def get_catalog_cache():
+    """
+    Возвращает бэкенд кэша, используемый для каталога.
+
+    Возвращает:
+        BaseCache: Бэкенд кэша из настройки CATALOG_CACHE_ALIAS.
+    """
+    return caches[settings.CATALOG_CACHE_ALIAS]
+
+
+def get_version_key(model: type[Model]) -> str:
+    """
+    Возвращает ключ кэша с версией модели каталога.
+
+    Параметры:
+        model (type[Model]): Модель каталога.
+
+    Возвращает:
+        str: Ключ кэша.
+    """
+    return CatalogCacheCfg.VERSION_KEY.format(model=model._meta.label_lower)
+
+
+def new_catalog_version() -> str:
+    """
+    Возвращает новую версию модели каталога.
+
+    Версия состоит из времени изменения и случайной части, поэтому она
+    уникальна и по ней можно определить время последнего изменения.
+
+    Возвращает:
+        str: Версия модели каталога.
+    """
+    return CatalogCacheCfg.VERSION.format(
+        timestamp=time.time(),
+        separator=CatalogCacheCfg.VERSION_SEPARATOR,
+        token=uuid4().hex,
+    )
+
+
+def get_version_tag(versions: dict) -> str:
+    """
+    Возвращает строку, однозначно задающую версии моделей каталога.
+
+    Параметры:
+        versions (dict): Версии моделей по ключам кэша.
+
+    Возвращает:
+        str: Версии моделей, упорядоченные по ключам кэша.
+    """
+    return "\n".join(f"{key}={versions[key]}" for key in sorted(versions))
+
+
+def get_last_modified(versions: dict) -> float:
+    """
+    Возвращает время последнего изменения моделей каталога.
+
+    Параметры:
+        versions (dict): Версии моделей по ключам кэша.
+
+    Возвращает:
+        float: Время последнего изменения в секундах от начала эпохи.
+    """
+    return max(
+        (
+            float(version.partition(CatalogCacheCfg.VERSION_SEPARATOR)[0])
+            for version in versions.values()
+        ),
+        default=0.0,
+    )
+
+
+def get_catalog_versions(*models: type[Model]) -> dict:
+    """
+    Возвращает текущие версии моделей каталога.
+
+    Отсутствующие в кэше версии (например, после вытеснения) создаются
+    заново с текущим временем, поэтому ранее закэшированные ответы
+    становятся недоступны.
+
+    Параметры:
+        *models (type[Model]): Модели каталога.
+
+    Возвращает:
+        dict: Версии моделей по ключам кэша.
+    """
+    cache = get_catalog_cache()
+    keys = [get_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, new_catalog_version(), timeout=None)
+            versions[key] = cache.get(key)
+    return versions
+
+
+def get_catalog_version_tag(*models: type[Model]) -> str:
+    """
+    Возвращает строку, однозначно задающую текущие версии моделей каталога.
+
+    Параметры:
+        *models (type[Model]): Модели каталога.
+
+    Возвращает:
+        str: Версии моделей, упорядоченные по ключам кэша.
+    """
+    return get_version_tag(get_catalog_versions(*models))
+
+
+async def aget_catalog_versions(*models: type[Model]) -> dict:
+    """
+    Асинхронно возвращает текущие версии моделей каталога.
+
+    Асинхронный вариант get_catalog_versions.
+
+    Параметры:
+        *models (type[Model]): Модели каталога.
+
+    Возвращает:
+        dict: Версии моделей по ключам кэша.
+    """
+    cache = get_catalog_cache()
+    keys = [get_version_key(model) for model in models]
+    versions = await cache.aget_many(keys)
+    for key in keys:
+        if key not in versions:
+            await cache.aadd(key, new_catalog_version(), timeout=None)
+            versions[key] = await cache.aget(key)
+    return versions
+
+
+async def aget_catalog_version_tag(*models: type[Model]) -> str:
+    """
+    Асинхронно возвращает строку с текущими версиями моделей каталога.
+
+    Асинхронный вариант get_catalog_version_tag.
+
+    Параметры:
+        *models (type[Model]): Модели каталога.
+
+    Возвращает:
+        str: Версии моделей, упорядоченные по ключам кэша.
+    """
+    return get_version_tag(await aget_catalog_versions(*models))
+
+
+def bump_catalog_version(model: type[Model]) -> None:
+    """
+    Обновляет версию модели каталога, делая устаревшими закэшированные ответы.
+
+    Параметры:
+        model (type[Model]): Изменённая модель каталога.
+    """
+    get_catalog_cache().set(
+        get_version_key(model), new_catalog_version(), timeout=None
+    )
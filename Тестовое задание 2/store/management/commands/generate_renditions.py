@@ -0,0 +1,35 @@
+"""Команда для создания миниатюр и превью продуктов."""
+
+from core.constants import ProductCfg
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from store.models import Product
+from store.renditions import generate_renditions
+
+
+class Command(BaseCommand):
+    """
+    Создаёт миниатюры и превью для продуктов, у которых их ещё нет.
+
+    Используется для заполнения путей к изображениям у продуктов, созданных
+    до появления фоновой обработки, или после сбоя фоновых задач.
+    """
+
+    help = "Создаёт миниатюры и превью для продуктов без них."
+
+    def handle(self, *args, **options):
+        """Создаёт изображения для выбранных продуктов."""
+        missing = Q()
+        for _, name_field in ProductCfg.RENDITIONS:
+            missing |= Q(**{name_field: ""})
+        products = Product.objects.exclude(image="").filter(missing)
+        generated = 0
+        for product_id, image_name in list(
+            products.values_list("pk", ProductCfg.IMAGE)
+        ):
+            generated += generate_renditions(product_id, image_name)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Созданы изображения для {generated} продуктов."
+            )
+        )
@@ -0,0 +1,367 @@
+"""Команда для массового импорта продуктов из CSV или JSONL."""
+
+import csv
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+from pathlib import Path
+
+from core.constants import ImportProductsCfg, ProductCfg
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, transaction
+from store.cache import bump_catalog_version
+from store.models import (
+    Product,
+    ProductCategory,
+    ProductSubCategory,
+    make_slug,
+)
+from store.renditions import init_rendition_process, render_image
+from store.search import get_search_backend, get_search_row
+
+
+class Command(BaseCommand):
+    """
+    Импортирует продукты из файла CSV или JSONL.
+
+    Файл читается построчно, продукты сохраняются пачками через bulk_create
+    в отдельных транзакциях, поэтому расход памяти не зависит от размера
+    файла. Категории и подкатегории ищутся по slug в индексе, загруженном
+    в память одним запросом. Slug продукта заполняется так же, как сигналом
+    store.signals.generate_slug, но без обработки сигналов для каждой строки;
+    поисковый индекс пополняется в транзакции сохранения пачки.
+    Миниатюры и превью создаются пулом процессов параллельно с чтением
+    следующих пачек.
+
+    Поля строки: title, slug, description, category, subcategory, price,
+    image (путь к изображению относительно MEDIA_ROOT). Обязательны title и
+    subcategory; категория по умолчанию берётся из подкатегории.
+    """
+
+    help = "Импортирует продукты из файла CSV или JSONL."
+
+    def add_arguments(self, parser):
+        """Добавляет аргументы командной строки."""
+        parser.add_argument(
+            "path",
+            help="Путь к файлу CSV или JSONL, «-» для чтения из stdin.",
+        )
+        parser.add_argument(
+            "--format",
+            choices=ImportProductsCfg.FORMATS,
+            help="Формат файла (по умолчанию определяется по расширению).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=ImportProductsCfg.BATCH_SIZE,
+            help="Количество продуктов в одной пачке.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count(),
+            help="Количество процессов для создания изображений.",
+        )
+        parser.add_argument(
+            "--no-images",
+            action="store_true",
+            help="Не создавать миниатюры и превью.",
+        )
+
+    def handle(self, *args, **options):
+        """Импортирует продукты и выводит скорость импорта."""
+        self.categories = dict(
+            ProductCategory.objects.values_list("slug", "pk")
+        )
+        subcategories = ProductSubCategory.objects.values_list(
+            "slug", "pk", "product_category_id"
+        )
+        self.subcategories = {
+            slug: (pk, category_id) for slug, pk, category_id in subcategories
+        }
+        self.images = 0
+        pool = None
+        if not options["no_images"]:
+            pool = ProcessPoolExecutor(
+                max_workers=options["workers"],
+                initializer=init_rendition_process,
+            )
+        count = 0
+        pending = deque()
+        max_pending = ImportProductsCfg.MAX_PENDING_BATCHES
+        started = time.perf_counter()
+        try:
+            with self.open_rows(options["path"], options["format"]) as rows:
+                for batch in self.iter_batches(rows, options["batch_size"]):
+                    products = self.save_batch(batch)
+                    count += len(products)
+                    if pool is not None:
+                        pending.append(self.submit_images(pool, products))
+                    while len(pending) > max_pending:
+                        self.save_images(*pending.popleft())
+                    if options["verbosity"] > 1:
+                        self.stdout.write(
+                            ImportProductsCfg.PROGRESS.format(
+                                count=count,
+                                rate=count / (time.perf_counter() - started),
+                            )
+                        )
+                while pending:
+                    self.save_images(*pending.popleft())
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+            bump_catalog_version(Product)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                ImportProductsCfg.SUMMARY.format(
+                    count=count,
+                    elapsed=elapsed,
+                    rate=count / elapsed if elapsed else count,
+                    images=self.images,
+                )
+            )
+        )
+
+    def open_rows(self, path: str, file_format: str | None):
+        """
+        Открывает файл и возвращает итератор по его строкам.
+
+        Параметры:
+            path (str): Путь к файлу или «-» для чтения из stdin.
+            file_format (str | None): Формат файла.
+
+        Возвращает:
+            RowReader: Контекстный менеджер с итератором пар (номер строки,
+        словарь полей).
+        """
+        if file_format is None:
+            file_format = Path(path).suffix.lstrip(".").lower()
+        if file_format not in ImportProductsCfg.FORMATS:
+            raise CommandError(
+                ImportProductsCfg.UNKNOWN_FORMAT_ERROR.format(path=path)
+            )
+        if path == ImportProductsCfg.STDIN:
+            stream = sys.stdin
+        else:
+            stream = open(
+                path, encoding=ImportProductsCfg.ENCODING, newline=""
+            )
+        return RowReader(stream, file_format)
+
+    @staticmethod
+    def iter_batches(rows, batch_size: int):
+        """
+        Разбивает строки файла на пачки.
+
+        Параметры:
+            rows (Iterator): Итератор пар (номер строки, словарь полей).
+            batch_size (int): Количество строк в пачке.
+
+        Возвращает:
+            Iterator[list]: Пачки строк.
+        """
+        while batch := list(islice(rows, batch_size)):
+            yield batch
+
+    def build_product(self, line: int, row: dict) -> Product:
+        """
+        Создаёт несохранённый продукт из строки файла.
+
+        Параметры:
+            line (int): Номер строки в файле.
+            row (dict): Поля строки.
+
+        Возвращает:
+            Product: Несохранённый продукт.
+
+        Вызывает ошибку:
+            CommandError: Если строка содержит некорректные данные.
+        """
+        for field in (ImportProductsCfg.TITLE, ImportProductsCfg.SUBCATEGORY):
+            if not row.get(field):
+                self.row_error(
+                    line, ImportProductsCfg.MISSING_FIELD_ERROR, field=field
+                )
+        title = row[ImportProductsCfg.TITLE]
+        subcategory_slug = row[ImportProductsCfg.SUBCATEGORY]
+        if subcategory_slug not in self.subcategories:
+            self.row_error(
+                line,
+                ImportProductsCfg.UNKNOWN_SUBCATEGORY_ERROR,
+                slug=subcategory_slug,
+            )
+        subcategory_id, category_id = self.subcategories[subcategory_slug]
+        category_slug = row.get(ImportProductsCfg.CATEGORY)
+        if category_slug:
+            if category_slug not in self.categories:
+                self.row_error(
+                    line,
+                    ImportProductsCfg.UNKNOWN_CATEGORY_ERROR,
+                    slug=category_slug,
+                )
+            if self.categories[category_slug] != category_id:
+                self.row_error(
+                    line,
+                    ImportProductsCfg.SUBCATEGORY_MISMATCH_ERROR,
+                    subcategory=subcategory_slug,
+                    category=category_slug,
+                )
+        price = row.get(ImportProductsCfg.PRICE) or ProductCfg.PRICE_DEFAULT
+        try:
+            price = Decimal(str(price))
+        except InvalidOperation:
+            self.row_error(
+                line, ImportProductsCfg.INVALID_PRICE_ERROR, price=price
+            )
+        return Product(
+            title=title,
+            slug=row.get(ImportProductsCfg.SLUG) or make_slug(title),
+            description=row.get(ImportProductsCfg.DESCRIPTION) or None,
+            product_category_id=category_id,
+            product_subcategory_id=subcategory_id,
+            price=price,
+            image=row.get(ImportProductsCfg.IMAGE) or "",
+        )
+
+    @staticmethod
+    def row_error(line: int, message: str, **kwargs) -> None:
+        """
+        Прерывает импорт с указанием ошибочной строки.
+
+        Параметры:
+            line (int): Номер строки в файле.
+            message (str): Шаблон сообщения об ошибке.
+            **kwargs: Значения для шаблона сообщения.
+
+        Вызывает ошибку:
+            CommandError: Всегда.
+        """
+        raise CommandError(
+            ImportProductsCfg.ROW_ERROR.format(
+                line=line, error=message.format(**kwargs)
+            )
+        )
+
+    def save_batch(self, batch: list) -> list:
+        """
+        Сохраняет пачку продуктов одним запросом в отдельной транзакции.
+
+        В той же транзакции продукты добавляются в поисковый индекс.
+
+        Параметры:
+            batch (list): Пары (номер строки, словарь полей).
+
+        Возвращает:
+            list: Сохранённые продукты.
+
+        Вызывает ошибку:
+            CommandError: Если пачку не удалось сохранить.
+        """
+        products = [self.build_product(line, row) for line, row in batch]
+        try:
+            with transaction.atomic():
+                products = Product.objects.bulk_create(products)
+                get_search_backend().index(
+                    [get_search_row(product) for product in products]
+                )
+                return products
+        except IntegrityError as error:
+            raise CommandError(
+                ImportProductsCfg.BATCH_ERROR.format(
+                    start=batch[0][0], end=batch[-1][0], error=error
+                )
+            )
+
+    @staticmethod
+    def submit_images(pool: ProcessPoolExecutor, products: list) -> tuple:
+        """
+        Отправляет изображения продуктов пачки на обработку в пул процессов.
+
+        Параметры:
+            pool (ProcessPoolExecutor): Пул процессов.
+            products (list): Сохранённые продукты.
+
+        Возвращает:
+            tuple: Продукты с изображениями и соответствующие им задачи.
+        """
+        products = [product for product in products if product.image]
+        futures = [
+            pool.submit(render_image, product.image.name)
+            for product in products
+        ]
+        return products, futures
+
+    def save_images(self, products: list, futures: list) -> None:
+        """
+        Сохраняет пути к созданным миниатюрам и превью одним запросом.
+
+        Параметры:
+            products (list): Продукты с изображениями.
+            futures (list): Задачи создания изображений.
+        """
+        done = []
+        for product, future in zip(products, futures):
+            try:
+                names = future.result()
+            except Exception as error:
+                self.stderr.write(f"{product.image.name}: {error}")
+                continue
+            for name_field, name in names.items():
+                setattr(product, name_field, name)
+            done.append(product)
+        with transaction.atomic():
+            Product.objects.bulk_update(
+                done, fields=[name for _, name in ProductCfg.RENDITIONS]
+            )
+        self.images += len(done)
+
+
+class RowReader:
+    """
+    Итератор по строкам файла CSV или JSONL.
+
+    Возвращает пары (номер строки, словарь полей) и закрывает файл при
+    выходе из контекстного менеджера.
+    """
+
+    def __init__(self, stream, file_format: str):
+        """
+        Создаёт итератор по строкам файла.
+
+        Параметры:
+            stream (TextIO): Открытый текстовый файл.
+            file_format (str): Формат файла.
+        """
+        self.stream = stream
+        self.file_format = file_format
+
+    def __enter__(self):
+        """Возвращает итератор по строкам файла."""
+        if self.file_format == ImportProductsCfg.CSV:
+            return self.read_csv()
+        return self.read_jsonl()
+
+    def __exit__(self, *exc_info):
+        """Закрывает файл, если он не является stdin."""
+        if self.stream is not sys.stdin:
+            self.stream.close()
+
+    def read_csv(self):
+        """Возвращает строки файла CSV."""
+        reader = csv.DictReader(self.stream)
+        for row in reader:
+            yield reader.line_num, row
+
+    def read_jsonl(self):
+        """Возвращает строки файла JSONL, пропуская пустые."""
+        for line, text in enumerate(self.stream, start=1):
+            if text.strip():
+                yield line, json.loads(text)
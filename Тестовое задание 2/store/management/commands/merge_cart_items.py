@@ -0,0 +1,28 @@
+"""Команда для объединения дубликатов элементов корзины."""
+
+from core.constants import CartItemCfg
+from django.core.management.base import BaseCommand
+from store.models import CartItem
+
+
+class Command(BaseCommand):
+    """
+    Объединяет элементы корзины с одинаковыми корзиной и продуктом.
+
+    Количества дубликатов суммируются в одном элементе. Команду нужно
+    выполнить на существующей базе данных перед миграцией, создающей
+    ограничение уникальности (cart, product) для CartItem, иначе миграция
+    завершится ошибкой IntegrityError.
+    """
+
+    help = "Объединяет дубликаты элементов корзины."
+
+    def handle(self, *args, **options):
+        """Объединяет дубликаты и выводит количество удалённых элементов."""
+        self.stdout.write(
+            self.style.SUCCESS(
+                CartItemCfg.MERGE_SUMMARY.format(
+                    count=CartItem.objects.merge_duplicates()
+                )
+            )
+        )
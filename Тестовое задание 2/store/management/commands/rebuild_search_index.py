@@ -0,0 +1,34 @@
+"""Команда для заполнения поискового индекса продуктов."""
+
+import time
+
+from core.constants import SearchCfg
+from django.core.management.base import BaseCommand
+from django.db import router
+from store.models import Product
+from store.search import get_search_backend, rebuild_search_index
+
+
+class Command(BaseCommand):
+    """
+    Заполняет поисковый индекс продуктов заново.
+
+    Нужна после изменения продуктов в обход сигналов, например через
+    QuerySet.update(), или после смены поискового бэкенда.
+    """
+
+    help = "Заполняет поисковый индекс продуктов заново."
+
+    def handle(self, *args, **options):
+        """Заполняет индекс и выводит количество продуктов."""
+        backend = get_search_backend()
+        backend.setup(router.db_for_write(Product))
+        started = time.perf_counter()
+        count = rebuild_search_index(backend)
+        self.stdout.write(
+            self.style.SUCCESS(
+                SearchCfg.REBUILD_SUMMARY.format(
+                    count=count, elapsed=time.perf_counter() - started
+                )
+            )
+        )
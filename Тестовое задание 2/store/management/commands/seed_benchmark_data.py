@@ -0,0 +1,273 @@
+"""Команда для заполнения базы данных данными нагрузочных тестов."""
+
+import random
+import time
+from decimal import Decimal
+from hashlib import sha1
+
+from core.constants import SeedBenchmarkDataCfg
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.authtoken.models import Token
+from store.cache import bump_catalog_version
+from store.models import (
+    Cart,
+    CartItem,
+    Product,
+    ProductCategory,
+    ProductSubCategory,
+)
+from store.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    """
+    Заполняет базу данных данными для нагрузочных тестов.
+
+    Создаёт N категорий, по M подкатегорий в каждой, по K продуктов в
+    каждой подкатегории и U пользователей с токенами и корзинами.
+    Данные детерминированы: при одинаковых аргументах создаются одни и те
+    же наименования, цены, токены и содержимое корзин, поэтому результаты
+    benchmark_api можно сравнивать между коммитами. Ранее созданные
+    командой данные удаляются перед заполнением.
+    """
+
+    help = "Заполняет базу данных данными для нагрузочных тестов."
+
+    def add_arguments(self, parser):
+        """Добавляет аргументы командной строки."""
+        cfg = SeedBenchmarkDataCfg
+        parser.add_argument(
+            "--categories",
+            type=int,
+            default=cfg.CATEGORIES,
+            help="Количество категорий.",
+        )
+        parser.add_argument(
+            "--subcategories",
+            type=int,
+            default=cfg.SUBCATEGORIES,
+            help="Количество подкатегорий в каждой категории.",
+        )
+        parser.add_argument(
+            "--products",
+            type=int,
+            default=cfg.PRODUCTS,
+            help="Количество продуктов в каждой подкатегории.",
+        )
+        parser.add_argument(
+            "--users",
+            type=int,
+            default=cfg.USERS,
+            help="Количество пользователей с корзинами.",
+        )
+        parser.add_argument(
+            "--cart-items",
+            type=int,
+            default=cfg.CART_ITEMS,
+            help="Количество товаров в корзине каждого пользователя.",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=cfg.RANDOM_SEED,
+            help="Начальное значение генератора случайных чисел.",
+        )
+
+    def handle(self, *args, **options):
+        """Удаляет старые данные, создаёт новые и выводит итог."""
+        started = time.perf_counter()
+        rng = random.Random(options["seed"])
+        with transaction.atomic():
+            self.clear()
+            categories = self.create_categories(options["categories"])
+            subcategories = self.create_subcategories(
+                categories, options["subcategories"]
+            )
+            products = self.create_products(
+                subcategories, options["products"], rng
+            )
+            users = self.create_users(options["users"])
+            self.create_carts(users, products, options["cart_items"], rng)
+        for model in (ProductCategory, ProductSubCategory, Product):
+            bump_catalog_version(model)
+        rebuild_search_index()
+        self.stdout.write(
+            self.style.SUCCESS(
+                SeedBenchmarkDataCfg.SUMMARY.format(
+                    categories=len(categories),
+                    subcategories=len(subcategories),
+                    products=len(products),
+                    users=len(users),
+                    elapsed=time.perf_counter() - started,
+                )
+            )
+        )
+
+    @staticmethod
+    def clear() -> None:
+        """Удаляет данные, созданные командой ранее."""
+        prefix = SeedBenchmarkDataCfg.PREFIX
+        User.objects.filter(username__startswith=prefix).delete()
+        Product.objects.filter(slug__startswith=prefix).delete()
+        ProductSubCategory.objects.filter(slug__startswith=prefix).delete()
+        ProductCategory.objects.filter(slug__startswith=prefix).delete()
+
+    @staticmethod
+    def create_categories(count: int) -> list:
+        """
+        Создаёт категории.
+
+        Параметры:
+            count (int): Количество категорий.
+
+        Возвращает:
+            list: Созданные категории.
+        """
+        cfg = SeedBenchmarkDataCfg
+        return ProductCategory.objects.bulk_create(
+            ProductCategory(
+                title=cfg.TITLE.format(kind=cfg.CATEGORY, index=index),
+                slug=cfg.SLUG.format(kind=cfg.CATEGORY, index=index),
+                description=cfg.DESCRIPTION.format(
+                    kind=cfg.CATEGORY, index=index
+                ),
+                image=cfg.IMAGE.format(index=index),
+            )
+            for index in range(count)
+        )
+
+    @staticmethod
+    def create_subcategories(categories: list, count: int) -> list:
+        """
+        Создаёт подкатегории в каждой категории.
+
+        Параметры:
+            categories (list): Категории.
+            count (int): Количество подкатегорий в каждой категории.
+
+        Возвращает:
+            list: Созданные подкатегории.
+        """
+        cfg = SeedBenchmarkDataCfg
+        return ProductSubCategory.objects.bulk_create(
+            ProductSubCategory(
+                title=cfg.TITLE.format(kind=cfg.SUBCATEGORY, index=index),
+                slug=cfg.SLUG.format(kind=cfg.SUBCATEGORY, index=index),
+                description=cfg.DESCRIPTION.format(
+                    kind=cfg.SUBCATEGORY, index=index
+                ),
+                image=cfg.IMAGE.format(index=index),
+                product_category=categories[index // count],
+            )
+            for index in range(len(categories) * count)
+        )
+
+    @staticmethod
+    def create_products(
+        subcategories: list, count: int, rng: random.Random
+    ) -> list:
+        """
+        Создаёт продукты в каждой подкатегории.
+
+        Параметры:
+            subcategories (list): Подкатегории.
+            count (int): Количество продуктов в каждой подкатегории.
+            rng (random.Random): Генератор случайных цен.
+
+        Возвращает:
+            list: Созданные продукты.
+        """
+        cfg = SeedBenchmarkDataCfg
+        return Product.objects.bulk_create(
+            (
+                Product(
+                    title=cfg.TITLE.format(kind=cfg.PRODUCT, index=index),
+                    slug=cfg.SLUG.format(kind=cfg.PRODUCT, index=index),
+                    description=cfg.DESCRIPTION.format(
+                        kind=cfg.PRODUCT, index=index
+                    ),
+                    product_category=subcategory.product_category,
+                    product_subcategory=subcategory,
+                    price=Decimal(
+                        rng.randint(cfg.PRICE_MIN, cfg.PRICE_MAX)
+                    ).scaleb(-2),
+                    image=cfg.IMAGE.format(index=index),
+                )
+                for index, subcategory in enumerate(
+                    subcategory
+                    for subcategory in subcategories
+                    for _ in range(count)
+                )
+            ),
+            batch_size=cfg.BATCH_SIZE,
+        )
+
+    @staticmethod
+    def create_users(count: int) -> list:
+        """
+        Создаёт пользователей с токенами.
+
+        Токен пользователя вычисляется из его номера, поэтому совпадает при
+        каждом заполнении.
+
+        Параметры:
+            count (int): Количество пользователей.
+
+        Возвращает:
+            list: Созданные пользователи.
+        """
+        cfg = SeedBenchmarkDataCfg
+        password = make_password(cfg.PASSWORD)
+        users = User.objects.bulk_create(
+            (
+                User(
+                    username=cfg.USERNAME.format(index=index),
+                    password=password,
+                )
+                for index in range(count)
+            ),
+            batch_size=cfg.BATCH_SIZE,
+        )
+        Token.objects.bulk_create(
+            (
+                Token(
+                    key=sha1(
+                        cfg.TOKEN.format(index=index).encode()
+                    ).hexdigest(),
+                    user=user,
+                )
+                for index, user in enumerate(users)
+            ),
+            batch_size=cfg.BATCH_SIZE,
+        )
+        return users
+
+    @staticmethod
+    def create_carts(
+        users: list, products: list, count: int, rng: random.Random
+    ) -> None:
+        """
+        Создаёт корзины пользователей со случайными продуктами.
+
+        Параметры:
+            users (list): Пользователи.
+            products (list): Продукты.
+            count (int): Количество товаров в каждой корзине.
+            rng (random.Random): Генератор выбора продуктов.
+        """
+        cfg = SeedBenchmarkDataCfg
+        carts = Cart.objects.bulk_create(
+            (Cart(user=user) for user in users), batch_size=cfg.BATCH_SIZE
+        )
+        count = min(count, len(products))
+        CartItem.objects.bulk_create(
+            (
+                CartItem(cart=cart, product=product, quantity=quantity + 1)
+                for cart in carts
+                for quantity, product in enumerate(rng.sample(products, count))
+            ),
+            batch_size=cfg.BATCH_SIZE,
+        )
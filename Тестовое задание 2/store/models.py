@@ -9,11 +9,32 @@ from core.constants import (
     ProductSubCategoryCfg,
 )
 from django.contrib.auth.models import User
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models import Count, F, Min, Prefetch, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.utils.text import slugify
 from imagekit.models import ImageSpecField
 from imagekit.processors import ResizeToFill
 
 
+def make_slug(title: str) -> str:
+    """
+    Возвращает slug для наименования категории или продукта.
+
+    Наименование транслитерируется в ASCII, а если от него ничего не
+    остаётся (например, для наименований на кириллице), slug сохраняет
+    символы Unicode, которые допускают поля slug моделей.
+
+    Параметры:
+        title (str): Наименование.
+
+    Возвращает:
+        str: Slug наименования.
+    """
+    return slugify(title) or slugify(title, allow_unicode=True)
+
+
 class BaseProductCategory(models.Model):
     """
     Абстрактная базовая модель для категорий продуктов.
@@ -68,6 +89,12 @@ class ProductCategory(BaseProductCategory):
         """Мета-класс для модели категорий продуктов."""
 
         ordering = ProductCategoryCfg.PRODUCT_CATEGORY_ORDER
+        indexes = [
+            models.Index(
+                fields=ProductCategoryCfg.TITLE_INDEX_FIELDS,
+                name=ProductCategoryCfg.TITLE_INDEX_NAME,
+            )
+        ]
         verbose_name = ProductCategoryCfg.VERBOSE_NAME
         verbose_name_plural = ProductCategoryCfg.VERBOSE_NAME_PLURAL
 
@@ -109,6 +136,28 @@ class ProductSubCategory(BaseProductCategory):
         verbose_name_plural = ProductSubCategoryCfg.VERBOSE_NAME_PLURAL
 
 
+class ProductQuerySet(models.QuerySet):
+    """QuerySet для модели Product."""
+
+    def catalog(self):
+        """
+        Возвращает продукты для вывода в каталоге.
+
+        Категория и подкатегория подгружаются одним JOIN-запросом, а из
+        базы данных выбираются только поля, необходимые для сериализации
+        (без текстового описания продукта). Сортировка по первичному ключу
+        делает разбиение на страницы стабильным.
+
+        Возвращает:
+            ProductQuerySet: Продукты с подгруженными категориями.
+        """
+        return (
+            self.select_related(*ProductCfg.CATALOG_RELATED_FIELDS)
+            .only(*ProductCfg.CATALOG_ONLY_FIELDS)
+            .order_by(*ProductCfg.CATALOG_ORDER)
+        )
+
+
 class Product(models.Model):
     """
     Модель для продуктов.
@@ -182,10 +231,50 @@ class Product(models.Model):
         format=ProductCfg.PREVIEW_FORMAT,
         options=ProductCfg.PREVIEW_OPTIONS,
     )
+    thumbnail_name = models.CharField(
+        max_length=ProductCfg.RENDITION_NAME_MAX_LENGTH,
+        verbose_name=ProductCfg.THUMBNAIL_NAME_VERBOSE_NAME,
+        blank=True,
+        editable=False,
+    )
+    preview_name = models.CharField(
+        max_length=ProductCfg.RENDITION_NAME_MAX_LENGTH,
+        verbose_name=ProductCfg.PREVIEW_NAME_VERBOSE_NAME,
+        blank=True,
+        editable=False,
+    )
+
+    objects = ProductQuerySet.as_manager()
 
     class Meta:
         """Мета-класс для модели продуктов."""
 
+        indexes = [
+            models.Index(
+                fields=ProductCfg.TITLE_INDEX_FIELDS,
+                name=ProductCfg.TITLE_INDEX_NAME,
+            ),
+            models.Index(
+                fields=ProductCfg.PRICE_INDEX_FIELDS,
+                name=ProductCfg.PRICE_INDEX_NAME,
+            ),
+            models.Index(
+                fields=ProductCfg.CATEGORY_PRICE_INDEX_FIELDS,
+                name=ProductCfg.CATEGORY_PRICE_INDEX_NAME,
+            ),
+            models.Index(
+                fields=ProductCfg.CATEGORY_TITLE_INDEX_FIELDS,
+                name=ProductCfg.CATEGORY_TITLE_INDEX_NAME,
+            ),
+            models.Index(
+                fields=ProductCfg.SUBCATEGORY_PRICE_INDEX_FIELDS,
+                name=ProductCfg.SUBCATEGORY_PRICE_INDEX_NAME,
+            ),
+            models.Index(
+                fields=ProductCfg.SUBCATEGORY_TITLE_INDEX_FIELDS,
+                name=ProductCfg.SUBCATEGORY_TITLE_INDEX_NAME,
+            ),
+        ]
         verbose_name = ProductCfg.VERBOSE_NAME
         verbose_name_plural = ProductCfg.VERBOSE_NAME_PLURAL
 
@@ -193,6 +282,207 @@ class Product(models.Model):
         """Возвращает строковое представление объекта продукта."""
         return self.title
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Создаёт экземпляр продукта из строки базы данных.
+
+        Запоминает загруженный путь к изображению, чтобы при сохранении
+        определить, нужно ли заново создавать миниатюру и превью.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance.loaded_image_name = instance.__dict__.get(ProductCfg.IMAGE)
+        return instance
+
+    def has_image_changed(self) -> bool:
+        """
+        Проверяет, изменилось ли изображение продукта с момента загрузки.
+
+        Возвращает:
+            bool: True, если изображение новое или было заменено.
+        """
+        if ProductCfg.IMAGE in self.get_deferred_fields():
+            return False
+        return self.image.name != getattr(self, "loaded_image_name", None)
+
+    def needs_renditions(self) -> bool:
+        """
+        Проверяет, нужно ли создать миниатюру и превью продукта.
+
+        Возвращает:
+            bool: True, если у продукта есть изображение, но пути к
+        миниатюре или превью ещё не сохранены.
+        """
+        fields = {ProductCfg.IMAGE}
+        fields.update(name for _, name in ProductCfg.RENDITIONS)
+        if fields & self.get_deferred_fields():
+            return False
+        return bool(self.image) and not all(
+            getattr(self, name) for _, name in ProductCfg.RENDITIONS
+        )
+
+
+class CartItemQuerySet(models.QuerySet):
+    """QuerySet для модели CartItem."""
+
+    @staticmethod
+    def totals_expressions(prefix: str = "") -> dict:
+        """
+        Возвращает выражения для подсчёта итогов корзины в базе данных.
+
+        Параметры:
+            prefix (str): Префикс пути к полям элемента корзины (например,
+        "items__" при агрегации со стороны модели Cart).
+
+        Возвращает:
+            dict: Выражения для общего количества и общей стоимости товаров.
+        Общая стоимость корзины без товаров равна None.
+        """
+        return {
+            CartItemCfg.TOTAL_QUANTITY: Coalesce(
+                Sum(prefix + CartItemCfg.QUANTITY),
+                Value(CartItemCfg.TOTAL_QUANTITY_DEFAULT),
+            ),
+            CartItemCfg.TOTAL_PRICE: Sum(
+                F(prefix + CartItemCfg.QUANTITY)
+                * F(prefix + CartItemCfg.PRODUCT_PRICE),
+                output_field=models.DecimalField(
+                    max_digits=ProductCfg.PRICE_MAX_DIGITS,
+                    decimal_places=ProductCfg.PRICE_DECIMAL_PLACES,
+                ),
+            ),
+        }
+
+    def with_product(self):
+        """
+        Возвращает элементы корзины с подгруженными наименованиями продуктов.
+
+        Возвращает:
+            CartItemQuerySet: Элементы корзины с продуктами.
+        """
+        return self.select_related(CartItemCfg.PRODUCT).only(
+            *CartItemCfg.CONTENTS_ONLY_FIELDS
+        )
+
+    def add_quantity(self, cart, product, quantity: int) -> None:
+        """
+        Атомарно увеличивает количество продукта в корзине.
+
+        Количество увеличивается одним запросом UPDATE ... SET quantity =
+        quantity + n, поэтому параллельные добавления не теряются. Если
+        элемента корзины ещё нет, он создаётся; при одновременном создании
+        из другого запроса срабатывает ограничение уникальности, и
+        количество увеличивается повторным UPDATE.
+
+        Параметры:
+            cart (Cart): Корзина пользователя.
+            product (Product): Добавляемый продукт.
+            quantity (int): На сколько увеличить количество.
+        """
+        items = self.filter(cart=cart, product=product)
+        increment = {CartItemCfg.QUANTITY: F(CartItemCfg.QUANTITY) + quantity}
+        with transaction.atomic(using=self.db):
+            if items.update(**increment):
+                return
+            try:
+                with transaction.atomic(using=self.db):
+                    self.create(cart=cart, product=product, quantity=quantity)
+            except IntegrityError:
+                items.update(**increment)
+
+    def merge_duplicates(self) -> int:
+        """
+        Объединяет элементы корзины с одинаковыми корзиной и продуктом.
+
+        В каждой группе дубликатов остаётся элемент с наименьшим id, его
+        количество становится суммой количеств группы, остальные элементы
+        удаляются. Нужно выполнить до создания ограничения уникальности
+        (cart, product) на базе данных, где дубликаты уже есть.
+
+        Возвращает:
+            int: Количество удалённых элементов корзины.
+        """
+        cfg = CartItemCfg
+        duplicates = list(
+            self.values(*cfg.UNIQUE_CART_PRODUCT_FIELDS)
+            .annotate(
+                **{
+                    cfg.DUPLICATE_COUNT: Count(cfg.PK),
+                    cfg.DUPLICATE_KEEP: Min(cfg.PK),
+                    cfg.DUPLICATE_TOTAL: Sum(cfg.QUANTITY),
+                }
+            )
+            .filter(**{f"{cfg.DUPLICATE_COUNT}__gt": 1})
+            .order_by()
+        )
+        deleted = 0
+        with transaction.atomic(using=self.db):
+            for duplicate in duplicates:
+                items = self.filter(
+                    **{
+                        field: duplicate[field]
+                        for field in cfg.UNIQUE_CART_PRODUCT_FIELDS
+                    }
+                )
+                keep = duplicate[cfg.DUPLICATE_KEEP]
+                items.filter(pk=keep).update(
+                    **{cfg.QUANTITY: duplicate[cfg.DUPLICATE_TOTAL]}
+                )
+                deleted += items.exclude(pk=keep).delete()[0]
+        return deleted
+
+    def totals(self) -> dict:
+        """
+        Подсчитывает общее количество и стоимость товаров одним запросом.
+
+        Возвращает:
+            dict: Общее количество и общая стоимость товаров.
+        """
+        return self.aggregate(**self.totals_expressions())
+
+
+class CartQuerySet(models.QuerySet):
+    """QuerySet для модели Cart."""
+
+    def lock(self, cart) -> None:
+        """
+        Блокирует корзину до конца текущей транзакции.
+
+        Корзина блокируется запросом UPDATE, обновляющим время её изменения,
+        а не SELECT ... FOR UPDATE: в SQLite FOR UPDATE не поддерживается, а
+        транзакция, начавшаяся с чтения, не может затем получить блокировку
+        записи, если другая транзакция успела изменить базу данных. Поэтому
+        блокировка должна быть первым запросом транзакции.
+
+        Параметры:
+            cart (Cart): Корзина пользователя.
+        """
+        self.filter(pk=cart.pk).update(**{CartCfg.UPDATED_AT: timezone.now()})
+
+    def with_contents(self):
+        """
+        Возвращает корзины вместе с содержимым и итогами.
+
+        Итоги корзины подсчитываются в том же запросе, что и сама корзина, а
+        элементы корзины с продуктами подгружаются одним дополнительным
+        запросом.
+
+        Возвращает:
+            CartQuerySet: Корзины с содержимым и итогами.
+        """
+        return (
+            self.select_related(CartCfg.USER)
+            .annotate(
+                **CartItemQuerySet.totals_expressions(CartCfg.ITEMS_LOOKUP)
+            )
+            .prefetch_related(
+                Prefetch(
+                    CartItemCfg.CART_ITEM_RELATED_NAME,
+                    queryset=CartItem.objects.with_product(),
+                )
+            )
+        )
+
 
 class Cart(models.Model):
     """Модель для корзины пользователя."""
@@ -201,6 +491,8 @@ class Cart(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = CartQuerySet.as_manager()
+
     def __str__(self):
         """Возвращает строковое представление объекта корзины."""
         return CartCfg.CART_STR.format(username=self.user.username)
@@ -219,6 +511,18 @@ class CartItem(models.Model):
         default=CartItemCfg.CART_ITEM_DEFAULT_QUANTITY
     )
 
+    objects = CartItemQuerySet.as_manager()
+
+    class Meta:
+        """Мета-класс для модели элементов корзины."""
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=CartItemCfg.UNIQUE_CART_PRODUCT_FIELDS,
+                name=CartItemCfg.UNIQUE_CART_PRODUCT_NAME,
+            )
+        ]
+
     def __str__(self):
         """Возвращает строковое представление объекта элемента корзины."""
         return CartItemCfg.CART_ITEM_STR.format(
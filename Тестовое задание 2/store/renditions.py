@@ -0,0 +1,143 @@
+"""Модуль для фонового создания миниатюр и превью продуктов."""
+
+import atexit
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import django
+from core.constants import ProductCfg
+from django.conf import settings
+from django.db import connections
+from store.cache import bump_catalog_version
+from store.models import Product
+
+logger = logging.getLogger(__name__)
+
+
+class DeferredStrategy:
+    """
+    Стратегия ImageKit, не создающая файлы во время обработки запроса.
+
+    Миниатюры и превью создаются только фоновыми задачами, а обращение к
+    url/path файла не проверяет его наличие в хранилище.
+    """
+
+    @staticmethod
+    def should_verify_existence(file) -> bool:
+        """Отключает проверку наличия файла в хранилище."""
+        return False
+
+
+def render_image(image_name: str) -> dict:
+    """
+    Создаёт миниатюру и превью для изображения продукта.
+
+    Не обращается к базе данных, поэтому может выполняться в отдельном
+    процессе.
+
+    Параметры:
+        image_name (str): Путь к исходному изображению продукта.
+
+    Возвращает:
+        dict: Пути к созданным миниатюре и превью по именам полей продукта.
+    """
+    product = Product(image=image_name)
+    names = {}
+    for spec_field, name_field in ProductCfg.RENDITIONS:
+        rendition = getattr(product, spec_field)
+        rendition.generate()
+        names[name_field] = rendition.name
+    return names
+
+
+def generate_renditions(product_id: int, image_name: str) -> bool:
+    """
+    Создаёт миниатюру и превью продукта и сохраняет пути к ним.
+
+    Пути сохраняются, только если изображение продукта не изменилось за
+    время обработки.
+
+    Параметры:
+        product_id (int): Идентификатор продукта.
+        image_name (str): Путь к исходному изображению продукта.
+
+    Возвращает:
+        bool: True, если пути к миниатюре и превью сохранены.
+    """
+    names = render_image(image_name)
+    updated = Product.objects.filter(pk=product_id, image=image_name).update(
+        **names
+    )
+    if updated:
+        bump_catalog_version(Product)
+    return bool(updated)
+
+
+def run_rendition_task(product_id: int, image_name: str) -> None:
+    """
+    Выполняет создание миниатюры и превью в фоновом потоке.
+
+    Ошибки записываются в журнал, а соединения с базой данных, открытые
+    потоком, закрываются после выполнения задачи.
+
+    Параметры:
+        product_id (int): Идентификатор продукта.
+        image_name (str): Путь к исходному изображению продукта.
+    """
+    try:
+        generate_renditions(product_id, image_name)
+    except Exception:
+        logger.exception(
+            "Не удалось создать изображения продукта %s", product_id
+        )
+    finally:
+        connections.close_all()
+
+
+@lru_cache(maxsize=None)
+def init_rendition_process() -> None:
+    """
+    Подготавливает процесс пула к созданию изображений.
+
+    Настраивает Django, если процесс запущен без копирования памяти
+    родительского процесса (метод запуска spawn).
+    """
+    django.setup()
+
+
+@lru_cache(maxsize=None)
+def get_rendition_executor() -> ThreadPoolExecutor:
+    """
+    Возвращает общий для процесса пул фоновых потоков.
+
+    Пул создаётся при первом вызове, поэтому RENDITION_WORKERS ограничивает
+    число потоков всего процесса. При завершении процесса пул дожидается
+    поставленных в очередь задач.
+
+    Возвращает:
+        ThreadPoolExecutor: Пул из RENDITION_WORKERS потоков.
+    """
+    executor = ThreadPoolExecutor(
+        max_workers=settings.RENDITION_WORKERS,
+        thread_name_prefix="renditions",
+    )
+    atexit.register(executor.shutdown)
+    return executor
+
+
+def schedule_renditions(product_id: int, image_name: str) -> None:
+    """
+    Ставит в очередь создание миниатюры и превью продукта.
+
+    Если RENDITION_WORKERS равно 0, изображения создаются сразу в текущем
+    потоке.
+
+    Параметры:
+        product_id (int): Идентификатор продукта.
+        image_name (str): Путь к исходному изображению продукта.
+    """
+    if not settings.RENDITION_WORKERS:
+        generate_renditions(product_id, image_name)
+        return
+    get_rendition_executor().submit(run_rendition_task, product_id, image_name)
@@ -0,0 +1,383 @@
+"""Модуль для полнотекстового поиска продуктов."""
+
+import re
+from functools import lru_cache
+
+from core.constants import DatabaseCfg, SearchCfg
+from django.conf import settings
+from django.db import connections, router, transaction
+from django.db.models import Case, Q, QuerySet, Value, When
+from django.utils.module_loading import import_string
+from store.models import Product
+
+
+class BaseSearchBackend:
+    """
+    Базовый класс поисковых индексов продуктов.
+
+    Индекс хранит наименование и описание продукта и возвращает
+    идентификаторы продуктов, отсортированные по релевантности. Бэкенд
+    выбирается настройкой PRODUCT_SEARCH_BACKEND или по базе данных.
+    """
+
+    @staticmethod
+    def get_tokens(query: str) -> list:
+        """
+        Возвращает слова поискового запроса.
+
+        Параметры:
+            query (str): Поисковый запрос.
+
+        Возвращает:
+            list: Слова запроса в нижнем регистре.
+        """
+        tokens = re.findall(SearchCfg.TOKEN_PATTERN, query.lower())
+        return tokens[: SearchCfg.MAX_TOKENS]
+
+    def setup(self, using: str) -> bool:
+        """
+        Создаёт хранилище индекса, если его ещё нет.
+
+        Параметры:
+            using (str): Псевдоним базы данных.
+
+        Возвращает:
+            bool: True, если хранилище было создано и индекс нужно заполнить.
+        """
+        return False
+
+    def index(self, rows: list) -> None:
+        """
+        Добавляет или обновляет продукты в индексе.
+
+        Параметры:
+            rows (list): Кортежи (pk, title, description).
+        """
+
+    def remove(self, product_ids: list) -> None:
+        """
+        Удаляет продукты из индекса.
+
+        Параметры:
+            product_ids (list): Идентификаторы продуктов.
+        """
+
+    def clear(self) -> None:
+        """Удаляет все продукты из индекса."""
+
+    def count(self, query: str) -> int:
+        """
+        Возвращает количество продуктов, найденных по запросу.
+
+        Параметры:
+            query (str): Поисковый запрос.
+
+        Возвращает:
+            int: Количество найденных продуктов.
+        """
+        raise NotImplementedError
+
+    def search(self, query: str, offset: int, limit: int) -> list:
+        """
+        Возвращает идентификаторы продуктов, найденных по запросу.
+
+        Параметры:
+            query (str): Поисковый запрос.
+            offset (int): Количество пропускаемых результатов.
+            limit (int): Максимальное количество результатов.
+
+        Возвращает:
+            list: Идентификаторы продуктов по убыванию релевантности.
+        """
+        raise NotImplementedError
+
+
+class DatabaseSearchBackend(BaseSearchBackend):
+    """
+    Поиск продуктов запросом LIKE без отдельного индекса.
+
+    Работает с любой базой данных и подходит для небольших каталогов.
+    Продукты, найденные по наименованию, выводятся первыми.
+    """
+
+    def get_queryset(self, query: str) -> QuerySet:
+        """
+        Возвращает продукты, содержащие все слова запроса.
+
+        Параметры:
+            query (str): Поисковый запрос.
+
+        Возвращает:
+            QuerySet: Найденные продукты.
+        """
+        condition = Q()
+        for token in self.get_tokens(query):
+            condition &= Q(**{SearchCfg.TITLE_LOOKUP: token}) | Q(
+                **{SearchCfg.DESCRIPTION_LOOKUP: token}
+            )
+        return Product.objects.filter(condition)
+
+    def count(self, query: str) -> int:
+        """Возвращает количество продуктов, найденных по запросу."""
+        if not self.get_tokens(query):
+            return 0
+        return self.get_queryset(query).count()
+
+    def search(self, query: str, offset: int, limit: int) -> list:
+        """Возвращает идентификаторы продуктов, найденных по запросу."""
+        tokens = self.get_tokens(query)
+        if not tokens:
+            return []
+        title_condition = Q()
+        for token in tokens:
+            title_condition &= Q(**{SearchCfg.TITLE_LOOKUP: token})
+        title_match = Case(
+            When(title_condition, then=Value(True)), default=Value(False)
+        )
+        product_ids = (
+            self.get_queryset(query)
+            .annotate(**{SearchCfg.TITLE_MATCH: title_match})
+            .order_by(*SearchCfg.DATABASE_ORDER)
+            .values_list(SearchCfg.ROW_FIELDS[0], flat=True)
+        )
+        return list(product_ids[offset:][:limit])
+
+
+class SQLiteFTS5Backend(BaseSearchBackend):
+    """
+    Поиск продуктов по индексу SQLite FTS5.
+
+    Индекс хранится в виртуальной таблице той же базы данных, rowid
+    которой совпадает с идентификатором продукта, поэтому изменения индекса
+    выполняются в транзакции сохранения продукта. Каждое слово запроса
+    ищется как префикс, результаты ранжируются функцией bm25 с большим
+    весом наименования.
+    """
+
+    table = SearchCfg.FTS5_TABLE
+
+    def setup(self, using: str) -> bool:
+        """Создаёт виртуальную таблицу FTS5, если её ещё нет."""
+        with connections[using].cursor() as cursor:
+            cursor.execute(SearchCfg.FTS5_TABLE_EXISTS, [self.table])
+            if cursor.fetchone() is not None:
+                return False
+            cursor.execute(
+                SearchCfg.FTS5_CREATE_TABLE.format(
+                    table=self.table, tokenizer=SearchCfg.FTS5_TOKENIZER
+                )
+            )
+        return True
+
+    @staticmethod
+    def get_connection(write: bool = False):
+        """
+        Возвращает подключение к базе данных с таблицей продуктов.
+
+        Параметры:
+            write (bool): True, если подключение нужно для записи.
+
+        Возвращает:
+            BaseDatabaseWrapper: Подключение к базе данных.
+        """
+        if write:
+            return connections[router.db_for_write(Product)]
+        return connections[router.db_for_read(Product)]
+
+    def get_match(self, query: str) -> str:
+        """
+        Возвращает выражение MATCH для поискового запроса.
+
+        Слова заключаются в кавычки, поэтому синтаксис FTS5 во вводе
+        пользователя не интерпретируется.
+
+        Параметры:
+            query (str): Поисковый запрос.
+
+        Возвращает:
+            str: Выражение MATCH или пустая строка, если слов нет.
+        """
+        return SearchCfg.FTS5_AND.join(
+            SearchCfg.FTS5_TERM.format(token=token)
+            for token in self.get_tokens(query)
+        )
+
+    def index(self, rows: list) -> None:
+        """Добавляет или обновляет продукты в индексе."""
+        if not rows:
+            return
+        self.remove([row[0] for row in rows])
+        with self.get_connection(write=True).cursor() as cursor:
+            cursor.executemany(
+                SearchCfg.FTS5_INSERT.format(table=self.table),
+                [
+                    (pk, title, description or "")
+                    for pk, title, description in rows
+                ],
+            )
+
+    def remove(self, product_ids: list) -> None:
+        """Удаляет продукты из индекса."""
+        if not product_ids:
+            return
+        with self.get_connection(write=True).cursor() as cursor:
+            cursor.execute(
+                SearchCfg.FTS5_DELETE.format(
+                    table=self.table,
+                    placeholders=", ".join(["%s"] * len(product_ids)),
+                ),
+                product_ids,
+            )
+
+    def clear(self) -> None:
+        """Удаляет все продукты из индекса."""
+        with self.get_connection(write=True).cursor() as cursor:
+            cursor.execute(SearchCfg.FTS5_DELETE_ALL.format(table=self.table))
+
+    def count(self, query: str) -> int:
+        """Возвращает количество продуктов, найденных по запросу."""
+        match = self.get_match(query)
+        if not match:
+            return 0
+        with self.get_connection().cursor() as cursor:
+            cursor.execute(
+                SearchCfg.FTS5_COUNT.format(table=self.table), [match]
+            )
+            return cursor.fetchone()[0]
+
+    def search(self, query: str, offset: int, limit: int) -> list:
+        """Возвращает идентификаторы продуктов, найденных по запросу."""
+        match = self.get_match(query)
+        if not match:
+            return []
+        with self.get_connection().cursor() as cursor:
+            cursor.execute(
+                SearchCfg.FTS5_SEARCH.format(table=self.table),
+                [
+                    match,
+                    SearchCfg.FTS5_TITLE_WEIGHT,
+                    SearchCfg.FTS5_DESCRIPTION_WEIGHT,
+                    limit,
+                    offset,
+                ],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
+class SearchResults:
+    """
+    Ленивый список продуктов, найденных по запросу.
+
+    Поддерживает len() и срезы, поэтому разбивается на страницы
+    стандартным пагинатором: для страницы выполняется поиск в индексе и
+    один запрос продуктов по идентификаторам, порядок релевантности
+    сохраняется.
+
+    Атрибуты:
+        backend (BaseSearchBackend): Поисковый индекс.
+        query (str): Поисковый запрос.
+        queryset (QuerySet): Продукты или строки продуктов для вывода.
+    """
+
+    def __init__(
+        self, backend: BaseSearchBackend, query: str, queryset: QuerySet
+    ):
+        """Инициализирует список результатов поиска."""
+        self.backend = backend
+        self.query = query
+        self.queryset = queryset
+
+    def count(self) -> int:
+        """Возвращает количество найденных продуктов."""
+        return self.backend.count(self.query)
+
+    def __len__(self) -> int:
+        """Возвращает количество найденных продуктов."""
+        return self.count()
+
+    def __getitem__(self, index: slice) -> list:
+        """
+        Возвращает продукты среза результатов поиска.
+
+        Параметры:
+            index (slice): Срез результатов поиска.
+
+        Возвращает:
+            list: Продукты в порядке релевантности.
+        """
+        start = index.start or 0
+        product_ids = self.backend.search(
+            self.query, start, index.stop - start
+        )
+        products = {
+            product.pk: product
+            for product in self.queryset.filter(
+                **{SearchCfg.PK_IN_LOOKUP: product_ids}
+            )
+        }
+        return [products[pk] for pk in product_ids if pk in products]
+
+
+@lru_cache(maxsize=None)
+def get_search_backend() -> BaseSearchBackend:
+    """
+    Возвращает поисковый индекс, заданный настройкой PRODUCT_SEARCH_BACKEND.
+
+    Если настройка пуста, индекс выбирается по базе данных продуктов:
+    SQLiteFTS5Backend для SQLite и DatabaseSearchBackend для остальных.
+
+    Возвращает:
+        BaseSearchBackend: Поисковый индекс продуктов.
+    """
+    if settings.PRODUCT_SEARCH_BACKEND:
+        return import_string(settings.PRODUCT_SEARCH_BACKEND)()
+    connection = connections[router.db_for_write(Product)]
+    if connection.vendor == DatabaseCfg.SQLITE_VENDOR:
+        return SQLiteFTS5Backend()
+    return DatabaseSearchBackend()
+
+
+def rebuild_search_index(backend: BaseSearchBackend = None) -> int:
+    """
+    Заполняет поисковый индекс всеми продуктами заново.
+
+    Продукты читаются и добавляются в индекс пачками, поэтому расход памяти
+    не зависит от размера каталога.
+
+    Параметры:
+        backend (BaseSearchBackend): Поисковый индекс, по умолчанию
+    возвращаемый get_search_backend.
+
+    Возвращает:
+        int: Количество проиндексированных продуктов.
+    """
+    backend = backend or get_search_backend()
+    rows = Product.objects.order_by(SearchCfg.ROW_FIELDS[0]).values_list(
+        *SearchCfg.ROW_FIELDS
+    )
+    count = 0
+    with transaction.atomic():
+        backend.clear()
+        batch = []
+        for row in rows.iterator(chunk_size=SearchCfg.REBUILD_BATCH_SIZE):
+            batch.append(row)
+            if len(batch) == SearchCfg.REBUILD_BATCH_SIZE:
+                backend.index(batch)
+                count += len(batch)
+                batch = []
+        backend.index(batch)
+        count += len(batch)
+    return count
+
+
+def get_search_row(product: Product) -> tuple:
+    """
+    Возвращает строку поискового индекса для продукта.
+
+    Параметры:
+        product (Product): Экземпляр модели Product.
+
+    Возвращает:
+        tuple: Кортеж (pk, title, description).
+    """
+    return product.pk, product.title, product.description
@@ -1,9 +1,30 @@
 """Модуль для обработки сигналов приложения store."""
 
-from django.db.models.signals import pre_save
+from functools import partial
+
+from core.constants import ProductCfg, SearchCfg
+from django.db import router, transaction
+from django.db.models.signals import (
+    post_delete,
+    post_migrate,
+    post_save,
+    pre_save,
+)
 from django.dispatch import receiver
-from django.utils.text import slugify
-from store.models import BaseProductCategory, Product
+from store.cache import bump_catalog_version
+from store.models import (
+    BaseProductCategory,
+    Product,
+    ProductCategory,
+    ProductSubCategory,
+    make_slug,
+)
+from store.renditions import schedule_renditions
+from store.search import (
+    get_search_backend,
+    get_search_row,
+    rebuild_search_index,
+)
 
 
 @receiver(pre_save, sender=BaseProductCategory)
@@ -21,4 +42,118 @@ def generate_slug(sender, instance, **kwargs):
         **kwargs: Дополнительные аргументы.
     """
     if not instance.slug:
-        instance.slug = slugify(instance.title)
+        instance.slug = make_slug(instance.title)
+
+
+@receiver(post_save, sender=ProductCategory)
+@receiver(post_save, sender=ProductSubCategory)
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=ProductCategory)
+@receiver(post_delete, sender=ProductSubCategory)
+@receiver(post_delete, sender=Product)
+def invalidate_catalog_cache(sender, **kwargs):
+    """
+    Обновляет версию модели каталога после её изменения.
+
+    Версия обновляется после фиксации транзакции, чтобы закэшированный
+    ответ не мог содержать данные, которые ещё не видны другим запросам.
+
+    Параметры:
+        sender: Класс модели, отправляющий сигнал.
+        **kwargs: Дополнительные аргументы.
+    """
+    transaction.on_commit(partial(bump_catalog_version, sender))
+
+
+@receiver(pre_save, sender=Product)
+def reset_renditions(sender, instance, **kwargs):
+    """
+    Сбрасывает пути к миниатюре и превью при замене изображения продукта.
+
+    Параметры:
+        sender: Класс модели, отправляющий сигнал.
+        instance: Экземпляр модели, который будет сохранен.
+        **kwargs: Дополнительные аргументы.
+    """
+    if instance.has_image_changed():
+        for _, name_field in ProductCfg.RENDITIONS:
+            setattr(instance, name_field, "")
+
+
+@receiver(post_save, sender=Product)
+def enqueue_renditions(sender, instance, **kwargs):
+    """
+    Ставит в очередь создание миниатюры и превью продукта.
+
+    Изображения создаются фоновым пулом потоков после фиксации транзакции,
+    поэтому сохранение продукта и запросы к API не ждут обработки
+    изображений.
+
+    Параметры:
+        sender: Класс модели, отправляющий сигнал.
+        instance: Экземпляр модели, который был сохранен.
+        **kwargs: Дополнительные аргументы.
+    """
+    if instance.needs_renditions():
+        transaction.on_commit(
+            partial(schedule_renditions, instance.pk, instance.image.name)
+        )
+    if ProductCfg.IMAGE not in instance.get_deferred_fields():
+        instance.loaded_image_name = instance.image.name
+
+
+@receiver(post_save, sender=Product)
+def update_search_index(sender, instance, update_fields=None, **kwargs):
+    """
+    Обновляет продукт в поисковом индексе.
+
+    Индекс обновляется, только если могли измениться наименование или
+    описание продукта.
+
+    Параметры:
+        sender: Класс модели, отправляющий сигнал.
+        instance: Экземпляр модели, который был сохранен.
+        update_fields: Поля, переданные в save(update_fields=...).
+        **kwargs: Дополнительные аргументы.
+    """
+    if update_fields is not None and not set(SearchCfg.FIELDS) & set(
+        update_fields
+    ):
+        return
+    get_search_backend().index([get_search_row(instance)])
+
+
+@receiver(post_delete, sender=Product)
+def remove_from_search_index(sender, instance, **kwargs):
+    """
+    Удаляет продукт из поискового индекса.
+
+    Параметры:
+        sender: Класс модели, отправляющий сигнал.
+        instance: Экземпляр модели, который был удален.
+        **kwargs: Дополнительные аргументы.
+    """
+    get_search_backend().remove([instance.pk])
+
+
+@receiver(post_migrate)
+def setup_search_index(sender, using, **kwargs):
+    """
+    Создаёт поисковый индекс после миграций приложения store.
+
+    Если хранилище индекса было создано заново, в него добавляются все
+    существующие продукты. Реплики получают индекс вместе с остальными
+    данными основной базы данных.
+
+    Параметры:
+        sender: Конфигурация приложения, для которого выполнены миграции.
+        using: Псевдоним базы данных.
+        **kwargs: Дополнительные аргументы.
+    """
+    if sender.name != Product._meta.app_label:
+        return
+    if using != router.db_for_write(Product):
+        return
+    backend = get_search_backend()
+    if backend.setup(using):
+        rebuild_search_index(backend)
@@ -0,0 +1,98 @@
+"""Тесты объединения дубликатов элементов корзины."""
+
+from io import StringIO
+from unittest import mock
+
+from api.tests.utils import create_products, create_user
+from django.core.management import call_command
+from django.db import connection
+from django.test import TransactionTestCase
+from store.models import CartItem
+
+
+class MergeCartItemsTests(TransactionTestCase):
+    """
+    Проверяет команду merge_cart_items на базе данных с дубликатами.
+
+    Дубликаты можно создать только без ограничения уникальности, поэтому
+    тест удаляет его, как на базе данных до миграции, и создаёт заново
+    после объединения.
+    """
+
+    def setUp(self):
+        """Создаёт корзины и удаляет ограничение уникальности."""
+        self.first, self.second = create_products(2)
+        self.user, _ = create_user("buyer")
+        self.other, _ = create_user("other")
+        self.constraint = CartItem._meta.constraints[0]
+        # SQLite пересоздаёт таблицу по текущему состоянию модели, поэтому
+        # ограничение убирается и из неё.
+        with mock.patch.object(
+            CartItem._meta, "constraints", []
+        ), connection.schema_editor() as editor:
+            editor.remove_constraint(CartItem, self.constraint)
+
+    def tearDown(self):
+        """Возвращает ограничение уникальности, если тест его не вернул."""
+        if self.constraint.name not in self.get_constraints():
+            CartItem.objects.all().delete()
+            self.add_constraint()
+
+    def add_constraint(self):
+        """Создаёт ограничение уникальности (cart, product)."""
+        with connection.schema_editor() as editor:
+            editor.add_constraint(CartItem, self.constraint)
+
+    @staticmethod
+    def get_constraints() -> dict:
+        """
+        Возвращает ограничения таблицы элементов корзины.
+
+        Возвращает:
+            dict: Ограничения по именам.
+        """
+        with connection.cursor() as cursor:
+            return connection.introspection.get_constraints(
+                cursor, CartItem._meta.db_table
+            )
+
+    def test_merge_duplicates(self):
+        """Количества дубликатов суммируются, ограничение создаётся."""
+        cart, other_cart = self.user.cart, self.other.cart
+        CartItem.objects.bulk_create(
+            [
+                CartItem(cart=cart, product=self.first, quantity=1),
+                CartItem(cart=cart, product=self.first, quantity=2),
+                CartItem(cart=cart, product=self.first, quantity=4),
+                CartItem(cart=cart, product=self.second, quantity=3),
+                CartItem(cart=other_cart, product=self.first, quantity=5),
+                CartItem(cart=other_cart, product=self.first, quantity=6),
+            ]
+        )
+        kept = CartItem.objects.filter(cart=cart, product=self.first).first()
+        stdout = StringIO()
+        call_command("merge_cart_items", stdout=stdout)
+        self.assertIn("3", stdout.getvalue())
+        self.assertEqual(
+            sorted(
+                CartItem.objects.values_list(
+                    "cart__user__username", "product", "quantity"
+                )
+            ),
+            [
+                ("buyer", self.first.pk, 7),
+                ("buyer", self.second.pk, 3),
+                ("other", self.first.pk, 11),
+            ],
+        )
+        self.assertTrue(CartItem.objects.filter(pk=kept.pk).exists())
+        self.add_constraint()
+        self.assertIn(self.constraint.name, self.get_constraints())
+
+    def test_no_duplicates(self):
+        """Без дубликатов корзина не меняется."""
+        CartItem.objects.create(
+            cart=self.user.cart, product=self.first, quantity=2
+        )
+        self.assertEqual(CartItem.objects.merge_duplicates(), 0)
+        self.assertEqual(CartItem.objects.get().quantity, 2)
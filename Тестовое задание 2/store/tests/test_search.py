@@ -0,0 +1,40 @@
+"""Тесты поиска продуктов."""
+
+from unittest import mock
+
+from django.db import connections
+from django.test import SimpleTestCase, override_settings
+from store.search import (
+    DatabaseSearchBackend,
+    SQLiteFTS5Backend,
+    get_search_backend,
+)
+
+
+class GetSearchBackendTests(SimpleTestCase):
+    """Проверяет выбор поискового индекса."""
+
+    def setUp(self):
+        """Сбрасывает выбранный поисковый индекс до и после теста."""
+        get_search_backend.cache_clear()
+        self.addCleanup(get_search_backend.cache_clear)
+
+    @override_settings(PRODUCT_SEARCH_BACKEND="")
+    def test_default_by_vendor(self):
+        """Без настройки индекс выбирается по базе данных."""
+        for vendor, backend_class in (
+            ("sqlite", SQLiteFTS5Backend),
+            ("postgresql", DatabaseSearchBackend),
+        ):
+            with self.subTest(vendor=vendor), mock.patch.object(
+                connections["default"], "vendor", vendor
+            ):
+                get_search_backend.cache_clear()
+                self.assertIsInstance(get_search_backend(), backend_class)
+
+    @override_settings(
+        PRODUCT_SEARCH_BACKEND="store.search.DatabaseSearchBackend"
+    )
+    def test_setting(self):
+        """Настройка PRODUCT_SEARCH_BACKEND имеет приоритет."""
+        self.assertIsInstance(get_search_backend(), DatabaseSearchBackend)